@@ -0,0 +1,41 @@
+"""Level format converter."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.config import Config
+from src.levelformat import LEVEL_BINARY_SUFFIX, binary_to_csv, csv_to_binary
+from src.utils.utils import setup_logging
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Convert a level between CSV and binary. A CSV level's track layout"
+            " (name.tracks.csv) is packed into the binary level and unpacked from it."
+        ),
+    )
+    parser.add_argument("source", type=Path, help="Level .csv or .tylv file.")
+    parser.add_argument(
+        "destination",
+        type=Path,
+        nargs="?",
+        help="Output file. Defaults to the source with the other suffix.",
+    )
+    args = parser.parse_args()
+
+    if args.source.suffix == LEVEL_BINARY_SUFFIX:
+        destination = args.destination or args.source.with_suffix(".csv")
+        binary_to_csv(args.source, destination)
+    else:
+        destination = args.destination or args.source.with_suffix(LEVEL_BINARY_SUFFIX)
+        csv_to_binary(args.source, destination)
+    logger.info(f"Converted '{args.source}' to '{destination}'")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
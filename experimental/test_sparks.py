@@ -1,11 +1,11 @@
-import math
 import random
 import sys
 
+import numpy as np
 import pygame as pg
 from pygame.locals import K_ESCAPE, KEYDOWN, QUIT
 
-from src.gfx.spark import Spark
+from src.gfx.spark import SparkSystem
 
 clock = pg.time.Clock()
 
@@ -13,7 +13,7 @@ pg.init()
 pg.display.set_caption("game base")
 screen_surface = pg.display.set_mode((500, 500), 0, 32)
 
-sparks = []
+sparks = SparkSystem()
 
 collide_rects = [
     #    pg.Rect(100, 100, 100, 100),
@@ -26,11 +26,8 @@ iteration = 0
 while True:
     screen_surface.fill((0, 0, 0))
 
-    for i, spark in sorted(enumerate(sparks), reverse=True):
-        spark.move(1, allowed_area, collide_rects)
-        spark.draw(screen_surface)
-        if not spark.alive:
-            sparks.pop(i)
+    sparks.update(1, allowed_area, collide_rects)
+    sparks.draw(screen_surface)
 
     mx, my = pg.mouse.get_pos()
 
@@ -43,26 +40,25 @@ while True:
     ]
 
     if iteration < 1:
-        for i in range(100):
-            sparks.append(
-                Spark(
-                    loc=(
-                        mx + random.randint(0, 20) - 10,
-                        my + random.randint(0, 20) - 10,
-                    ),
-                    angle=math.radians(random.randint(0, 360)),
-                    # speed=random.uniform(1, 10),
-                    base_speed=random.choices(
-                        [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-                        [0.2, 0.2, 0.2, 0.2, 0.1, 0.05, 0.02, 0.01, 0.01, 0.01],
-                    )[0],
-                    # friction=0.2,
-                    friction=random.uniform(0.15, 0.25),
-                    color=random.sample(spark_colors, 1)[0],
-                    scale=1.0,
-                    speed_multiplier=1.0,
+        sparks.emit(
+            loc_x=np.array([mx + random.randint(0, 20) - 10 for _ in range(100)]),
+            loc_y=np.array([my + random.randint(0, 20) - 10 for _ in range(100)]),
+            angle=np.radians([random.randint(0, 360) for _ in range(100)]),
+            # speed=random.uniform(1, 10),
+            base_speed=np.array(
+                random.choices(
+                    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+                    [0.2, 0.2, 0.2, 0.2, 0.1, 0.05, 0.02, 0.01, 0.01, 0.01],
+                    k=100,
                 ),
-            )
+                dtype=np.float64,
+            ),
+            # friction=0.2,
+            friction=np.array([random.uniform(0.15, 0.25) for _ in range(100)]),
+            color=np.array(random.choices(spark_colors, k=100), dtype=np.uint8),
+            scale=1.0,
+            speed_multiplier=1.0,
+        )
 
     iteration += 1
     if iteration % 50 == 0:
@@ -1,17 +1,49 @@
 """Entry point."""
 
+import argparse
+from pathlib import Path
+
 import pygame as pg
 
 from src.config import Config
+from src.utils.startup import StartupTimer
+from src.utils.tracing import Trace
 from src.utils.utils import setup_logging
 
 logger = setup_logging(log_level=Config.LOG_LEVEL)
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Play locomotive.")
+    parser.add_argument(
+        "--startup-trace",
+        type=Path,
+        nargs="?",
+        const=Path("tmp/startup_trace.json"),
+        default=None,
+        help="Write per-module import and per-phase startup times to this JSON file.",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        nargs="?",
+        const=Path(Config.TRACE_PATH),
+        default=None,
+        help="Record a timeline of frames, systems and loads, written to this Chrome"
+        " Trace Event file on F4 and on exit.",
+    )
+    args = parser.parse_args()
+    if args.startup_trace is not None:
+        StartupTimer.start_trace(args.startup_trace)
+    if args.trace is not None or Config.TRACE_EVENTS:
+        Trace.enable(args.trace)
+
     _, _ = pg.init()
+    StartupTimer.mark("pygame initialized")
     from src.game_loop import GameLoop
 
+    StartupTimer.mark("modules imported")
+
     game_loop = GameLoop()
     game_loop.loop()
 
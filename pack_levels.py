@@ -0,0 +1,52 @@
+"""Level pack builder."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.config import Config
+from src.levelpack import LevelPack, pack_level_files
+from src.simulation.validation import find_level_files
+from src.utils.utils import setup_logging
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Pack levels into a single level pack, in the order given. Each level is"
+            " named after its file, e.g. level_0.csv becomes 'Level 0'."
+        ),
+    )
+    parser.add_argument(
+        "sources",
+        type=Path,
+        nargs="+",
+        help="Level .csv or .tylv files, or directories of them.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path(Config.LEVEL_PACK),
+        help="Where to write the level pack.",
+    )
+    args = parser.parse_args()
+
+    level_paths: list[Path] = []
+    for source in args.sources:
+        level_paths.extend(find_level_files(source) if source.is_dir() else [source])
+    if not level_paths:
+        logger.error("No level files to pack")
+        return 1
+    pack_level_files(level_paths, args.output)
+
+    level_pack = LevelPack(args.output)
+    logger.info(f"Packed {len(level_pack)} levels into '{args.output}'")
+    level_pack.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
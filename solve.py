@@ -0,0 +1,65 @@
+"""Level solver."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.config import Config
+from src.gfx.graphics import Graphics
+from src.levelformat import track_layout_path, write_track_layout
+from src.simulation.solver import DEFAULT_BUDGET, solve_level
+from src.utils.utils import setup_logging
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Search for a track layout that completes a level.",
+    )
+    parser.add_argument("level", type=Path, help="Level .csv file.")
+    parser.add_argument(
+        "-b",
+        "--budget",
+        type=int,
+        default=DEFAULT_BUDGET,
+        help="Maximum number of layouts to simulate.",
+    )
+    parser.add_argument(
+        "-j",
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to one per core.",
+    )
+    args = parser.parse_args()
+
+    logger.setLevel("WARNING")
+    Graphics.load_resources()
+    result = solve_level(str(args.level), args.budget, args.processes)
+    logger.setLevel(Config.LOG_LEVEL)
+
+    if result.solved and result.layout is not None:
+        layout_path = track_layout_path(args.level)
+        write_track_layout(layout_path, result.layout)
+        logger.info(
+            f"Solved '{args.level}' with {len(result.layout)} tracks after"
+            f" {result.simulations} simulations in {result.seconds:.2f} s."
+            f" Layout written to '{layout_path}'",
+        )
+        return 0
+    if result.exhausted:
+        logger.info(
+            f"'{args.level}' has no solution this solver can find. Searched"
+            f" {result.simulations} layouts in {result.seconds:.2f} s.",
+        )
+    else:
+        logger.info(
+            f"No solution for '{args.level}' within {result.simulations}"
+            f" simulations ({result.seconds:.2f} s).",
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Assets.
+
+Assets are registered with a loader and loaded on first use. `Assets.preload()` then
+loads everything that has not been used yet on a background thread, so startup only
+waits for what the first frame actually draws. Every load is timed for the startup
+report.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeVar, cast
+
+from src.config import Config
+from src.utils.tracing import Trace
+from src.utils.utils import setup_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+T = TypeVar("T")
+
+
+@dataclass
+class AssetLoad:
+    name: str
+    seconds: float
+    thread: str
+
+
+class Assets:
+    loaders: ClassVar[dict[str, Callable[[], object]]] = {}
+    futures: ClassVar[dict[str, Future[object]]] = {}
+    loads: ClassVar[list[AssetLoad]] = []
+    lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def register(name: str, loader: Callable[[], object]) -> None:
+        """Register `loader` for `name`, dropping anything loaded for it before."""
+        with Assets.lock:
+            Assets.loaders[name] = loader
+            Assets.futures.pop(name, None)
+
+    @staticmethod
+    def get(name: str) -> object:
+        """Return the asset, loading it now unless another thread already is."""
+        with Assets.lock:
+            future = Assets.futures.get(name)
+            must_load = future is None
+            if future is None:
+                future = Future()
+                Assets.futures[name] = future
+        if must_load:
+            Assets.load(name, future)
+        return future.result()
+
+    @staticmethod
+    def load(name: str, future: Future[object]) -> None:
+        start_time = time.perf_counter()
+        try:
+            with Trace.span(name, "asset"):
+                future.set_result(Assets.loaders[name]())
+        except Exception as error:  # noqa: BLE001 - Raised again to whoever uses it.
+            future.set_exception(error)
+        Assets.loads.append(
+            AssetLoad(
+                name=name,
+                seconds=time.perf_counter() - start_time,
+                thread=threading.current_thread().name,
+            ),
+        )
+
+    @staticmethod
+    def preload() -> threading.Thread:
+        thread = threading.Thread(
+            target=Assets.load_all,
+            name="asset-preloader",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    @staticmethod
+    def load_all() -> None:
+        start_time = time.perf_counter()
+        for name in list(Assets.loaders):
+            try:
+                Assets.get(name)
+            except Exception:
+                logger.exception(f"Failed to preload asset '{name}'")
+        logger.info(
+            f"Preloaded remaining assets in"
+            f" {(time.perf_counter() - start_time) * 1000:.1f} ms",
+        )
+
+
+class LazyAsset(Generic[T]):
+    # A class attribute whose value is loaded through Assets on first access, e.g.
+    # `crash = LazyAsset(partial(load_sound, "Modern9.ogg", 0.1))` on Sound. The
+    # loaded value then replaces the descriptor on the class, so later reads are plain
+    # attribute lookups that never take the lock.
+    def __init__(self, loader: Callable[[], T]) -> None:
+        self.loader = loader
+        self.attribute = ""
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Register the loader under the owner's and the attribute's name."""
+        self.attribute = name
+        self.name = f"{owner.__name__}.{name}"
+        Assets.register(self.name, self.loader)
+
+    def __get__(self, instance: object, owner: type) -> T:
+        """Load the asset, and put it on the class in place of this descriptor."""
+        value = cast("T", Assets.get(self.name))
+        setattr(owner, self.attribute, value)
+        return value
@@ -1,6 +1,7 @@
 """Color constants."""
 
 from collections import OrderedDict, namedtuple
+from functools import cache
 
 Color = namedtuple("RGB", "red, green, blue")
 
@@ -572,562 +573,22 @@ YELLOW2 = RGB(238, 238, 0)
 YELLOW3 = RGB(205, 205, 0)
 YELLOW4 = RGB(139, 139, 0)
 
-colors = {}
 
-# Add colors to colors dictionary
-colors["aliceblue"] = ALICEBLUE
-colors["antiquewhite"] = ANTIQUEWHITE
-colors["antiquewhite1"] = ANTIQUEWHITE1
-colors["antiquewhite2"] = ANTIQUEWHITE2
-colors["antiquewhite3"] = ANTIQUEWHITE3
-colors["antiquewhite4"] = ANTIQUEWHITE4
-colors["aqua"] = AQUA
-colors["aquamarine1"] = AQUAMARINE1
-colors["aquamarine2"] = AQUAMARINE2
-colors["aquamarine3"] = AQUAMARINE3
-colors["aquamarine4"] = AQUAMARINE4
-colors["azure1"] = AZURE1
-colors["azure2"] = AZURE2
-colors["azure3"] = AZURE3
-colors["azure4"] = AZURE4
-colors["banana"] = BANANA
-colors["beige"] = BEIGE
-colors["bisque1"] = BISQUE1
-colors["bisque2"] = BISQUE2
-colors["bisque3"] = BISQUE3
-colors["bisque4"] = BISQUE4
-colors["black"] = BLACK
-colors["blanchedalmond"] = BLANCHEDALMOND
-colors["blue"] = BLUE
-colors["blue2"] = BLUE2
-colors["blue3"] = BLUE3
-colors["blue4"] = BLUE4
-colors["blueviolet"] = BLUEVIOLET
-colors["brick"] = BRICK
-colors["brown"] = BROWN
-colors["brown1"] = BROWN1
-colors["brown2"] = BROWN2
-colors["brown3"] = BROWN3
-colors["brown4"] = BROWN4
-colors["burlywood"] = BURLYWOOD
-colors["burlywood1"] = BURLYWOOD1
-colors["burlywood2"] = BURLYWOOD2
-colors["burlywood3"] = BURLYWOOD3
-colors["burlywood4"] = BURLYWOOD4
-colors["burntsienna"] = BURNTSIENNA
-colors["burntumber"] = BURNTUMBER
-colors["cadetblue"] = CADETBLUE
-colors["cadetblue1"] = CADETBLUE1
-colors["cadetblue2"] = CADETBLUE2
-colors["cadetblue3"] = CADETBLUE3
-colors["cadetblue4"] = CADETBLUE4
-colors["cadmiumorange"] = CADMIUMORANGE
-colors["cadmiumyellow"] = CADMIUMYELLOW
-colors["carrot"] = CARROT
-colors["chartreuse1"] = CHARTREUSE1
-colors["chartreuse2"] = CHARTREUSE2
-colors["chartreuse3"] = CHARTREUSE3
-colors["chartreuse4"] = CHARTREUSE4
-colors["chocolate"] = CHOCOLATE
-colors["chocolate1"] = CHOCOLATE1
-colors["chocolate2"] = CHOCOLATE2
-colors["chocolate3"] = CHOCOLATE3
-colors["chocolate4"] = CHOCOLATE4
-colors["cobalt"] = COBALT
-colors["cobaltgreen"] = COBALTGREEN
-colors["coldgrey"] = COLDGREY
-colors["coral"] = CORAL
-colors["coral1"] = CORAL1
-colors["coral2"] = CORAL2
-colors["coral3"] = CORAL3
-colors["coral4"] = CORAL4
-colors["cornflowerblue"] = CORNFLOWERBLUE
-colors["cornsilk1"] = CORNSILK1
-colors["cornsilk2"] = CORNSILK2
-colors["cornsilk3"] = CORNSILK3
-colors["cornsilk4"] = CORNSILK4
-colors["crimson"] = CRIMSON
-colors["cyan2"] = CYAN2
-colors["cyan3"] = CYAN3
-colors["cyan4"] = CYAN4
-colors["darkgoldenrod"] = DARKGOLDENROD
-colors["darkgoldenrod1"] = DARKGOLDENROD1
-colors["darkgoldenrod2"] = DARKGOLDENROD2
-colors["darkgoldenrod3"] = DARKGOLDENROD3
-colors["darkgoldenrod4"] = DARKGOLDENROD4
-colors["darkgray"] = DARKGRAY
-colors["darkgreen"] = DARKGREEN
-colors["darkkhaki"] = DARKKHAKI
-colors["darkolivegreen"] = DARKOLIVEGREEN
-colors["darkolivegreen1"] = DARKOLIVEGREEN1
-colors["darkolivegreen2"] = DARKOLIVEGREEN2
-colors["darkolivegreen3"] = DARKOLIVEGREEN3
-colors["darkolivegreen4"] = DARKOLIVEGREEN4
-colors["darkorange"] = DARKORANGE
-colors["darkorange1"] = DARKORANGE1
-colors["darkorange2"] = DARKORANGE2
-colors["darkorange3"] = DARKORANGE3
-colors["darkorange4"] = DARKORANGE4
-colors["darkorchid"] = DARKORCHID
-colors["darkorchid1"] = DARKORCHID1
-colors["darkorchid2"] = DARKORCHID2
-colors["darkorchid3"] = DARKORCHID3
-colors["darkorchid4"] = DARKORCHID4
-colors["darksalmon"] = DARKSALMON
-colors["darkseagreen"] = DARKSEAGREEN
-colors["darkseagreen1"] = DARKSEAGREEN1
-colors["darkseagreen2"] = DARKSEAGREEN2
-colors["darkseagreen3"] = DARKSEAGREEN3
-colors["darkseagreen4"] = DARKSEAGREEN4
-colors["darkslateblue"] = DARKSLATEBLUE
-colors["darkslategray"] = DARKSLATEGRAY
-colors["darkslategray1"] = DARKSLATEGRAY1
-colors["darkslategray2"] = DARKSLATEGRAY2
-colors["darkslategray3"] = DARKSLATEGRAY3
-colors["darkslategray4"] = DARKSLATEGRAY4
-colors["darkturquoise"] = DARKTURQUOISE
-colors["darkviolet"] = DARKVIOLET
-colors["deeppink1"] = DEEPPINK1
-colors["deeppink2"] = DEEPPINK2
-colors["deeppink3"] = DEEPPINK3
-colors["deeppink4"] = DEEPPINK4
-colors["deepskyblue1"] = DEEPSKYBLUE1
-colors["deepskyblue2"] = DEEPSKYBLUE2
-colors["deepskyblue3"] = DEEPSKYBLUE3
-colors["deepskyblue4"] = DEEPSKYBLUE4
-colors["dimgray"] = DIMGRAY
-colors["dimgray"] = DIMGRAY
-colors["dodgerblue1"] = DODGERBLUE1
-colors["dodgerblue2"] = DODGERBLUE2
-colors["dodgerblue3"] = DODGERBLUE3
-colors["dodgerblue4"] = DODGERBLUE4
-colors["eggshell"] = EGGSHELL
-colors["emeraldgreen"] = EMERALDGREEN
-colors["firebrick"] = FIREBRICK
-colors["firebrick1"] = FIREBRICK1
-colors["firebrick2"] = FIREBRICK2
-colors["firebrick3"] = FIREBRICK3
-colors["firebrick4"] = FIREBRICK4
-colors["flesh"] = FLESH
-colors["floralwhite"] = FLORALWHITE
-colors["forestgreen"] = FORESTGREEN
-colors["gainsboro"] = GAINSBORO
-colors["ghostwhite"] = GHOSTWHITE
-colors["gold1"] = GOLD1
-colors["gold2"] = GOLD2
-colors["gold3"] = GOLD3
-colors["gold4"] = GOLD4
-colors["goldenrod"] = GOLDENROD
-colors["goldenrod1"] = GOLDENROD1
-colors["goldenrod2"] = GOLDENROD2
-colors["goldenrod3"] = GOLDENROD3
-colors["goldenrod4"] = GOLDENROD4
-colors["gray"] = GRAY
-colors["gray1"] = GRAY1
-colors["gray10"] = GRAY10
-colors["gray11"] = GRAY11
-colors["gray12"] = GRAY12
-colors["gray13"] = GRAY13
-colors["gray14"] = GRAY14
-colors["gray15"] = GRAY15
-colors["gray16"] = GRAY16
-colors["gray17"] = GRAY17
-colors["gray18"] = GRAY18
-colors["gray19"] = GRAY19
-colors["gray2"] = GRAY2
-colors["gray20"] = GRAY20
-colors["gray21"] = GRAY21
-colors["gray22"] = GRAY22
-colors["gray23"] = GRAY23
-colors["gray24"] = GRAY24
-colors["gray25"] = GRAY25
-colors["gray26"] = GRAY26
-colors["gray27"] = GRAY27
-colors["gray28"] = GRAY28
-colors["gray29"] = GRAY29
-colors["gray3"] = GRAY3
-colors["gray30"] = GRAY30
-colors["gray31"] = GRAY31
-colors["gray32"] = GRAY32
-colors["gray33"] = GRAY33
-colors["gray34"] = GRAY34
-colors["gray35"] = GRAY35
-colors["gray36"] = GRAY36
-colors["gray37"] = GRAY37
-colors["gray38"] = GRAY38
-colors["gray39"] = GRAY39
-colors["gray4"] = GRAY4
-colors["gray40"] = GRAY40
-colors["gray42"] = GRAY42
-colors["gray43"] = GRAY43
-colors["gray44"] = GRAY44
-colors["gray45"] = GRAY45
-colors["gray46"] = GRAY46
-colors["gray47"] = GRAY47
-colors["gray48"] = GRAY48
-colors["gray49"] = GRAY49
-colors["gray5"] = GRAY5
-colors["gray50"] = GRAY50
-colors["gray51"] = GRAY51
-colors["gray52"] = GRAY52
-colors["gray53"] = GRAY53
-colors["gray54"] = GRAY54
-colors["gray55"] = GRAY55
-colors["gray56"] = GRAY56
-colors["gray57"] = GRAY57
-colors["gray58"] = GRAY58
-colors["gray59"] = GRAY59
-colors["gray6"] = GRAY6
-colors["gray60"] = GRAY60
-colors["gray61"] = GRAY61
-colors["gray62"] = GRAY62
-colors["gray63"] = GRAY63
-colors["gray64"] = GRAY64
-colors["gray65"] = GRAY65
-colors["gray66"] = GRAY66
-colors["gray67"] = GRAY67
-colors["gray68"] = GRAY68
-colors["gray69"] = GRAY69
-colors["gray7"] = GRAY7
-colors["gray70"] = GRAY70
-colors["gray71"] = GRAY71
-colors["gray72"] = GRAY72
-colors["gray73"] = GRAY73
-colors["gray74"] = GRAY74
-colors["gray75"] = GRAY75
-colors["gray76"] = GRAY76
-colors["gray77"] = GRAY77
-colors["gray78"] = GRAY78
-colors["gray79"] = GRAY79
-colors["gray8"] = GRAY8
-colors["gray80"] = GRAY80
-colors["gray81"] = GRAY81
-colors["gray82"] = GRAY82
-colors["gray83"] = GRAY83
-colors["gray84"] = GRAY84
-colors["gray85"] = GRAY85
-colors["gray86"] = GRAY86
-colors["gray87"] = GRAY87
-colors["gray88"] = GRAY88
-colors["gray89"] = GRAY89
-colors["gray9"] = GRAY9
-colors["gray90"] = GRAY90
-colors["gray91"] = GRAY91
-colors["gray92"] = GRAY92
-colors["gray93"] = GRAY93
-colors["gray94"] = GRAY94
-colors["gray95"] = GRAY95
-colors["gray97"] = GRAY97
-colors["gray98"] = GRAY98
-colors["gray99"] = GRAY99
-colors["green"] = GREEN
-colors["green1"] = GREEN1
-colors["green2"] = GREEN2
-colors["green3"] = GREEN3
-colors["green4"] = GREEN4
-colors["greenyellow"] = GREENYELLOW
-colors["honeydew1"] = HONEYDEW1
-colors["honeydew2"] = HONEYDEW2
-colors["honeydew3"] = HONEYDEW3
-colors["honeydew4"] = HONEYDEW4
-colors["hotpink"] = HOTPINK
-colors["hotpink1"] = HOTPINK1
-colors["hotpink2"] = HOTPINK2
-colors["hotpink3"] = HOTPINK3
-colors["hotpink4"] = HOTPINK4
-colors["indianred"] = INDIANRED
-colors["indianred"] = INDIANRED
-colors["indianred1"] = INDIANRED1
-colors["indianred2"] = INDIANRED2
-colors["indianred3"] = INDIANRED3
-colors["indianred4"] = INDIANRED4
-colors["indigo"] = INDIGO
-colors["ivory1"] = IVORY1
-colors["ivory2"] = IVORY2
-colors["ivory3"] = IVORY3
-colors["ivory4"] = IVORY4
-colors["ivoryblack"] = IVORYBLACK
-colors["khaki"] = KHAKI
-colors["khaki1"] = KHAKI1
-colors["khaki2"] = KHAKI2
-colors["khaki3"] = KHAKI3
-colors["khaki4"] = KHAKI4
-colors["lavender"] = LAVENDER
-colors["lavenderblush1"] = LAVENDERBLUSH1
-colors["lavenderblush2"] = LAVENDERBLUSH2
-colors["lavenderblush3"] = LAVENDERBLUSH3
-colors["lavenderblush4"] = LAVENDERBLUSH4
-colors["lawngreen"] = LAWNGREEN
-colors["lemonchiffon1"] = LEMONCHIFFON1
-colors["lemonchiffon2"] = LEMONCHIFFON2
-colors["lemonchiffon3"] = LEMONCHIFFON3
-colors["lemonchiffon4"] = LEMONCHIFFON4
-colors["lightblue"] = LIGHTBLUE
-colors["lightblue1"] = LIGHTBLUE1
-colors["lightblue2"] = LIGHTBLUE2
-colors["lightblue3"] = LIGHTBLUE3
-colors["lightblue4"] = LIGHTBLUE4
-colors["lightcoral"] = LIGHTCORAL
-colors["lightcyan1"] = LIGHTCYAN1
-colors["lightcyan2"] = LIGHTCYAN2
-colors["lightcyan3"] = LIGHTCYAN3
-colors["lightcyan4"] = LIGHTCYAN4
-colors["lightgoldenrod1"] = LIGHTGOLDENROD1
-colors["lightgoldenrod2"] = LIGHTGOLDENROD2
-colors["lightgoldenrod3"] = LIGHTGOLDENROD3
-colors["lightgoldenrod4"] = LIGHTGOLDENROD4
-colors["lightgoldenrodyellow"] = LIGHTGOLDENRODYELLOW
-colors["lightgrey"] = LIGHTGREY
-colors["lightpink"] = LIGHTPINK
-colors["lightpink1"] = LIGHTPINK1
-colors["lightpink2"] = LIGHTPINK2
-colors["lightpink3"] = LIGHTPINK3
-colors["lightpink4"] = LIGHTPINK4
-colors["lightsalmon1"] = LIGHTSALMON1
-colors["lightsalmon2"] = LIGHTSALMON2
-colors["lightsalmon3"] = LIGHTSALMON3
-colors["lightsalmon4"] = LIGHTSALMON4
-colors["lightseagreen"] = LIGHTSEAGREEN
-colors["lightskyblue"] = LIGHTSKYBLUE
-colors["lightskyblue1"] = LIGHTSKYBLUE1
-colors["lightskyblue2"] = LIGHTSKYBLUE2
-colors["lightskyblue3"] = LIGHTSKYBLUE3
-colors["lightskyblue4"] = LIGHTSKYBLUE4
-colors["lightslateblue"] = LIGHTSLATEBLUE
-colors["lightslategray"] = LIGHTSLATEGRAY
-colors["lightsteelblue"] = LIGHTSTEELBLUE
-colors["lightsteelblue1"] = LIGHTSTEELBLUE1
-colors["lightsteelblue2"] = LIGHTSTEELBLUE2
-colors["lightsteelblue3"] = LIGHTSTEELBLUE3
-colors["lightsteelblue4"] = LIGHTSTEELBLUE4
-colors["lightyellow1"] = LIGHTYELLOW1
-colors["lightyellow2"] = LIGHTYELLOW2
-colors["lightyellow3"] = LIGHTYELLOW3
-colors["lightyellow4"] = LIGHTYELLOW4
-colors["limegreen"] = LIMEGREEN
-colors["linen"] = LINEN
-colors["magenta"] = MAGENTA
-colors["magenta2"] = MAGENTA2
-colors["magenta3"] = MAGENTA3
-colors["magenta4"] = MAGENTA4
-colors["manganeseblue"] = MANGANESEBLUE
-colors["maroon"] = MAROON
-colors["maroon1"] = MAROON1
-colors["maroon2"] = MAROON2
-colors["maroon3"] = MAROON3
-colors["maroon4"] = MAROON4
-colors["mediumorchid"] = MEDIUMORCHID
-colors["mediumorchid1"] = MEDIUMORCHID1
-colors["mediumorchid2"] = MEDIUMORCHID2
-colors["mediumorchid3"] = MEDIUMORCHID3
-colors["mediumorchid4"] = MEDIUMORCHID4
-colors["mediumpurple"] = MEDIUMPURPLE
-colors["mediumpurple1"] = MEDIUMPURPLE1
-colors["mediumpurple2"] = MEDIUMPURPLE2
-colors["mediumpurple3"] = MEDIUMPURPLE3
-colors["mediumpurple4"] = MEDIUMPURPLE4
-colors["mediumseagreen"] = MEDIUMSEAGREEN
-colors["mediumslateblue"] = MEDIUMSLATEBLUE
-colors["mediumspringgreen"] = MEDIUMSPRINGGREEN
-colors["mediumturquoise"] = MEDIUMTURQUOISE
-colors["mediumvioletred"] = MEDIUMVIOLETRED
-colors["melon"] = MELON
-colors["midnightblue"] = MIDNIGHTBLUE
-colors["mint"] = MINT
-colors["mintcream"] = MINTCREAM
-colors["mistyrose1"] = MISTYROSE1
-colors["mistyrose2"] = MISTYROSE2
-colors["mistyrose3"] = MISTYROSE3
-colors["mistyrose4"] = MISTYROSE4
-colors["moccasin"] = MOCCASIN
-colors["navajowhite1"] = NAVAJOWHITE1
-colors["navajowhite2"] = NAVAJOWHITE2
-colors["navajowhite3"] = NAVAJOWHITE3
-colors["navajowhite4"] = NAVAJOWHITE4
-colors["navy"] = NAVY
-colors["oldlace"] = OLDLACE
-colors["olive"] = OLIVE
-colors["olivedrab"] = OLIVEDRAB
-colors["olivedrab1"] = OLIVEDRAB1
-colors["olivedrab2"] = OLIVEDRAB2
-colors["olivedrab3"] = OLIVEDRAB3
-colors["olivedrab4"] = OLIVEDRAB4
-colors["orange"] = ORANGE
-colors["orange1"] = ORANGE1
-colors["orange2"] = ORANGE2
-colors["orange3"] = ORANGE3
-colors["orange4"] = ORANGE4
-colors["orangered1"] = ORANGERED1
-colors["orangered2"] = ORANGERED2
-colors["orangered3"] = ORANGERED3
-colors["orangered4"] = ORANGERED4
-colors["orchid"] = ORCHID
-colors["orchid1"] = ORCHID1
-colors["orchid2"] = ORCHID2
-colors["orchid3"] = ORCHID3
-colors["orchid4"] = ORCHID4
-colors["palegoldenrod"] = PALEGOLDENROD
-colors["palegreen"] = PALEGREEN
-colors["palegreen1"] = PALEGREEN1
-colors["palegreen2"] = PALEGREEN2
-colors["palegreen3"] = PALEGREEN3
-colors["palegreen4"] = PALEGREEN4
-colors["paleturquoise1"] = PALETURQUOISE1
-colors["paleturquoise2"] = PALETURQUOISE2
-colors["paleturquoise3"] = PALETURQUOISE3
-colors["paleturquoise4"] = PALETURQUOISE4
-colors["palevioletred"] = PALEVIOLETRED
-colors["palevioletred1"] = PALEVIOLETRED1
-colors["palevioletred2"] = PALEVIOLETRED2
-colors["palevioletred3"] = PALEVIOLETRED3
-colors["palevioletred4"] = PALEVIOLETRED4
-colors["papayawhip"] = PAPAYAWHIP
-colors["peachpuff1"] = PEACHPUFF1
-colors["peachpuff2"] = PEACHPUFF2
-colors["peachpuff3"] = PEACHPUFF3
-colors["peachpuff4"] = PEACHPUFF4
-colors["peacock"] = PEACOCK
-colors["pink"] = PINK
-colors["pink1"] = PINK1
-colors["pink2"] = PINK2
-colors["pink3"] = PINK3
-colors["pink4"] = PINK4
-colors["plum"] = PLUM
-colors["plum1"] = PLUM1
-colors["plum2"] = PLUM2
-colors["plum3"] = PLUM3
-colors["plum4"] = PLUM4
-colors["powderblue"] = POWDERBLUE
-colors["purple"] = PURPLE
-colors["purple1"] = PURPLE1
-colors["purple2"] = PURPLE2
-colors["purple3"] = PURPLE3
-colors["purple4"] = PURPLE4
-colors["raspberry"] = RASPBERRY
-colors["rawsienna"] = RAWSIENNA
-colors["red1"] = RED1
-colors["red2"] = RED2
-colors["red3"] = RED3
-colors["red4"] = RED4
-colors["rosybrown"] = ROSYBROWN
-colors["rosybrown1"] = ROSYBROWN1
-colors["rosybrown2"] = ROSYBROWN2
-colors["rosybrown3"] = ROSYBROWN3
-colors["rosybrown4"] = ROSYBROWN4
-colors["royalblue"] = ROYALBLUE
-colors["royalblue1"] = ROYALBLUE1
-colors["royalblue2"] = ROYALBLUE2
-colors["royalblue3"] = ROYALBLUE3
-colors["royalblue4"] = ROYALBLUE4
-colors["salmon"] = SALMON
-colors["salmon1"] = SALMON1
-colors["salmon2"] = SALMON2
-colors["salmon3"] = SALMON3
-colors["salmon4"] = SALMON4
-colors["sandybrown"] = SANDYBROWN
-colors["sapgreen"] = SAPGREEN
-colors["seagreen1"] = SEAGREEN1
-colors["seagreen2"] = SEAGREEN2
-colors["seagreen3"] = SEAGREEN3
-colors["seagreen4"] = SEAGREEN4
-colors["seashell1"] = SEASHELL1
-colors["seashell2"] = SEASHELL2
-colors["seashell3"] = SEASHELL3
-colors["seashell4"] = SEASHELL4
-colors["sepia"] = SEPIA
-colors["sgibeet"] = SGIBEET
-colors["sgibrightgray"] = SGIBRIGHTGRAY
-colors["sgichartreuse"] = SGICHARTREUSE
-colors["sgidarkgray"] = SGIDARKGRAY
-colors["sgigray12"] = SGIGRAY12
-colors["sgigray16"] = SGIGRAY16
-colors["sgigray32"] = SGIGRAY32
-colors["sgigray36"] = SGIGRAY36
-colors["sgigray52"] = SGIGRAY52
-colors["sgigray56"] = SGIGRAY56
-colors["sgigray72"] = SGIGRAY72
-colors["sgigray76"] = SGIGRAY76
-colors["sgigray92"] = SGIGRAY92
-colors["sgigray96"] = SGIGRAY96
-colors["sgilightblue"] = SGILIGHTBLUE
-colors["sgilightgray"] = SGILIGHTGRAY
-colors["sgiolivedrab"] = SGIOLIVEDRAB
-colors["sgisalmon"] = SGISALMON
-colors["sgislateblue"] = SGISLATEBLUE
-colors["sgiteal"] = SGITEAL
-colors["sienna"] = SIENNA
-colors["sienna1"] = SIENNA1
-colors["sienna2"] = SIENNA2
-colors["sienna3"] = SIENNA3
-colors["sienna4"] = SIENNA4
-colors["silver"] = SILVER
-colors["skyblue"] = SKYBLUE
-colors["skyblue1"] = SKYBLUE1
-colors["skyblue2"] = SKYBLUE2
-colors["skyblue3"] = SKYBLUE3
-colors["skyblue4"] = SKYBLUE4
-colors["slateblue"] = SLATEBLUE
-colors["slateblue1"] = SLATEBLUE1
-colors["slateblue2"] = SLATEBLUE2
-colors["slateblue3"] = SLATEBLUE3
-colors["slateblue4"] = SLATEBLUE4
-colors["slategray"] = SLATEGRAY
-colors["slategray1"] = SLATEGRAY1
-colors["slategray2"] = SLATEGRAY2
-colors["slategray3"] = SLATEGRAY3
-colors["slategray4"] = SLATEGRAY4
-colors["snow1"] = SNOW1
-colors["snow2"] = SNOW2
-colors["snow3"] = SNOW3
-colors["snow4"] = SNOW4
-colors["springgreen"] = SPRINGGREEN
-colors["springgreen1"] = SPRINGGREEN1
-colors["springgreen2"] = SPRINGGREEN2
-colors["springgreen3"] = SPRINGGREEN3
-colors["steelblue"] = STEELBLUE
-colors["steelblue1"] = STEELBLUE1
-colors["steelblue2"] = STEELBLUE2
-colors["steelblue3"] = STEELBLUE3
-colors["steelblue4"] = STEELBLUE4
-colors["tan"] = TAN
-colors["tan1"] = TAN1
-colors["tan2"] = TAN2
-colors["tan3"] = TAN3
-colors["tan4"] = TAN4
-colors["teal"] = TEAL
-colors["thistle"] = THISTLE
-colors["thistle1"] = THISTLE1
-colors["thistle2"] = THISTLE2
-colors["thistle3"] = THISTLE3
-colors["thistle4"] = THISTLE4
-colors["tomato1"] = TOMATO1
-colors["tomato2"] = TOMATO2
-colors["tomato3"] = TOMATO3
-colors["tomato4"] = TOMATO4
-colors["turquoise"] = TURQUOISE
-colors["turquoise1"] = TURQUOISE1
-colors["turquoise2"] = TURQUOISE2
-colors["turquoise3"] = TURQUOISE3
-colors["turquoise4"] = TURQUOISE4
-colors["turquoiseblue"] = TURQUOISEBLUE
-colors["violet"] = VIOLET
-colors["violetred"] = VIOLETRED
-colors["violetred1"] = VIOLETRED1
-colors["violetred2"] = VIOLETRED2
-colors["violetred3"] = VIOLETRED3
-colors["violetred4"] = VIOLETRED4
-colors["warmgrey"] = WARMGREY
-colors["wheat"] = WHEAT
-colors["wheat1"] = WHEAT1
-colors["wheat2"] = WHEAT2
-colors["wheat3"] = WHEAT3
-colors["wheat4"] = WHEAT4
-colors["white"] = WHITE
-colors["whitesmoke"] = WHITESMOKE
-colors["whitesmoke"] = WHITESMOKE
-colors["yellow1"] = YELLOW1
-colors["yellow2"] = YELLOW2
-colors["yellow3"] = YELLOW3
-colors["yellow4"] = YELLOW4
+@cache
+def color_table() -> OrderedDict[str, RGB]:
+    """Map the lowercase name of each color above, except the TY_ colors, to it."""
+    return OrderedDict(
+        sorted(
+            (name.lower(), value)
+            for name, value in globals().items()
+            if isinstance(value, RGB) and not name.startswith("TY_")
+        ),
+    )
 
-colors = OrderedDict(sorted(colors.items(), key=lambda t: t[0]))
+
+def __getattr__(name: str) -> object:
+    # `colors` is built on first use instead of on import.
+    if name == "colors":
+        return color_table()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
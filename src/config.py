@@ -7,10 +7,25 @@ class Config:
     PADDING_X: int = 64
     PADDING_Y: int = 128
     SPEED: int = 128
+    FRAME_RATE: int = 60
+    MAX_FRAME_TIME_MS: int = 250
+    MAX_SPEED_MULTIPLIER: int = 64
     CELL_SIZE: int = 64
     NUM_CELLS_X: int = 8
     NUM_CELLS_Y: int = 8
     DRAW_ARCS: bool = False
+    DIRTY_RECTS: bool = False
     LOG_LEVEL: str = "INFO"
     PLAY_MUSIC: bool = True
     MOUSE_RIGHT: int = 3
+    LEVEL_PACK: str = "assets/levels/levels.tylp"
+    FRAME_STATS_WINDOW: int = 300
+    SHOW_FRAME_STATS: bool = False
+    PROFILER_MODE: str = "cprofile"
+    SAMPLING_INTERVAL_MS: float = 5.0
+    TRACEMALLOC_FRAMES: int = 1
+    TRACE_EVENTS: bool = False
+    TRACE_PATH: str = "tmp/trace.json"
+    TRACE_BUFFER_SIZE: int = 200_000
+    FRAME_BUDGET_MS: float = 16.6
+    SLOW_FRAME_LOG: str = "tmp/slow_frames.log"
@@ -42,3 +42,15 @@ def turn_right(old_dir: Direction) -> Direction:
     if old_dir == Direction.DOWN:
         return Direction.LEFT
     return Direction.NONE
+
+
+def reverse(old_dir: Direction) -> Direction:
+    return turn_left(turn_left(old_dir))
+
+
+direction_to_offset = {
+    Direction.RIGHT: (1, 0),
+    Direction.UP: (0, -1),
+    Direction.LEFT: (-1, 0),
+    Direction.DOWN: (0, 1),
+}
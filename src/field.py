@@ -9,7 +9,14 @@ from src.color_constants import TY_TELLOW
 from src.config import Config
 from src.coordinate import Coordinate
 from src.gfx.fieldborder import FieldBorder
+from src.gfx.spark import SparkSystem
+from src.gfx.staticlayer import StaticLayer
 from src.grid import Grid
+from src.levelformat import (
+    LEVEL_BINARY_SUFFIX,
+    read_level_binary,
+    saveable_from_record,
+)
 from src.levelitems.drawable import Drawable
 from src.levelitems.painter import Painter
 from src.levelitems.rock import Rock
@@ -17,17 +24,29 @@ from src.levelitems.splitter import Splitter
 from src.levelitems.station import ArrivalStation, DepartureStation
 from src.saveable import Saveable
 from src.track.track import Track, TrackType
+from src.utils.tracing import traced
 from src.utils.utils import setup_logging
 
 if TYPE_CHECKING:
-    from src.gfx.spark import Spark
+    from src.grid import GridCell
+    from src.levelformat import LevelData
+    from src.levelpack import LevelPack
+    from src.levelpreloader import LevelPreloader
+    from src.simulation.engine import SimulationEvent
 
 logger = setup_logging(log_level=Config.LOG_LEVEL)
 
 
 class Field:
-    def __init__(self, level: int = 0) -> None:
+    def __init__(
+        self,
+        level: int = 0,
+        level_pack: LevelPack | None = None,
+        level_preloader: LevelPreloader | None = None,
+    ) -> None:
         self.level = level
+        self.level_pack = level_pack
+        self.level_preloader = level_preloader
         self.cells_x = Config.NUM_CELLS_X
         self.cells_y = Config.NUM_CELLS_Y
 
@@ -48,60 +67,108 @@ class Field:
             thickness=1,
         )  # TODO: Field should have topleft coords and this should use them as well.
 
-        self.sparks: list[Spark] = []
-
-    def initialize_grid(self) -> None:
+        self.sparks: SparkSystem = SparkSystem()
+        self.events: list[SimulationEvent] = []
+
+    @traced("level")
+    def initialize_grid(self, level_path: str | None = None) -> None:
+        if level_path is None and self.level_pack is not None:
+            self.initialize_grid_from_level(self.level_pack.read_level(self.level))
+            return
+        level_path = level_path or f"assets/levels/level_{self.level}.csv"
+        if level_path.endswith(LEVEL_BINARY_SUFFIX):
+            self.initialize_grid_from_binary(level_path)
+            return
         with open(
-            f"assets/levels/level_{self.level}.csv",
+            level_path,
             newline="",
             encoding="utf-8",
         ) as level_file:
             level_reader = csv.reader(level_file, delimiter=";")
             for j, row in enumerate(level_reader):
                 for i, item in enumerate(row[0].split("-")):
-                    coords = Coordinate(i, j)
-                    saveable = Saveable(item)
-                    if saveable.type == "A":
-                        arrival_station = ArrivalStation(
-                            coords,
-                            saveable.angle,
-                            saveable.num_goals,
-                            saveable.color,
-                        )
-                        self.grid.add(arrival_station)
-                    elif saveable.type == "D":
-                        departure_station = DepartureStation(
-                            coords,
-                            saveable.angle,
-                            saveable.num_goals,
-                            saveable.color,
-                        )
-                        self.grid.add(departure_station)
-                    elif saveable.type == "E":
-                        drawble = Drawable(coords)
-                        self.grid.add(drawble)
-                    elif saveable.type == "R":
-                        rock_cell = Rock(coords)
-                        self.grid.add(rock_cell)
-                    elif saveable.type == "P":
-                        painter_cell = Painter(coords, saveable.angle, saveable.color)
-                        self.grid.add(painter_cell)
-                    elif saveable.type == "S":
-                        splitter_cell = Splitter(coords, saveable.angle)
-                        self.grid.add(splitter_cell)
-                    else:
-                        msg = f"Saveable type was unexpected: '{saveable.type}"
-                        raise RuntimeError(
-                            msg,
-                        )
-
-    def load_level(self, level: int) -> None:
-        self.level = level
-        self.clear()
-        self.initialize_grid()
+                    self.add_level_item(Coordinate(i, j), Saveable(item))
+
+    def initialize_grid_from_binary(self, level_path: str) -> None:
+        self.initialize_grid_from_level(read_level_binary(level_path))
+
+    def initialize_grid_from_level(self, level: LevelData) -> None:
+        for j, row in enumerate(level.cells.tolist()):
+            for i, cell in enumerate(row):
+                self.add_level_item(Coordinate(i, j), saveable_from_record(*cell))
+        # The preloader runs this off the main thread, so it must not touch the static
+        # layer; whoever shows the grid invalidates it.
+        for x, y, track_type in level.tracks.tolist():
+            self.insert_track_to_position(
+                TrackType(track_type),
+                Coordinate(x, y),
+                invalidate=False,
+            )
+
+    def add_level_item(self, coords: Coordinate, saveable: Saveable) -> None:
+        if saveable.type == "A":
+            arrival_station = ArrivalStation(
+                coords,
+                saveable.angle,
+                saveable.num_goals,
+                saveable.color,
+            )
+            self.grid.add(arrival_station)
+        elif saveable.type == "D":
+            departure_station = DepartureStation(
+                coords,
+                saveable.angle,
+                saveable.num_goals,
+                saveable.color,
+            )
+            self.grid.add(departure_station)
+        elif saveable.type == "E":
+            drawble = Drawable(coords)
+            self.grid.add(drawble)
+        elif saveable.type == "R":
+            rock_cell = Rock(coords)
+            self.grid.add(rock_cell)
+        elif saveable.type == "P":
+            painter_cell = Painter(coords, saveable.angle, saveable.color)
+            self.grid.add(painter_cell)
+        elif saveable.type == "S":
+            splitter_cell = Splitter(coords, saveable.angle)
+            self.grid.add(splitter_cell)
+        else:
+            msg = f"Saveable type was unexpected: '{saveable.type}"
+            raise RuntimeError(
+                msg,
+            )
+
+    @traced("level")
+    def load_level(self, level: int) -> bool:
+        """Switch to `level`, returning False if it is not ready yet.
+
+        With a preloader the level's grid is built in the background and swapped in
+        once it is ready, and the current level stays until then.
+        """
+        if self.level_preloader is None:
+            self.level = level
+            self.clear()
+            self.initialize_grid()
+        else:
+            grid = self.level_preloader.take(level)
+            if grid is None:
+                return False
+            self.level = level
+            self.grid = grid
+            self.events.clear()
+            self.num_crashed = 0
+            self.is_released = False
+            self.current_tick = 0
+            self.level_preloader.preload_around(level)
+        StaticLayer.invalidate()
+        return True
 
     def clear(self) -> None:
         self.grid.all_items.clear()
+        self.grid.cells.clear()
+        self.grid.track_graph.clear()
 
         self.grid.drawbles.remove_all()
         self.grid.rocks.remove_all()
@@ -111,6 +178,7 @@ class Field:
         self.grid.trains.remove_all()
         self.grid.painters.remove_all()
         self.grid.splitters.remove_all()
+        self.events.clear()
 
         self.num_crashed: int = 0
         self.is_released: bool = False
@@ -128,29 +196,26 @@ class Field:
         for arrival_station in self.grid.arrivals.items:
             arrival_station.reset()
         self.grid.trains.remove_all()
+        self.events.clear()
         self.num_crashed = 0
         self.is_released = False
 
-    def get_grid_cell_list_index(self, i: int = 0, j: int = 0) -> int:
-        return int(j) * self.cells_y + int(i)
-
-    def get_grid_cell_at(
-        self,
-        i: int,
-        j: int,
-    ) -> Drawable | Rock | ArrivalStation | DepartureStation | Painter | Splitter:
-        return self.grid.all_items[self.get_grid_cell_list_index(i, j)]
+    def get_grid_cell_at(self, i: int, j: int) -> GridCell | None:
+        return self.grid.get_cell(int(i), int(j))
 
     def _get_drawble_at_indices(self, i: int, j: int) -> Drawable | None:
-        cell = self.grid.all_items[self.get_grid_cell_list_index(i, j)]
-        if not isinstance(cell, Drawable):
-            return None
-        return cell
+        return self.grid.drawbles.get_at(int(i), int(j))
 
     def get_drawble_at_pos(self, pos: Coordinate) -> Drawable | None:
         return self._get_drawble_at_indices(pos.x, pos.y)
 
-    def insert_track_to_position(self, track_type: TrackType, pos: Coordinate) -> bool:
+    def insert_track_to_position(
+        self,
+        track_type: TrackType,
+        pos: Coordinate,
+        *,
+        invalidate: bool = True,
+    ) -> bool:
         drawble = self.get_drawble_at_pos(pos)
         if drawble is None:
             logger.warning(
@@ -181,5 +246,8 @@ class Field:
             ):
                 drawble.cell_tracks[0].bright = False
                 drawble.cell_tracks[0].image = drawble.cell_tracks[0].images["dark"]
+        self.grid.track_graph.update_cell(drawble)
+        if invalidate:
+            StaticLayer.invalidate(drawble.rect)
         logger.info(f"Added track to pos {pos}")
         return True
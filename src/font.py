@@ -1,8 +1,14 @@
 """Font."""
 
+from functools import partial
+
 import pygame as pg
 
+from src.assets import LazyAsset
+
+FONT_PATH = "assets/fonts/Walter-Heavy.otf"
+
 
 class Font:
-    small = pg.font.Font(filename="assets/fonts/Walter-Heavy.otf", size=10)
-    normal = pg.font.Font(filename="assets/fonts/Walter-Heavy.otf", size=16)
+    small = LazyAsset(partial(pg.font.Font, FONT_PATH, 10))
+    normal = LazyAsset(partial(pg.font.Font, FONT_PATH, 16))
@@ -2,15 +2,23 @@
 
 import pygame as pg
 
+from src.assets import Assets
 from src.config import Config
 from src.field import Field
+from src.gfx.dirtyrects import DirtyRects
 from src.gfx.graphics import Graphics
+from src.levelpack import LevelPack
+from src.levelpreloader import LevelPreloader
 from src.phases.exit import exit_phase
 from src.phases.gameplay import gameplay_phase
 from src.screen import Screen
 from src.sound import Sound
 from src.state import Phase, State
+from src.utils.frametimer import FrameTimer
+from src.utils.startup import StartupTimer
+from src.utils.tracing import Trace
 from src.utils.utils import setup_logging
+from src.utils.watchdog import FrameWatchdog
 
 logger = setup_logging(log_level=Config.LOG_LEVEL)
 
@@ -19,26 +27,65 @@ class GameLoop:
     def __init__(self) -> None:
         self.screen = Screen()
         pg.display.set_caption("locomotive")
+        StartupTimer.mark("display opened")
         Graphics.load_resources()
+        StartupTimer.mark("assets loaded")
         self.state = State()
-        self.field = Field(level=0)
+        level_pack = LevelPack(Config.LEVEL_PACK)
+        self.level_preloader = LevelPreloader(level_pack)
+        self.field = Field(
+            level=0,
+            level_pack=level_pack,
+            level_preloader=self.level_preloader,
+        )
         self.field.initialize_grid()
+        self.level_preloader.preload_around(self.field.level)
+        StartupTimer.mark("first level loaded")
         self.clock = pg.time.Clock()
+        self.tick_interval_ms = 1000 / Config.SPEED
+        self.accumulated_ms = 0.0
 
         Sound.init_music(song_name="Song 9")
+        StartupTimer.mark("sound initialized")
+        FrameWatchdog.start()
 
     def loop(self) -> None:
         if Config.PLAY_MUSIC:
             Sound.play_music()
         while True:
+            self.accumulate_ticks()
+            FrameTimer.start_frame()
             if self.state.game_phase == Phase.MAIN_MENU:
                 gameplay_phase(self.state, self.screen, self.field)
             elif self.state.game_phase == Phase.EXIT:
+                self.level_preloader.shutdown()
+                if Trace.enabled:
+                    Trace.write()
                 exit_phase()
             elif self.state.game_phase == Phase.GAMEPLAY:
                 gameplay_phase(self.state, self.screen, self.field)
 
             self.state.global_status.current_tick += 1
-            pg.display.update()
-            self.clock.tick_busy_loop(Config.SPEED)
-            logger.info(self.clock.get_fps())
+            DirtyRects.update_display()
+            FrameTimer.end_frame()
+            FrameWatchdog.check_frame(
+                self.field,
+                self.state.global_status.current_tick,
+                self.clock.get_time(),
+            )
+            if self.state.global_status.current_tick == 1:
+                StartupTimer.mark("first frame drawn")
+                StartupTimer.finish()
+                # Whatever the first frame did not need is loaded in the background.
+                Assets.preload()
+
+    def accumulate_ticks(self) -> None:
+        """Sleep until the next frame and convert the elapsed time to due ticks."""
+        frame_time_ms = min(
+            self.clock.tick(Config.FRAME_RATE),
+            Config.MAX_FRAME_TIME_MS,
+        )
+        self.accumulated_ms += frame_time_ms
+        ticks_due = int(self.accumulated_ms // self.tick_interval_ms)
+        self.accumulated_ms -= ticks_due * self.tick_interval_ms
+        self.state.global_status.ticks_due = ticks_due
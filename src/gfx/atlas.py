@@ -0,0 +1,63 @@
+"""Texture atlas."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+ATLAS_WIDTH = 1024
+
+
+def fast_blit_masks() -> tuple[int, int, int, int] | None:
+    """Return the pixel masks `convert_alpha()` would use, if a display exists.
+
+    Creating the atlas in that format saves converting the whole atlas afterwards.
+    """
+    if pg.display.get_surface() is None:
+        return None
+    return pg.Surface((1, 1), pg.SRCALPHA).convert_alpha().get_masks()
+
+
+# Packs images into one surface in rows of similar height and hands out subsurfaces
+# of it, so everything drawn from the atlas is blitted from the same source surface.
+class TextureAtlas:
+    def __init__(
+        self,
+        images: Mapping[Hashable, pg.Surface],
+        width: int = ATLAS_WIDTH,
+    ) -> None:
+        self.regions: dict[Hashable, pg.Rect] = {}
+        x, y, row_height = 0, 0, 0
+        for key, image in sorted(images.items(), key=lambda item: -item[1].height):
+            if x + image.width > width:
+                x, y, row_height = 0, y + row_height, 0
+            self.regions[key] = pg.Rect((x, y), image.size)
+            x += image.width
+            row_height = max(row_height, image.height)
+
+        size = (width, y + row_height)
+        masks = fast_blit_masks()
+        self.surface = (
+            pg.Surface(size, pg.SRCALPHA)
+            if masks is None
+            else pg.Surface(size, pg.SRCALPHA, 32, masks)
+        )
+        # Adding onto the transparent atlas copies the pixels, alpha included, where a
+        # normal blit would blend them.
+        self.surface.blits(
+            [
+                (images[key], region, None, pg.BLEND_RGBA_ADD)
+                for key, region in self.regions.items()
+            ],
+            doreturn=False,
+        )
+        self.subsurfaces: dict[Hashable, pg.Surface] = {
+            key: self.surface.subsurface(region) for key, region in self.regions.items()
+        }
+
+    def get(self, key: Hashable) -> pg.Surface:
+        return self.subsurfaces[key]
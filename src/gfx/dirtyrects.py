@@ -0,0 +1,65 @@
+"""Dirty rectangles."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import pygame as pg
+
+from src.config import Config
+from src.utils.frametimer import SystemKind, timed_system
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class DirtyRects:
+    enabled: ClassVar[bool] = Config.DIRTY_RECTS
+    full_update: ClassVar[bool] = True
+    rects: ClassVar[list[pg.Rect]] = []
+    tracked_rects: ClassVar[dict[str, list[pg.Rect]]] = {}
+    last_states: ClassVar[dict[object, tuple[Hashable, pg.Rect]]] = {}
+
+    @staticmethod
+    def add(rect: pg.Rect) -> None:
+        if DirtyRects.enabled and not DirtyRects.full_update:
+            DirtyRects.rects.append(rect)
+
+    @staticmethod
+    def add_full() -> None:
+        DirtyRects.full_update = True
+        DirtyRects.last_states.clear()
+
+    @staticmethod
+    def track(key: str, rects: list[pg.Rect]) -> None:
+        """Mark where `key` was drawn last frame and where it is drawn now."""
+        if not DirtyRects.enabled:
+            return
+        for rect in DirtyRects.tracked_rects.get(key, []):
+            DirtyRects.add(rect)
+        for rect in rects:
+            DirtyRects.add(rect)
+        DirtyRects.tracked_rects[key] = rects
+
+    @staticmethod
+    def add_if_changed(owner: object, state: Hashable, rect: pg.Rect) -> None:
+        """Mark the old and new area of `owner` if its drawn state has changed."""
+        if not DirtyRects.enabled:
+            return
+        last_state = DirtyRects.last_states.get(owner)
+        if last_state is not None and last_state[0] == state:
+            return
+        if last_state is not None:
+            DirtyRects.add(last_state[1])
+        DirtyRects.add(rect)
+        DirtyRects.last_states[owner] = (state, rect)
+
+    @staticmethod
+    @timed_system(SystemKind.DRAW)
+    def update_display() -> None:
+        if not DirtyRects.enabled or DirtyRects.full_update:
+            pg.display.update()
+        elif DirtyRects.rects:
+            pg.display.update(DirtyRects.rects)
+        DirtyRects.rects = []
+        DirtyRects.full_update = False
@@ -41,6 +41,6 @@ class FieldBorder:
         self._thickness = thickness
         self.calculate_position()
 
-    def draw(self, screen_surface: pg.Surface) -> None:
+    def draw(self, screen_surface: pg.Surface) -> pg.Rect:
         pg.draw.rect(self.surface, self.color, self.rect, self._thickness)
-        screen_surface.blit(self.surface, self.location)
+        return screen_surface.blit(self.surface, self.location)
@@ -0,0 +1,82 @@
+"""Frame stats overlay."""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+import pygame as pg
+
+from src.color_constants import GRAY5, GRAY50, TY_TELLOW, WHITE
+from src.config import Config
+from src.font import Font
+from src.gfx.dirtyrects import DirtyRects
+from src.utils.frametimer import FRAME, FrameTimer, SystemKind, SystemStats
+
+OVERLAY_TOPLEFT = (1050, 16)
+OVERLAY_WIDTH = 540
+ROW_HEIGHT = 14
+NUM_SYSTEM_ROWS = 16
+REFRESH_INTERVAL_FRAMES = 30
+# Column x offsets: name, last, mean, p95, p99.
+COLUMNS = (0, 320, 375, 430, 485)
+
+
+# Lists the slowest systems by p95 over the frame stats window. The table is rendered
+# again only every REFRESH_INTERVAL_FRAMES frames, so showing it costs about a blit.
+class FrameStatsOverlay:
+    visible: ClassVar[bool] = Config.SHOW_FRAME_STATS
+    surface: ClassVar[pg.Surface | None] = None
+    rendered_at_frame: ClassVar[int] = -REFRESH_INTERVAL_FRAMES
+
+    @staticmethod
+    def toggle() -> None:
+        FrameStatsOverlay.visible = not FrameStatsOverlay.visible
+        FrameStatsOverlay.rendered_at_frame = -REFRESH_INTERVAL_FRAMES
+
+    @staticmethod
+    def draw(screen_surface: pg.Surface) -> None:
+        if not FrameStatsOverlay.visible:
+            DirtyRects.track("frame_stats", [])
+            return
+        if (
+            FrameTimer.num_frames - FrameStatsOverlay.rendered_at_frame
+            >= REFRESH_INTERVAL_FRAMES
+        ):
+            FrameStatsOverlay.surface = render_stats(FrameTimer.stats())
+            FrameStatsOverlay.rendered_at_frame = FrameTimer.num_frames
+        if FrameStatsOverlay.surface is not None:
+            DirtyRects.track(
+                "frame_stats",
+                [screen_surface.blit(FrameStatsOverlay.surface, OVERLAY_TOPLEFT)],
+            )
+
+
+def render_stats(all_stats: list[SystemStats]) -> pg.Surface:
+    frame_stats = [stats for stats in all_stats if stats.kind == SystemKind.FRAME]
+    system_stats = sorted(
+        (stats for stats in all_stats if stats.kind != SystemKind.FRAME),
+        key=lambda stats: stats.p95_ms,
+        reverse=True,
+    )[:NUM_SYSTEM_ROWS]
+    rows = [("SYSTEM (F2)", "LAST", "MEAN", "P95", "P99")]
+    rows.extend(
+        (
+            stats.name if stats.name != FRAME else "FRAME TOTAL",
+            f"{stats.last_ms:.2f}",
+            f"{stats.mean_ms:.2f}",
+            f"{stats.p95_ms:.2f}",
+            f"{stats.p99_ms:.2f}",
+        )
+        for stats in frame_stats + system_stats
+    )
+
+    surface = pg.Surface((OVERLAY_WIDTH, (len(rows) + 1) * ROW_HEIGHT))
+    surface.fill(GRAY5)
+    for row_index, row in enumerate(rows):
+        color = TY_TELLOW if row_index == 0 else WHITE if row_index == 1 else GRAY50
+        for x, text in zip(COLUMNS, row, strict=True):
+            surface.blit(
+                Font.small.render(text, antialias=True, color=color),
+                (x + 4, (row_index + 0.5) * ROW_HEIGHT),
+            )
+    return surface
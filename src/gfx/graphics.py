@@ -1,145 +1,166 @@
 """Graphics."""
 
-from typing import ClassVar
+from __future__ import annotations
+
+import threading
+from functools import partial
+from typing import ClassVar, cast
 
 import pygame as pg
 
+from src.assets import Assets
+from src.gfx.atlas import TextureAtlas
+from src.traincolor import TrainColor
+from src.utils.utils import rot_center
+
+TRAIN_ROTATION_STEPS = 360
+TRAIN_ROTATIONS_ASSET = "Graphics.train_rotations"
+RIGHT_ANGLES = (90, 180, 270)
+# Sprites that cells, tracks and goals draw rotated, with their variants.
+ROTATED_SPRITES: dict[str, tuple[str, ...]] = {
+    "track_s": ("bright", "dark"),
+    "track_c": ("bright", "dark"),
+    "departure": ("",),
+    "arrival": ("",),
+    "painter": ("",),
+    "splitter": ("",),
+    "goal": ("blue", "red", "yellow", "orange", "green", "purple"),
+}
+
+
+def load_image(path: str) -> pg.Surface:
+    """Load an image, converting it for fast blitting when a display exists."""
+    image = pg.image.load(path)
+    if pg.display.get_surface() is None:
+        return image
+    return image.convert_alpha()
+
+
+def sprite_name(sprite: str, variant: str) -> str:
+    return f"{sprite}_{variant}" if variant else sprite
+
 
 class Graphics:
+    atlas: ClassVar[TextureAtlas | None] = None
     img_surfaces: ClassVar[dict[str, pg.Surface]] = {}
+    train_rotations: ClassVar[dict[str, list[pg.Surface]]] = {}
+    rotated_surfaces: ClassVar[dict[tuple[str, int, str], pg.Surface]] = {}
+    # The level preloader builds sprites on its own thread.
+    rotation_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @staticmethod
     def load_resources() -> None:
-        Graphics.img_surfaces = {
-            "shift_key": pg.image.load("assets/sprites/shift.png").convert_alpha(),
-            "checkmark": pg.image.load("assets/sprites/checkmark.png").convert_alpha(),
-            "train_red": pg.image.load("assets/sprites/train_red.png").convert_alpha(),
-            "train_blue": pg.image.load(
-                "assets/sprites/train_blue.png",
-            ).convert_alpha(),
-            "train_yellow": pg.image.load(
-                "assets/sprites/train_yellow.png",
-            ).convert_alpha(),
-            "train_orange": pg.image.load(
-                "assets/sprites/train_orange.png",
-            ).convert_alpha(),
-            "train_green": pg.image.load(
-                "assets/sprites/train_green.png",
-            ).convert_alpha(),
-            "train_purple": pg.image.load(
-                "assets/sprites/train_purple.png",
-            ).convert_alpha(),
-            "train_brown": pg.image.load(
-                "assets/sprites/train_brown.png",
-            ).convert_alpha(),
-            "bg_tile": pg.image.load("assets/sprites/bg_tile.png").convert_alpha(),
-            "rock": pg.image.load("assets/sprites/rock.png").convert_alpha(),
-            "track_s_bright": pg.image.load(
-                "assets/sprites/track_s_bright.png",
-            ).convert_alpha(),
-            "track_c_bright": pg.image.load(
-                "assets/sprites/track_c_bright.png",
-            ).convert_alpha(),
-            "track_s_dark": pg.image.load(
-                "assets/sprites/track_s_dark.png",
-            ).convert_alpha(),
-            "track_c_dark": pg.image.load(
-                "assets/sprites/track_c_dark.png",
-            ).convert_alpha(),
-            "departure": pg.image.load(
-                "assets/sprites/departure_station.png",
-            ).convert_alpha(),
-            "arrival": pg.image.load(
-                "assets/sprites/arrival_station.png",
-            ).convert_alpha(),
-            "blue_goal_1": pg.image.load(
-                "assets/sprites/goal_blue.png",
-            ).convert_alpha(),
-            "painter": pg.image.load("assets/sprites/painter.png").convert_alpha(),
-            "splitter": pg.image.load("assets/sprites/splitter.png").convert_alpha(),
-            "blue_goal_2": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_blue.png").convert_alpha(),
-                -90,
-            ),
-            "blue_goal_3": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_blue.png").convert_alpha(),
-                90,
-            ),
-            "blue_goal_4": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_blue.png").convert_alpha(),
-                180,
-            ),
-            "red_goal_1": pg.image.load("assets/sprites/goal_red.png").convert_alpha(),
-            "red_goal_2": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_red.png").convert_alpha(),
-                -90,
-            ),
-            "red_goal_3": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_red.png").convert_alpha(),
-                90,
-            ),
-            "red_goal_4": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_red.png").convert_alpha(),
-                180,
-            ),
-            "yellow_goal_1": pg.image.load(
-                "assets/sprites/goal_yellow.png",
-            ).convert_alpha(),
-            "yellow_goal_2": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_yellow.png").convert_alpha(),
-                -90,
-            ),
-            "yellow_goal_3": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_yellow.png").convert_alpha(),
-                90,
-            ),
-            "yellow_goal_4": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_yellow.png").convert_alpha(),
-                180,
-            ),
-            "orange_goal_1": pg.image.load(
-                "assets/sprites/goal_orange.png",
-            ).convert_alpha(),
-            "orange_goal_2": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_orange.png").convert_alpha(),
-                -90,
-            ),
-            "orange_goal_3": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_orange.png").convert_alpha(),
-                90,
-            ),
-            "orange_goal_4": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_orange.png").convert_alpha(),
-                180,
-            ),
-            "green_goal_1": pg.image.load(
-                "assets/sprites/goal_green.png",
-            ).convert_alpha(),
-            "green_goal_2": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_green.png").convert_alpha(),
-                -90,
-            ),
-            "green_goal_3": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_green.png").convert_alpha(),
-                90,
-            ),
-            "green_goal_4": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_green.png").convert_alpha(),
-                180,
-            ),
-            "purple_goal_1": pg.image.load(
-                "assets/sprites/goal_purple.png",
-            ).convert_alpha(),
-            "purple_goal_2": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_purple.png").convert_alpha(),
-                -90,
-            ),
-            "purple_goal_3": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_purple.png").convert_alpha(),
-                90,
-            ),
-            "purple_goal_4": pg.transform.rotate(
-                pg.image.load("assets/sprites/goal_purple.png").convert_alpha(),
-                180,
-            ),
+        """Load every sprite once and pack it, with its rotations, into an atlas.
+
+        The atlas is in the display's format for fast blitting when a display exists,
+        and the sprites handed out are subsurfaces of it.
+        """
+        images = {
+            "shift_key": load_image("assets/sprites/shift.png"),
+            "checkmark": load_image("assets/sprites/checkmark.png"),
+            "train_red": load_image("assets/sprites/train_red.png"),
+            "train_blue": load_image("assets/sprites/train_blue.png"),
+            "train_yellow": load_image("assets/sprites/train_yellow.png"),
+            "train_orange": load_image("assets/sprites/train_orange.png"),
+            "train_green": load_image("assets/sprites/train_green.png"),
+            "train_purple": load_image("assets/sprites/train_purple.png"),
+            "train_brown": load_image("assets/sprites/train_brown.png"),
+            "bg_tile": load_image("assets/sprites/bg_tile.png"),
+            "rock": load_image("assets/sprites/rock.png"),
+            "track_s_bright": load_image("assets/sprites/track_s_bright.png"),
+            "track_c_bright": load_image("assets/sprites/track_c_bright.png"),
+            "track_s_dark": load_image("assets/sprites/track_s_dark.png"),
+            "track_c_dark": load_image("assets/sprites/track_c_dark.png"),
+            "departure": load_image("assets/sprites/departure_station.png"),
+            "arrival": load_image("assets/sprites/arrival_station.png"),
+            "painter": load_image("assets/sprites/painter.png"),
+            "splitter": load_image("assets/sprites/splitter.png"),
+            "goal_blue": load_image("assets/sprites/goal_blue.png"),
+            "goal_red": load_image("assets/sprites/goal_red.png"),
+            "goal_yellow": load_image("assets/sprites/goal_yellow.png"),
+            "goal_orange": load_image("assets/sprites/goal_orange.png"),
+            "goal_green": load_image("assets/sprites/goal_green.png"),
+            "goal_purple": load_image("assets/sprites/goal_purple.png"),
         }
+        rotations = {
+            (sprite, angle, variant): pg.transform.rotate(
+                images[sprite_name(sprite, variant)],
+                angle,
+            )
+            for sprite, variants in ROTATED_SPRITES.items()
+            for variant in variants
+            for angle in RIGHT_ANGLES
+        }
+        atlas = TextureAtlas({**images, **rotations})
+
+        Graphics.atlas = atlas
+        Graphics.img_surfaces = {name: atlas.get(name) for name in images}
+        Graphics.rotated_surfaces = {key: atlas.get(key) for key in rotations}
+        for sprite, variants in ROTATED_SPRITES.items():
+            for variant in variants:
+                Graphics.rotated_surfaces[(sprite, 0, variant)] = Graphics.img_surfaces[
+                    sprite_name(sprite, variant)
+                ]
+        # Trains only need their rotations once they move, so those are built on first
+        # use, or by the asset preloader before that.
+        Graphics.train_rotations = {}
+        Assets.register(
+            TRAIN_ROTATIONS_ASSET,
+            partial(Graphics.build_train_rotations, images),
+        )
+
+    @staticmethod
+    def build_train_rotations(
+        images: dict[str, pg.Surface],
+    ) -> dict[str, list[pg.Surface]]:
+        """Pre-rotate every train sprite to each whole degree a train can face.
+
+        The rotations are packed into an atlas of their own.
+        """
+        atlas = TextureAtlas(
+            {
+                (train_color.value, angle): rot_center(images[train_color.value], angle)
+                for train_color in TrainColor
+                for angle in range(TRAIN_ROTATION_STEPS)
+            },
+        )
+        return {
+            train_color.value: [
+                atlas.get((train_color.value, angle))
+                for angle in range(TRAIN_ROTATION_STEPS)
+            ]
+            for train_color in TrainColor
+        }
+
+    @staticmethod
+    def get_train_image(train_color: str, angle: float) -> pg.Surface:
+        if not Graphics.train_rotations:
+            Graphics.train_rotations = cast(
+                "dict[str, list[pg.Surface]]",
+                Assets.get(TRAIN_ROTATIONS_ASSET),
+            )
+        return Graphics.train_rotations[train_color][
+            round(angle) % TRAIN_ROTATION_STEPS
+        ]
+
+    @staticmethod
+    def get_rotated(sprite: str, angle: int, variant: str = "") -> pg.Surface:
+        """Return a sprite rotated by `angle`, shared by everything that draws it.
+
+        `variant` picks one of the sprite's images, e.g. "bright" for "track_s" is
+        "track_s_bright". Right-angle rotations of ROTATED_SPRITES come from the atlas;
+        any other rotation is made on first use and cached for the process.
+        """
+        key = (sprite, angle % 360, variant)
+        surface = Graphics.rotated_surfaces.get(key)
+        if surface is not None:
+            return surface
+        with Graphics.rotation_lock:
+            surface = Graphics.rotated_surfaces.get(key)
+            if surface is None:
+                surface = pg.transform.rotate(
+                    Graphics.img_surfaces[sprite_name(sprite, variant)],
+                    key[1],
+                )
+                Graphics.rotated_surfaces[key] = surface
+        return surface
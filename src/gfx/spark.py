@@ -3,142 +3,239 @@
 from __future__ import annotations
 
 import math
-import random
 
+import numpy as np
 import pygame as pg
 
+rng = np.random.default_rng()
 
-class Spark:
-    def __init__(
+EDGE_TOP = 0
+EDGE_LEFT = 1
+EDGE_BOTTOM = 2
+EDGE_RIGHT = 3
+
+ANGLE_STEPS = 32
+ANGLE_STEP = 2 * math.pi / ANGLE_STEPS
+MAX_LENGTH_STEPS = 32
+
+
+class SparkSystem:
+    def __init__(self) -> None:
+        self.loc_x = np.empty(0, dtype=np.float64)
+        self.loc_y = np.empty(0, dtype=np.float64)
+        self.angle = np.empty(0, dtype=np.float64)
+        self.base_speed = np.empty(0, dtype=np.float64)
+        self.friction = np.empty(0, dtype=np.float64)
+        self.scale = np.empty(0, dtype=np.float64)
+        self.speed_multiplier = np.empty(0, dtype=np.float64)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """Return the number of living sparks."""
+        return len(self.loc_x)
+
+    def emit(  # noqa: PLR0913
         self,
-        loc: tuple[int, int],
-        angle: float,
-        base_speed: float,
-        friction: float,
-        color: tuple[int, int, int],
+        *,
+        loc_x: np.ndarray,
+        loc_y: np.ndarray,
+        angle: np.ndarray,
+        base_speed: np.ndarray,
+        friction: np.ndarray,
+        color: np.ndarray,
         scale: float = 1.0,
         speed_multiplier: float = 1.0,
     ) -> None:
-        self.loc_x = loc[0]
-        self.loc_y = loc[1]
-        self.angle = angle
-        self.base_speed = base_speed
-        self.friction = friction
-        self.scale = scale
-        self.color = color
-        self.alive = True
-        self.speed_multiplier = speed_multiplier
-
-        self.last_collision = (self.loc_x, self.loc_y)
-
-    def calculate_distance_to_move(self, delta_time: float) -> tuple[float, float]:
-        common_factor = self.speed_multiplier * self.base_speed * delta_time
+        count = len(loc_x)
+        self.loc_x = np.concatenate((self.loc_x, loc_x))
+        self.loc_y = np.concatenate((self.loc_y, loc_y))
+        self.angle = np.concatenate((self.angle, angle))
+        self.base_speed = np.concatenate((self.base_speed, base_speed))
+        self.friction = np.concatenate((self.friction, friction))
+        self.scale = np.concatenate((self.scale, np.full(count, scale)))
+        self.speed_multiplier = np.concatenate(
+            (self.speed_multiplier, np.full(count, speed_multiplier)),
+        )
+        self.color = np.concatenate((self.color, color))
+
+    def clear(self) -> None:
+        self.keep(np.zeros(len(self), dtype=bool))
+
+    def keep(self, mask: np.ndarray) -> None:
+        self.loc_x = self.loc_x[mask]
+        self.loc_y = self.loc_y[mask]
+        self.angle = self.angle[mask]
+        self.base_speed = self.base_speed[mask]
+        self.friction = self.friction[mask]
+        self.scale = self.scale[mask]
+        self.speed_multiplier = self.speed_multiplier[mask]
+        self.color = self.color[mask]
+
+    def _inside(self, rect: pg.Rect) -> np.ndarray:
         return (
-            math.cos(self.angle) * common_factor,
-            math.sin(self.angle) * common_factor,
+            (self.loc_x >= rect.left)
+            & (self.loc_x < rect.right)
+            & (self.loc_y >= rect.top)
+            & (self.loc_y < rect.bottom)
         )
 
-    def bounce_from_edge(
+    def _bounce(self, mask: np.ndarray, rect: pg.Rect) -> None:
+        """Reflect the masked sparks off the edge of `rect` nearest to each spark."""
+        loc_x = self.loc_x[mask]
+        loc_y = self.loc_y[mask]
+        nearest_edge = np.argmin(
+            np.stack(
+                (
+                    np.abs(loc_y - rect.top),
+                    np.abs(loc_x - rect.left),
+                    np.abs(loc_y - rect.bottom),
+                    np.abs(loc_x - rect.right),
+                ),
+            ),
+            axis=0,
+        )
+        horizontal_edge = (nearest_edge == EDGE_TOP) | (nearest_edge == EDGE_BOTTOM)
+        angle = self.angle[mask]
+        self.angle[mask] = np.where(
+            horizontal_edge,
+            -2 * math.pi - angle,
+            math.pi - angle,
+        )
+        loc_y[nearest_edge == EDGE_TOP] = rect.top
+        loc_y[nearest_edge == EDGE_BOTTOM] = rect.bottom
+        loc_x[nearest_edge == EDGE_LEFT] = rect.left
+        loc_x[nearest_edge == EDGE_RIGHT] = rect.right
+        self.loc_x[mask] = loc_x
+        self.loc_y[mask] = loc_y
+
+    def bounce_from_edges(
         self,
         allowed_area: pg.Rect,
         collide_rects: list[pg.Rect] | None,
     ) -> None:
-        if not allowed_area.collidepoint(self.loc_x, self.loc_y):
-            to_top = abs(self.loc_y - allowed_area.top)
-            to_left = abs(self.loc_x - allowed_area.left)
-            to_bottom = abs(self.loc_y - allowed_area.bottom)
-            to_right = abs(self.loc_x - allowed_area.right)
-            minimum = min(to_top, to_left, to_bottom, to_right)
-            if to_top == minimum:
-                self.angle = -2 * math.pi - self.angle
-                self.loc_y = allowed_area.top
-            elif to_left == minimum:
-                self.angle = math.pi - self.angle
-                self.loc_x = allowed_area.left
-            elif to_bottom == minimum:
-                self.angle = -2 * math.pi - self.angle
-                self.loc_y = allowed_area.bottom
-            elif to_right == minimum:
-                self.angle = math.pi - self.angle
-                self.loc_x = allowed_area.right
-            self.angle += random.uniform(math.radians(-45), math.radians(45))
-            self.last_collision = (self.loc_x, self.loc_y)
-        else:
-            if collide_rects is None:
-                return
-            for collide_rect in collide_rects:
-                if collide_rect.collidepoint((self.loc_x, self.loc_y)):
-                    to_top = abs(self.loc_y - collide_rect.top)
-                    to_left = abs(self.loc_x - collide_rect.left)
-                    to_bottom = abs(self.loc_y - collide_rect.bottom)
-                    to_right = abs(self.loc_x - collide_rect.right)
-                    minimum = min(to_top, to_left, to_bottom, to_right)
-                    if to_top == minimum:
-                        self.angle = -2 * math.pi - self.angle
-                        self.loc_y = collide_rect.top
-                    elif to_left == minimum:
-                        self.angle = math.pi - self.angle
-                        self.loc_x = collide_rect.left
-                    elif to_bottom == minimum:
-                        self.angle = -2 * math.pi - self.angle
-                        self.loc_y = collide_rect.bottom
-                    elif to_right == minimum:
-                        self.angle = math.pi - self.angle
-                        self.loc_x = collide_rect.right
-
-    def move(
+        outside = ~self._inside(allowed_area)
+        if outside.any():
+            self._bounce(outside, allowed_area)
+            self.angle[outside] += rng.uniform(
+                math.radians(-45),
+                math.radians(45),
+                size=int(outside.sum()),
+            )
+        if collide_rects is None:
+            return
+        for collide_rect in collide_rects:
+            collided = ~outside & self._inside(collide_rect)
+            if collided.any():
+                self._bounce(collided, collide_rect)
+
+    def update(
         self,
         delta_time: float,
         allowed_area: pg.Rect,
         collide_rects: list[pg.Rect] | None,
     ) -> None:
-        self.bounce_from_edge(allowed_area, collide_rects)
-        distance = self.calculate_distance_to_move(delta_time)
-        self.loc_x += distance[0]
-        self.loc_y += distance[1]
+        if len(self) == 0:
+            return
+        self.bounce_from_edges(allowed_area, collide_rects)
+        common_factor = self.speed_multiplier * self.base_speed * delta_time
+        self.loc_x += np.cos(self.angle) * common_factor
+        self.loc_y += np.sin(self.angle) * common_factor
         self.base_speed -= self.friction
-        if self.base_speed <= 0:
-            self.alive = False
-
-    def draw(self, screen_surface: pg.Surface) -> None:
-        if self.alive:
-            points = [
-                [
-                    self.loc_x + math.cos(self.angle) * self.base_speed * self.scale,
-                    self.loc_y + math.sin(self.angle) * self.base_speed * self.scale,
-                ],
-                [
-                    self.loc_x
-                    + math.cos(self.angle + math.pi / 2)
-                    * self.base_speed
-                    * self.scale
-                    * 0.3,
-                    self.loc_y
-                    + math.sin(self.angle + math.pi / 2)
-                    * self.base_speed
-                    * self.scale
-                    * 0.3,
-                ],
-                [
-                    self.loc_x
-                    - math.cos(self.angle) * self.base_speed * self.scale * 3.5,
-                    self.loc_y
-                    - math.sin(self.angle) * self.base_speed * self.scale * 3.5,
-                ],
-                [
-                    self.loc_x
-                    + math.cos(self.angle - math.pi / 2)
-                    * self.base_speed
-                    * self.scale
-                    * 0.3,
-                    self.loc_y
-                    - math.sin(self.angle + math.pi / 2)
-                    * self.base_speed
-                    * self.scale
-                    * 0.3,
-                ],
-            ]
-            pg.draw.polygon(screen_surface, self.color, points)
+        self.keep(self.base_speed > 0)
+
+    def draw(self, screen_surface: pg.Surface) -> pg.Rect | None:
+        if len(self) == 0:
+            return None
+        # Quantize each spark to a pre-rendered streak and blit them all at once.
+        angle_steps = np.round(self.angle / ANGLE_STEP).astype(np.int64) % ANGLE_STEPS
+        length_steps = np.round(self.base_speed * self.scale).astype(np.int64)
+        colors = (
+            self.color[:, 0].astype(np.int64) << 16
+            | self.color[:, 1].astype(np.int64) << 8
+            | self.color[:, 2]
+        )
+        keys = (colors * ANGLE_STEPS + angle_steps) * MAX_LENGTH_STEPS + np.minimum(
+            length_steps,
+            MAX_LENGTH_STEPS - 1,
+        )
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sprite_indices = streak_sprites.indices(unique_keys)[inverse]
+        top_left = (
+            np.floor(np.stack((self.loc_x, self.loc_y), axis=1)).astype(np.int64)
+            + streak_sprites.offsets[sprite_indices]
+        )
+        bottom_right = top_left + streak_sprites.sizes[sprite_indices]
+        screen_surface.fblits(
+            zip(
+                map(streak_sprites.surfaces.__getitem__, sprite_indices.tolist()),
+                top_left.tolist(),
+                strict=True,
+            ),
+        )
+        left, top = top_left.min(axis=0).tolist()
+        right, bottom = bottom_right.max(axis=0).tolist()
+        return pg.Rect(left, top, right - left, bottom - top)
+
+
+# Pre-rendered spark streaks, so sparks can be drawn with one `fblits` call instead
+# of a polygon per spark. Streaks are keyed by color, angle step and length step,
+# and rendered on first use.
+class StreakSprites:
+    def __init__(self) -> None:
+        self.surfaces: list[pg.Surface] = []
+        self.offsets = np.empty((0, 2), dtype=np.int64)
+        self.sizes = np.empty((0, 2), dtype=np.int64)
+        self.index_by_key: dict[int, int] = {}
+
+    def indices(self, keys: np.ndarray) -> np.ndarray:
+        """Return the sprite index of each key, rendering the missing sprites."""
+        missing = [key for key in keys.tolist() if key not in self.index_by_key]
+        if missing:
+            offsets = []
+            sizes = []
+            for key in missing:
+                surface, offset = render_streak(key)
+                self.index_by_key[key] = len(self.surfaces)
+                self.surfaces.append(surface)
+                offsets.append(offset)
+                sizes.append(surface.get_size())
+            self.offsets = np.concatenate((self.offsets, offsets))
+            self.sizes = np.concatenate((self.sizes, sizes))
+        return np.array([self.index_by_key[key] for key in keys.tolist()])
+
+
+def render_streak(key: int) -> tuple[pg.Surface, tuple[int, int]]:
+    """Render the streak for a packed key, with its offset from the spark location."""
+    rest, length = divmod(key, MAX_LENGTH_STEPS)
+    color, angle_step = divmod(rest, ANGLE_STEPS)
+    angle = angle_step * ANGLE_STEP
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    width = length * 0.3
+    tail = length * 3.5
+    points = [
+        (cos * length, sin * length),
+        (-sin * width, cos * width),
+        (-cos * tail, -sin * tail),
+        (sin * width, -cos * width),
+    ]
+    left = math.floor(min(x for x, _ in points))
+    top = math.floor(min(y for _, y in points))
+    right = math.ceil(max(x for x, _ in points))
+    bottom = math.ceil(max(y for _, y in points))
+    surface = pg.Surface((right - left + 1, bottom - top + 1))
+    if pg.display.get_surface() is not None:
+        surface = surface.convert()
+    pg.draw.polygon(
+        surface,
+        ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF),
+        [(x - left, y - top) for x, y in points],
+    )
+    surface.set_colorkey((0, 0, 0), pg.RLEACCEL)
+    return surface, (left, top)
+
+
+streak_sprites = StreakSprites()
 
 
 class SparkStyle:
@@ -266,35 +363,49 @@ class SparkCloud:
         self.spark_count_deviation = spark_count_deviation
         self.behavior = behavior
 
-    def emit_sparks(self) -> list[Spark]:
-        spark_list: list[Spark] = []
-        sparks_to_create = self.spark_count + random.randint(  # noqa: S311
-            -int(self.spark_count_deviation / 2),
-            int(self.spark_count_deviation / 2),
+    def emit_sparks(self, spark_system: SparkSystem) -> None:
+        sparks_to_create = self.spark_count + int(
+            rng.integers(
+                -int(self.spark_count_deviation / 2),
+                int(self.spark_count_deviation / 2),
+                endpoint=True,
+            ),
         )
-        for _ in range(sparks_to_create):
-            spark_list.append(
-                Spark(
-                    loc=(
-                        self.pos[0]
-                        + random.randint(-self.pos_deviation[0], self.pos_deviation[0]),
-                        self.pos[1]
-                        + random.randint(-self.pos_deviation[1], self.pos_deviation[1]),
-                    ),
-                    angle=math.radians(
-                        random.uniform(self.shape.angle_min, self.shape.angle_max),
-                    ),
-                    base_speed=random.uniform(
-                        self.behavior.speed_min,
-                        self.behavior.speed_max,
-                    ),
-                    friction=random.uniform(
-                        self.behavior.friction_min,
-                        self.behavior.friction_max,
-                    ),
-                    color=random.sample(self.style.colors, 1)[0],
-                    scale=self.behavior.scale,
-                    speed_multiplier=self.behavior.speed_multiplier,
+        spark_system.emit(
+            loc_x=self.pos[0]
+            + rng.integers(
+                -self.pos_deviation[0],
+                self.pos_deviation[0],
+                size=sparks_to_create,
+                endpoint=True,
+            ),
+            loc_y=self.pos[1]
+            + rng.integers(
+                -self.pos_deviation[1],
+                self.pos_deviation[1],
+                size=sparks_to_create,
+                endpoint=True,
+            ),
+            angle=np.radians(
+                rng.uniform(
+                    min(self.shape.angle_min, self.shape.angle_max),
+                    max(self.shape.angle_min, self.shape.angle_max),
+                    size=sparks_to_create,
                 ),
-            )
-        return spark_list
+            ),
+            base_speed=rng.uniform(
+                self.behavior.speed_min,
+                self.behavior.speed_max,
+                size=sparks_to_create,
+            ),
+            friction=rng.uniform(
+                self.behavior.friction_min,
+                self.behavior.friction_max,
+                size=sparks_to_create,
+            ),
+            color=np.array(self.style.colors, dtype=np.uint8)[
+                rng.integers(len(self.style.colors), size=sparks_to_create)
+            ],
+            scale=self.behavior.scale,
+            speed_multiplier=self.behavior.speed_multiplier,
+        )
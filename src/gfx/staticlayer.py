@@ -0,0 +1,169 @@
+"""Static layer."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import pygame as pg
+import pygame.gfxdraw
+
+from src.color_constants import GRAY, RED1, TY_BG, WHITE
+from src.config import Config
+from src.gfx.dirtyrects import DirtyRects
+from src.track.track import TrackType
+from src.utils.frametimer import SystemKind, timed_system
+
+if TYPE_CHECKING:
+    from src.field import Field
+    from src.track.track import Track
+
+
+# Tiles and placed tracks are drawn below trains; rocks, station bodies, painters and
+# splitters above them. Both layers are rebuilt only after invalidate(), and only the
+# invalidated cells are pushed to the display unless the whole layer was invalidated.
+class StaticLayer:
+    is_dirty: ClassVar[bool] = True
+    changed_rects: ClassVar[list[pg.Rect] | None] = None
+    below_trains: ClassVar[pg.Surface | None] = None
+    above_trains: ClassVar[pg.Surface | None] = None
+
+    @staticmethod
+    def invalidate(rect: pg.Rect | None = None) -> None:
+        """Mark the layer for a rebuild, changed within `rect` or everywhere."""
+        if rect is None:
+            StaticLayer.changed_rects = None
+        elif StaticLayer.changed_rects is not None:
+            StaticLayer.changed_rects.append(rect)
+            # Headless runs flip tracks without ever rebuilding the layer.
+            if len(StaticLayer.changed_rects) > Config.NUM_CELLS_X * Config.NUM_CELLS_Y:
+                StaticLayer.changed_rects = None
+        StaticLayer.is_dirty = True
+
+    @staticmethod
+    def rebuild(field: Field, screen_size: tuple[int, int]) -> None:
+        below_trains = pg.Surface(screen_size).convert()
+        below_trains.fill(TY_BG)
+        field.grid.drawbles.sprites.draw(below_trains)
+        tracks = [
+            track
+            for drawble in field.grid.drawbles.items
+            for track in drawble.cell_tracks
+        ]
+        below_trains.blits(
+            [(track.image, track.cell_rect) for track in tracks if track.image],
+            doreturn=False,
+        )
+        if Config.DRAW_ARCS:
+            for track in tracks:
+                draw_arcs_and_endpoints(below_trains, track)
+
+        above_trains = pg.Surface(
+            (field.width_px, field.height_px),
+            pg.SRCALPHA,
+        ).convert_alpha()
+        above_trains.blits(
+            [
+                (
+                    sprite.image,
+                    pg.Rect(sprite.rect).move(-Config.PADDING_X, -Config.PADDING_Y),
+                )
+                for holder in [
+                    field.grid.rocks,
+                    field.grid.departures,
+                    field.grid.arrivals,
+                    field.grid.painters,
+                    field.grid.splitters,
+                ]
+                for sprite in holder.sprites
+                if sprite.image is not None and sprite.rect is not None
+            ],
+            doreturn=False,
+        )
+
+        StaticLayer.below_trains = below_trains
+        StaticLayer.above_trains = above_trains
+        if StaticLayer.changed_rects is None:
+            DirtyRects.add_full()
+        else:
+            for rect in StaticLayer.changed_rects:
+                DirtyRects.add(rect)
+        StaticLayer.is_dirty = False
+        StaticLayer.changed_rects = []
+
+    @staticmethod
+    @timed_system(SystemKind.DRAW)
+    def draw_below_trains(field: Field, screen_surface: pg.Surface) -> None:
+        if StaticLayer.is_dirty or StaticLayer.below_trains is None:
+            StaticLayer.rebuild(field, screen_surface.get_size())
+        if StaticLayer.below_trains is not None:
+            screen_surface.blit(StaticLayer.below_trains, (0, 0))
+
+    @staticmethod
+    @timed_system(SystemKind.DRAW)
+    def draw_above_trains(screen_surface: pg.Surface) -> None:
+        if StaticLayer.above_trains is not None:
+            screen_surface.blit(
+                StaticLayer.above_trains,
+                (Config.PADDING_X, Config.PADDING_Y),
+            )
+
+
+def draw_arcs_and_endpoints(surface: pg.Surface, track: Track) -> None:
+    color = WHITE if track.bright else GRAY
+    if track.track_type == TrackType.VERT:
+        pg.draw.line(
+            surface,
+            color,
+            track.cell_rect.midtop,
+            track.cell_rect.midbottom,
+        )
+    elif track.track_type == TrackType.HORI:
+        pg.draw.line(
+            surface,
+            color,
+            track.cell_rect.midleft,
+            track.cell_rect.midright,
+        )
+    elif track.track_type == TrackType.TOP_RIGHT:
+        pygame.gfxdraw.arc(
+            surface,
+            track.cell_rect.right,
+            track.cell_rect.top,
+            int(Config.CELL_SIZE / 2),
+            90,
+            180,
+            color,
+        )
+    elif track.track_type == TrackType.TOP_LEFT:
+        pygame.gfxdraw.arc(
+            surface,
+            track.cell_rect.left,
+            track.cell_rect.top,
+            int(Config.CELL_SIZE / 2),
+            0,
+            90,
+            color,
+        )
+    elif track.track_type == TrackType.BOTTOM_LEFT:
+        pygame.gfxdraw.arc(
+            surface,
+            track.cell_rect.left,
+            track.cell_rect.bottom,
+            int(Config.CELL_SIZE / 2),
+            270,
+            360,
+            color,
+        )
+    elif track.track_type == TrackType.BOTTOM_RIGHT:
+        pygame.gfxdraw.arc(
+            surface,
+            track.cell_rect.right,
+            track.cell_rect.bottom,
+            int(Config.CELL_SIZE / 2),
+            180,
+            270,
+            color,
+        )
+
+    for endpoint in track.endpoints:
+        pygame.gfxdraw.pixel(surface, int(endpoint.x), int(endpoint.y), RED1)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from src.config import Config
 from src.itemholders import (
     ArrivalHolder,
     DepartureHolder,
@@ -16,6 +17,9 @@ from src.levelitems.painter import Painter
 from src.levelitems.rock import Rock
 from src.levelitems.splitter import Splitter
 from src.levelitems.station import ArrivalStation, DepartureStation
+from src.track.graph import TrackGraph
+
+GridCell = Rock | Drawable | ArrivalStation | DepartureStation | Painter | Splitter
 
 
 class Grid:
@@ -28,14 +32,11 @@ class Grid:
         self.splitters = SplitterHolder()
         self.trains = TrainHolder()
 
-        self.all_items: list[
-            Rock | Drawable | ArrivalStation | DepartureStation | Painter | Splitter
-        ] = []
+        self.all_items: list[GridCell] = []
+        self.cells: dict[tuple[int, int], GridCell] = {}
+        self.track_graph = TrackGraph()
 
-    def add(
-        self,
-        item: ArrivalStation | DepartureStation | Rock | Drawable | Painter | Splitter,
-    ) -> None:
+    def add(self, item: GridCell) -> None:
         if isinstance(item, ArrivalStation):
             self.arrivals.add_one(item)
             self.all_items.append(item)
@@ -57,3 +58,19 @@ class Grid:
         else:
             msg = f"Did not find a holder for item of type {type(item)}"
             raise TypeError(msg)
+        self.cells[item.pos.as_tuple_int()] = item
+        self.track_graph.update_cell(item)
+
+    def get_cell(self, i: int, j: int) -> GridCell | None:
+        return self.cells.get((i, j))
+
+
+def cell_coords_at_pixel(x: float, y: float) -> tuple[int, int]:
+    """Return the (i, j) coordinates of the cell under a screen pixel.
+
+    Pixels outside the field map to coordinates that have no cell.
+    """
+    return (
+        int((x - Config.PADDING_X) // Config.CELL_SIZE),
+        int((y - Config.PADDING_Y) // Config.CELL_SIZE),
+    )
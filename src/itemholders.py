@@ -19,84 +19,120 @@ class DrawingCellHolder:
     def __init__(self) -> None:
         self.items: list[Drawable] = []
         self.sprites: pg.sprite.Group[pg.sprite.Sprite] = pg.sprite.Group()
+        self.by_coords: dict[tuple[int, int], Drawable] = {}
 
     def add_one(self, item: Drawable) -> None:
         self.items.append(item)
         self.sprites.add(item)
+        self.by_coords[item.pos.as_tuple_int()] = item
+
+    def get_at(self, i: int, j: int) -> Drawable | None:
+        return self.by_coords.get((i, j))
 
     def remove_all(self) -> None:
         self.items.clear()
         self.sprites.empty()
+        self.by_coords.clear()
 
 
 class RockHolder:
     def __init__(self) -> None:
         self.items: list[Rock] = []
         self.sprites: pg.sprite.Group[pg.sprite.Sprite] = pg.sprite.Group()
+        self.by_coords: dict[tuple[int, int], Rock] = {}
 
     def add_one(self, item: Rock) -> None:
         self.items.append(item)
         self.sprites.add(item)
+        self.by_coords[item.pos.as_tuple_int()] = item
+
+    def get_at(self, i: int, j: int) -> Rock | None:
+        return self.by_coords.get((i, j))
 
     def remove_all(self) -> None:
         self.items.clear()
         self.sprites.empty()
+        self.by_coords.clear()
 
 
 class ArrivalHolder:
     def __init__(self) -> None:
         self.items: list[ArrivalStation] = []
         self.sprites: pg.sprite.Group[pg.sprite.Sprite] = pg.sprite.Group()
+        self.by_coords: dict[tuple[int, int], ArrivalStation] = {}
 
     def add_one(self, item: ArrivalStation) -> None:
         self.items.append(item)
         self.sprites.add(item)
+        self.by_coords[item.pos.as_tuple_int()] = item
+
+    def get_at(self, i: int, j: int) -> ArrivalStation | None:
+        return self.by_coords.get((i, j))
 
     def remove_all(self) -> None:
         self.items.clear()
         self.sprites.empty()
+        self.by_coords.clear()
 
 
 class DepartureHolder:
     def __init__(self) -> None:
         self.items: list[DepartureStation] = []
         self.sprites: pg.sprite.Group[pg.sprite.Sprite] = pg.sprite.Group()
+        self.by_coords: dict[tuple[int, int], DepartureStation] = {}
 
     def add_one(self, item: DepartureStation) -> None:
         self.items.append(item)
         self.sprites.add(item)
+        self.by_coords[item.pos.as_tuple_int()] = item
+
+    def get_at(self, i: int, j: int) -> DepartureStation | None:
+        return self.by_coords.get((i, j))
 
     def remove_all(self) -> None:
         self.items.clear()
         self.sprites.empty()
+        self.by_coords.clear()
 
 
 class PainterHolder:
     def __init__(self) -> None:
         self.items: list[Painter] = []
         self.sprites: pg.sprite.Group[pg.sprite.Sprite] = pg.sprite.Group()
+        self.by_coords: dict[tuple[int, int], Painter] = {}
 
     def add_one(self, item: Painter) -> None:
         self.items.append(item)
         self.sprites.add(item)
+        self.by_coords[item.pos.as_tuple_int()] = item
+
+    def get_at(self, i: int, j: int) -> Painter | None:
+        return self.by_coords.get((i, j))
 
     def remove_all(self) -> None:
         self.items.clear()
         self.sprites.empty()
+        self.by_coords.clear()
 
 
 class SplitterHolder:
     def __init__(self) -> None:
         self.items: list[Splitter] = []
         self.sprites: pg.sprite.Group[pg.sprite.Sprite] = pg.sprite.Group()
+        self.by_coords: dict[tuple[int, int], Splitter] = {}
 
     def add_one(self, item: Splitter) -> None:
         self.items.append(item)
         self.sprites.add(item)
+        self.by_coords[item.pos.as_tuple_int()] = item
+
+    def get_at(self, i: int, j: int) -> Splitter | None:
+        return self.by_coords.get((i, j))
 
     def remove_all(self) -> None:
         self.items.clear()
         self.sprites.empty()
+        self.by_coords.clear()
 
 
 class TrainHolder:
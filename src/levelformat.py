@@ -0,0 +1,214 @@
+"""Level file formats.
+
+Levels are stored either as the hand-editable CSV under `assets/levels`, optionally
+with a `name.tracks.csv` layout of placed tracks next to them, or in a binary format
+that holds both. The binary format is a fixed header followed by packed cell and
+track records, which are mapped straight into NumPy arrays without any parsing:
+
+    header  magic "TYLV", version (u16), width (u16), height (u16), track count (u32)
+    cells   width * height records in row order: type (ASCII byte), color (u8),
+            count (u16), angle (u16)
+    tracks  track count records in placement order: x (u16), y (u16), type (u8)
+
+Colors are indices into `TrainColor`; cells without a color or angle use the
+NO_COLOR and NO_ANGLE sentinels. All values are little-endian.
+"""
+
+from __future__ import annotations
+
+import csv
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.coordinate import Coordinate
+from src.saveable import Saveable, SaveableAttributes
+from src.track.track import TrackType
+from src.traincolor import TrainColor
+
+LEVEL_BINARY_SUFFIX = ".tylv"
+TRACK_LAYOUT_SUFFIX = ".tracks.csv"
+
+MAGIC = b"TYLV"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHI")
+CELL_DTYPE = np.dtype(
+    [("type", "S1"), ("color", "<u1"), ("count", "<u2"), ("angle", "<u2")],
+)
+TRACK_DTYPE = np.dtype([("x", "<u2"), ("y", "<u2"), ("track_type", "<u1")])
+NO_COLOR = 0xFF
+NO_ANGLE = 0xFFFF
+
+COLORS = list(TrainColor)
+
+
+@dataclass
+class LevelData:
+    cells: np.ndarray
+    tracks: np.ndarray
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+
+def read_level_binary(level_path: str | Path) -> LevelData:
+    return parse_level_binary(Path(level_path).read_bytes(), str(level_path))
+
+
+def parse_level_binary(data: bytes, source: str) -> LevelData:
+    magic, version, width, height, num_tracks = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        msg = f"'{source}' is not a binary level"
+        raise ValueError(msg)
+    if version != VERSION:
+        msg = f"Unsupported binary level version {version} in '{source}'"
+        raise ValueError(msg)
+    cells = np.frombuffer(
+        data,
+        dtype=CELL_DTYPE,
+        count=width * height,
+        offset=HEADER.size,
+    ).reshape(height, width)
+    tracks = np.frombuffer(
+        data,
+        dtype=TRACK_DTYPE,
+        count=num_tracks,
+        offset=HEADER.size + cells.nbytes,
+    )
+    return LevelData(cells, tracks)
+
+
+def level_to_bytes(level: LevelData) -> bytes:
+    header = HEADER.pack(MAGIC, VERSION, level.width, level.height, len(level.tracks))
+    return (
+        header
+        + level.cells.astype(CELL_DTYPE).tobytes()
+        + level.tracks.astype(TRACK_DTYPE).tobytes()
+    )
+
+
+def write_level_binary(level_path: str | Path, level: LevelData) -> None:
+    Path(level_path).write_bytes(level_to_bytes(level))
+
+
+def saveable_from_record(
+    block_type: bytes,
+    color: int,
+    count: int,
+    angle: int,
+) -> Saveable:
+    return Saveable.from_values(
+        block_type.decode("ascii"),
+        count,
+        None if color == NO_COLOR else COLORS[color],
+        None if angle == NO_ANGLE else angle,
+    )
+
+
+def saveable_to_record(saveable: Saveable) -> tuple[bytes, int, int, int]:
+    color: TrainColor | None = getattr(saveable, "color", None)
+    angle: int | None = getattr(saveable, "angle", None)
+    return (
+        str(saveable.type).encode("ascii"),
+        NO_COLOR if color is None else COLORS.index(color),
+        saveable.num_goals,
+        NO_ANGLE if angle is None else angle,
+    )
+
+
+def serialize_saveable(saveable: Saveable) -> str:
+    color: TrainColor | None = getattr(saveable, "color", None)
+    angle: int | str = getattr(saveable, "angle", "")
+    if color is None:
+        return SaveableAttributes(
+            block_type=str(saveable.type),
+            angle=angle,
+        ).serialize()
+    return SaveableAttributes(
+        block_type=str(saveable.type),
+        number=saveable.num_goals,
+        color=color,
+        angle=angle,
+    ).serialize()
+
+
+def track_layout_path(level_path: Path) -> Path:
+    return level_path.with_name(level_path.stem + TRACK_LAYOUT_SUFFIX)
+
+
+def load_track_layout(layout_path: Path) -> list[tuple[Coordinate, TrackType]]:
+    layout: list[tuple[Coordinate, TrackType]] = []
+    with layout_path.open(newline="", encoding="utf-8") as layout_file:
+        for row in csv.reader(layout_file, delimiter=";"):
+            if not row:
+                continue
+            x, y, track_type = row
+            layout.append((Coordinate(int(x), int(y)), TrackType[track_type.strip()]))
+    return layout
+
+
+def write_track_layout(
+    layout_path: Path,
+    layout: list[tuple[Coordinate, TrackType]],
+) -> None:
+    with layout_path.open("w", newline="", encoding="utf-8") as layout_file:
+        writer = csv.writer(layout_file, delimiter=";")
+        for pos, track_type in layout:
+            writer.writerow([pos.x, pos.y, track_type.name])
+
+
+def read_level_csv(csv_path: Path) -> LevelData:
+    """Read a CSV level, and its track layout if it has one."""
+    with csv_path.open(newline="", encoding="utf-8") as level_file:
+        rows = [
+            [saveable_to_record(Saveable(item)) for item in row[0].split("-")]
+            for row in csv.reader(level_file, delimiter=";")
+            if row
+        ]
+    layout_path = track_layout_path(csv_path)
+    layout = load_track_layout(layout_path) if layout_path.exists() else []
+    return LevelData(
+        np.array(rows, dtype=CELL_DTYPE),
+        np.array(
+            [(pos.x, pos.y, track_type.value) for pos, track_type in layout],
+            dtype=TRACK_DTYPE,
+        ),
+    )
+
+
+def read_level_file(level_path: Path) -> LevelData:
+    if level_path.suffix == LEVEL_BINARY_SUFFIX:
+        return read_level_binary(level_path)
+    return read_level_csv(level_path)
+
+
+def csv_to_binary(csv_path: Path, binary_path: Path) -> None:
+    """Pack a CSV level, and its track layout if it has one, into a binary level."""
+    write_level_binary(binary_path, read_level_csv(csv_path))
+
+
+def binary_to_csv(binary_path: Path, csv_path: Path) -> None:
+    """Unpack a binary level into a CSV level and, if it has tracks, a track layout."""
+    level = read_level_binary(binary_path)
+    csv_path.write_text(
+        "\n".join(
+            "-".join(serialize_saveable(saveable_from_record(*cell)) for cell in row)
+            for row in level.cells.tolist()
+        ),
+        encoding="utf-8",
+    )
+    if len(level.tracks) > 0:
+        write_track_layout(
+            track_layout_path(csv_path),
+            [
+                (Coordinate(x, y), TrackType(track_type))
+                for x, y, track_type in level.tracks.tolist()
+            ],
+        )
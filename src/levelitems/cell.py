@@ -7,6 +7,7 @@ import pygame as pg
 from src.config import Config
 from src.coordinate import Coordinate
 from src.direction import Direction
+from src.gfx.graphics import Graphics
 from src.user.control import UserControl
 from src.utils.utils import setup_logging
 
@@ -22,13 +23,13 @@ class Cell(pg.sprite.Sprite):
     def __init__(
         self,
         pos: Coordinate,
-        image: pg.Surface,
+        sprite: str,
         angle: int,
     ) -> None:
         super().__init__()
         self.pos = pos
         self.angle = angle
-        self.image = pg.transform.rotate(image, angle)
+        self.image = Graphics.get_rotated(sprite, angle)
         self.rect: pg.Rect = self.image.get_rect()
         self.rect.x = self.pos.x * Config.CELL_SIZE + Config.PADDING_X
         self.rect.y = self.pos.y * Config.CELL_SIZE + Config.PADDING_Y
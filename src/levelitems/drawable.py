@@ -1,10 +1,8 @@
 """Drawable cell."""
 
 from src.coordinate import Coordinate
-from src.gfx.graphics import Graphics
 from src.levelitems.cell import Cell
 from src.saveable import SaveableAttributes
-from src.sound import Sound
 from src.track.track import TrackType
 
 MAXIMUM_TRACKS = 2
@@ -12,7 +10,7 @@ MAXIMUM_TRACKS = 2
 
 class Drawable(Cell):
     def __init__(self, coords: Coordinate) -> None:
-        super().__init__(coords, Graphics.img_surfaces["bg_tile"], 0)
+        super().__init__(coords, "bg_tile", 0)
         self.saveable_attributes = SaveableAttributes(block_type="E")
 
     def unflippable_tracks(self, track_types: list[TrackType]) -> bool:
@@ -28,13 +26,13 @@ class Drawable(Cell):
             or (TrackType.VERT in track_types and TrackType.HORI in track_types)
         )
 
-    def flip_tracks(self) -> None:
+    def flip_tracks(self) -> bool:
         if len(self.cell_tracks) < MAXIMUM_TRACKS:
-            return
+            return False
         track_types = [track.track_type for track in self.cell_tracks]
         if self.unflippable_tracks(track_types):
-            return
+            return False
         for track in self.cell_tracks:
             track.toggle_bright()
         self.cell_tracks.reverse()
-        Sound.play_sound_on_any_channel(Sound.track_flip)
+        return True
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from src.config import Config
-from src.gfx.graphics import Graphics
 from src.levelitems.cell import Cell
 from src.saveable import SaveableAttributes
 from src.track.track import Track, TrackType
@@ -20,7 +19,7 @@ logger = setup_logging(log_level=Config.LOG_LEVEL)
 
 class Painter(Cell):
     def __init__(self, coords: Coordinate, angle: int, color: TrainColor) -> None:
-        super().__init__(coords, Graphics.img_surfaces["painter"], angle)
+        super().__init__(coords, "painter", angle)
         self.color = color
         self.saveable_attributes = SaveableAttributes(
             block_type="P",
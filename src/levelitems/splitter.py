@@ -2,7 +2,6 @@
 
 from src.config import Config
 from src.coordinate import Coordinate
-from src.gfx.graphics import Graphics
 from src.levelitems.cell import Cell
 from src.saveable import SaveableAttributes
 from src.track.track import InsideTrack, TrackType
@@ -13,7 +12,7 @@ logger = setup_logging(log_level=Config.LOG_LEVEL)
 
 class Splitter(Cell):
     def __init__(self, coords: Coordinate, angle: int) -> None:
-        super().__init__(coords, Graphics.img_surfaces["splitter"], angle)
+        super().__init__(coords, "splitter", angle)
         self.saveable_attributes = SaveableAttributes(block_type="S", angle=self.angle)
 
         if self.angle in [0, 180]:
@@ -11,7 +11,6 @@ from src.direction import Direction
 from src.gfx.graphics import Graphics
 from src.levelitems.cell import Cell
 from src.saveable import SaveableAttributes
-from src.sound import Sound
 from src.track.track import InsideTrack, Track, TrackType
 from src.train.train import Train
 from src.traincolor import TrainColor
@@ -22,11 +21,16 @@ if TYPE_CHECKING:
 
 logger = setup_logging(log_level=Config.LOG_LEVEL)
 
+# Goal sprites are placed around the station by rotating the goal image.
+GOAL_SPRITE_ANGLES = (0, -90, 90, 180)
+
 
 class StationGoalSprite(pg.sprite.Sprite):
     def __init__(self, color: str, place: int, parent_rect: pg.Rect) -> None:
         super().__init__()
-        self.image = Graphics.img_surfaces[f"{color}_goal_{place}"]
+        # There are only four goal sprite positions, so larger counts wrap around.
+        angle = GOAL_SPRITE_ANGLES[(place - 1) % len(GOAL_SPRITE_ANGLES)]
+        self.image = Graphics.get_rotated("goal", angle, color)
         self.rect = parent_rect
 
 
@@ -41,13 +45,13 @@ class Station(Cell):
     def __init__(
         self,
         coords: Coordinate,
-        image: pg.Surface,
+        sprite: str,
         angle: int,
         number_of_trains_left: int,
         train_color: TrainColor,
         block_short_char: str,
     ) -> None:
-        super().__init__(coords, image, angle)
+        super().__init__(coords, sprite, angle)
         self.number_of_trains_left = number_of_trains_left
         self.train_color = train_color
         self.original_number_of_trains = number_of_trains_left
@@ -116,7 +120,7 @@ class DepartureStation(Station):
     ) -> None:
         super().__init__(
             coords=coords,
-            image=Graphics.img_surfaces["departure"],
+            sprite="departure",
             angle=angle,
             number_of_trains_left=number_of_trains_left,
             train_color=train_color,
@@ -134,7 +138,6 @@ class DepartureStation(Station):
         self.goals.pop().kill()
         logger.debug("Train released.")
         self.last_release_tick = current_tick
-        Sound.play_sound_on_any_channel(Sound.pop)
         return Train(
             self.pos,
             self.train_color,
@@ -153,7 +156,7 @@ class ArrivalStation(Station):
     ) -> None:
         super().__init__(
             coords=coords,
-            image=Graphics.img_surfaces["arrival"],
+            sprite="arrival",
             angle=angle,
             number_of_trains_left=number_of_trains_left,
             train_color=train_color,
@@ -0,0 +1,146 @@
+"""Level packs.
+
+A level pack holds many binary levels (see `levelformat`) in one file behind an index,
+so the game can list and load levels without scanning a directory or opening a file
+per level. The pack is memory-mapped and only the pages that are read get loaded:
+listing levels reads the index and loading a level reads only that level's bytes.
+
+    header  magic "TYLP", version (u16), level count (u32)
+    index   level count records: offset (u64), size (u32), width (u16),
+            height (u16), track count (u32), name (32 bytes, UTF-8, NUL-padded)
+    levels  the binary levels back to back, at the offsets given in the index
+
+All values are little-endian.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.levelformat import level_to_bytes, parse_level_binary, read_level_file
+
+if TYPE_CHECKING:
+    from src.levelformat import LevelData
+
+LEVEL_PACK_SUFFIX = ".tylp"
+
+PACK_MAGIC = b"TYLP"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sHI")
+NAME_SIZE = 32
+INDEX_DTYPE = np.dtype(
+    [
+        ("offset", "<u8"),
+        ("size", "<u4"),
+        ("width", "<u2"),
+        ("height", "<u2"),
+        ("num_tracks", "<u4"),
+        ("name", f"S{NAME_SIZE}"),
+    ],
+)
+
+
+@dataclass(frozen=True)
+class LevelInfo:
+    index: int
+    name: str
+    width: int
+    height: int
+    num_tracks: int
+
+
+class LevelPack:
+    def __init__(self, pack_path: str | Path) -> None:
+        self.path = Path(pack_path)
+        with self.path.open("rb") as pack_file:
+            self._mmap = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, num_levels = PACK_HEADER.unpack_from(self._mmap)
+        if magic != PACK_MAGIC:
+            msg = f"'{self.path}' is not a level pack"
+            raise ValueError(msg)
+        if version != PACK_VERSION:
+            msg = f"Unsupported level pack version {version} in '{self.path}'"
+            raise ValueError(msg)
+        # Slicing the map copies, so the index does not pin the map open.
+        self.index = np.frombuffer(
+            self._mmap[
+                PACK_HEADER.size : PACK_HEADER.size + num_levels * INDEX_DTYPE.itemsize
+            ],
+            dtype=INDEX_DTYPE,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of levels in the pack."""
+        return len(self.index)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def name(self, index: int) -> str:
+        return self.index[index]["name"].decode("utf-8")
+
+    def info(self, index: int) -> LevelInfo:
+        entry = self.index[index]
+        return LevelInfo(
+            index=index,
+            name=entry["name"].decode("utf-8"),
+            width=int(entry["width"]),
+            height=int(entry["height"]),
+            num_tracks=int(entry["num_tracks"]),
+        )
+
+    def read_level(self, index: int) -> LevelData:
+        entry = self.index[index]
+        offset = int(entry["offset"])
+        return parse_level_binary(
+            self._mmap[offset : offset + int(entry["size"])],
+            f"{self.path}[{index}]",
+        )
+
+
+def write_level_pack(pack_path: Path, levels: list[tuple[str, LevelData]]) -> None:
+    index = np.zeros(len(levels), dtype=INDEX_DTYPE)
+    blobs: list[bytes] = []
+    offset = PACK_HEADER.size + index.nbytes
+    for i, (name, level) in enumerate(levels):
+        encoded_name = name.encode("utf-8")
+        if len(encoded_name) > NAME_SIZE:
+            msg = f"Level name '{name}' is longer than {NAME_SIZE} bytes"
+            raise ValueError(msg)
+        blob = level_to_bytes(level)
+        index[i] = (
+            offset,
+            len(blob),
+            level.width,
+            level.height,
+            len(level.tracks),
+            encoded_name,
+        )
+        blobs.append(blob)
+        offset += len(blob)
+    with pack_path.open("wb") as pack_file:
+        pack_file.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(levels)))
+        pack_file.write(index.tobytes())
+        for blob in blobs:
+            pack_file.write(blob)
+
+
+def level_name_from_path(level_path: Path) -> str:
+    """Name a level after its file, e.g. `level_0.csv` becomes `Level 0`."""
+    return level_path.stem.replace("_", " ").capitalize()
+
+
+def pack_level_files(level_paths: list[Path], pack_path: Path) -> None:
+    write_level_pack(
+        pack_path,
+        [
+            (level_name_from_path(level_path), read_level_file(level_path))
+            for level_path in level_paths
+        ],
+    )
@@ -0,0 +1,70 @@
+"""Level preloader."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from src.config import Config
+from src.field import Field
+from src.utils.utils import setup_logging
+
+if TYPE_CHECKING:
+    from src.grid import Grid
+    from src.levelpack import LevelPack
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+
+def build_grid(level_pack: LevelPack, level: int) -> Grid:
+    field = Field(level=level, level_pack=level_pack)
+    field.initialize_grid()
+    return field.grid
+
+
+class LevelPreloader:
+    # Builds the grids of the levels next to the current one on a worker thread, so
+    # switching to one of them only has to swap its grid in. A grid is handed out
+    # once and never reused, since the player edits it while the level is live.
+    def __init__(self, level_pack: LevelPack) -> None:
+        self.level_pack = level_pack
+        self.executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="level-preloader",
+        )
+        self.pending: dict[int, Future[Grid]] = {}
+
+    def preload_around(self, level: int) -> None:
+        wanted = {
+            neighbor
+            for neighbor in (level - 1, level + 1)
+            if 0 <= neighbor < len(self.level_pack)
+        }
+        for stale_level in set(self.pending) - wanted:
+            self.pending.pop(stale_level).cancel()
+        for new_level in wanted - set(self.pending):
+            self.request(new_level)
+
+    def request(self, level: int) -> None:
+        if level not in self.pending:
+            self.pending[level] = self.executor.submit(
+                build_grid,
+                self.level_pack,
+                level,
+            )
+
+    def take(self, level: int) -> Grid | None:
+        """Return the grid of `level` if it has been built, else request it."""
+        future = self.pending.get(level)
+        if future is None:
+            logger.info(f"Level {level} was not preloaded, building it now")
+            self.request(level)
+            return None
+        if not future.done():
+            return None
+        del self.pending[level]
+        return future.result()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.pending.clear()
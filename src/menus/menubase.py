@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from src.color_constants import (
     GRAY5,
@@ -15,6 +15,7 @@ from src.color_constants import (
 )
 from src.config import Config
 from src.font import Font
+from src.gfx.dirtyrects import DirtyRects
 from src.utils.utils import setup_logging
 
 if TYPE_CHECKING:
@@ -78,18 +79,25 @@ class IndicatorItem:
         self.dest: tuple[int, int] = dest
 
         self.activated: bool = False
-        self.render()
+        self._renderable: pg.Surface | None = None
+
+    @property
+    def renderable(self) -> pg.Surface:
+        # Rendered on first draw, so building a menu does not render anything.
+        if self._renderable is None:
+            self.render()
+        return cast("pg.Surface", self._renderable)
 
     def render(self) -> None:
         if self.activated:
-            self.renderable = self.font.render(
+            self._renderable = self.font.render(
                 f"{self.text:^{len(self.text) + 2 * self.padding_spaces}}",
                 antialias=True,
                 color=self.style.fg_active_color,
                 bgcolor=self.style.bg_active_color,
             )
         else:
-            self.renderable = self.font.render(
+            self._renderable = self.font.render(
                 f"{self.text:^{len(self.text) + 2 * self.padding_spaces}}",
                 antialias=True,
                 color=self.style.fg_deactive_color,
@@ -183,9 +191,16 @@ class BaseMenu:
         self.activate_item(next_item)
 
     def draw(self, screen_surface: pg.Surface) -> None:
-        screen_surface.blit(self.tooltip.surface, self.tooltip.dest)
+        drawn_rect = screen_surface.blit(self.tooltip.surface, self.tooltip.dest)
         for indicator_item in self._indicator_items:
-            screen_surface.blit(indicator_item.renderable, indicator_item.dest)
+            drawn_rect.union_ip(
+                screen_surface.blit(indicator_item.renderable, indicator_item.dest),
+            )
+        DirtyRects.add_if_changed(
+            self,
+            tuple((item.text, item.activated) for item in self._indicator_items),
+            drawn_rect,
+        )
 
     def mouse_on(self, mouse_pos: Coordinate) -> bool:
         # TODO: Get absolute position of tooltip and indicat items NOT on the fly.
@@ -221,18 +236,13 @@ class VerticalMenu(BaseMenu):
 
         self.tooltip = Tooltip(title, (self.topleft[0], self.topleft[1]))
 
-        self.indicator_items: list[IndicatorItem] = []
-
-        # TODO: Why on earth am I creating a list[IndicatorItem] again??
-        for i, menu_item in enumerate(menu_items):
-            self.indicator_items.append(
-                IndicatorItem(
-                    font=Font.normal,
-                    text=menu_item.text,
-                    padding_spaces=3,
-                    style=menu_item.style,
-                    dest=(self.topleft[0], self.topleft[1] + (i + 1) * self.row_height),
-                ),
+        self.indicator_items: list[IndicatorItem] = menu_items
+        for i, indicator_item in enumerate(self.indicator_items):
+            indicator_item.font = Font.normal
+            indicator_item.padding_spaces = 3
+            indicator_item.dest = (
+                self.topleft[0],
+                self.topleft[1] + (i + 1) * self.row_height,
             )
 
         super().__init__(self.topleft, self.tooltip, self.indicator_items)
@@ -253,21 +263,13 @@ class HorizontalMenu(BaseMenu):
 
         self.tooltip = Tooltip(title, (self.topleft[0], self.topleft[1]))
 
-        self.indicator_items: list[IndicatorItem] = []
-
-        # TODO: Why on earth am I creating a list[IndicatorItem] again??
-        for i, menu_item in enumerate(menu_items):
-            self.indicator_items.append(
-                IndicatorItem(
-                    font=Font.normal,
-                    text=menu_item.text,
-                    padding_spaces=3,
-                    style=menu_item.style,
-                    dest=(
-                        self.topleft[0] + i * self.row_width,
-                        self.topleft[1] + 1 * self.row_height,
-                    ),
-                ),
+        self.indicator_items: list[IndicatorItem] = menu_items
+        for i, indicator_item in enumerate(self.indicator_items):
+            indicator_item.font = Font.normal
+            indicator_item.padding_spaces = 3
+            indicator_item.dest = (
+                self.topleft[0] + i * self.row_width,
+                self.topleft[1] + 1 * self.row_height,
             )
 
         super().__init__(self.topleft, self.tooltip, self.indicator_items)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from src.config import Config
 from src.font import Font
 from src.menus.menubase import (
@@ -15,6 +17,9 @@ from src.menus.menubase import (
 )
 from src.utils.utils import setup_logging
 
+if TYPE_CHECKING:
+    from src.levelpack import LevelPack
+
 logger = setup_logging(log_level=Config.LOG_LEVEL)
 
 
@@ -92,19 +97,38 @@ class RunningCrashedCompleteMenu(VerticalMenu):
 
 
 class LevelMenu(VerticalMenu):
-    def __init__(self, topleft: tuple[int, int], num_levels: int) -> None:
+    # Shows a scrolling window of `num_rows` levels, so only the names in view are
+    # read from the level pack and rendered however many levels it holds.
+    def __init__(self, topleft: tuple[int, int], num_rows: int) -> None:
         title = "LEVEL (UP/DOWN)"
         menu_items: list[IndicatorItem] = [
             IndicatorItem(
-                text=f"Level {i}",
+                text="",
                 style=YellowStyle(),
                 padding_spaces=2,
                 dest=topleft,
                 font=Font.small,
             )
-            for i in range(num_levels)
+            for _ in range(num_rows)
         ]
         super().__init__(topleft, title, menu_items)
+        self.first_row_level = 0
+        self.selected_level = 0
+
+    def show_levels(self, level_pack: LevelPack) -> None:
+        num_rows = len(self.indicator_items)
+        if self.selected_level < self.first_row_level:
+            self.first_row_level = self.selected_level
+        elif self.selected_level >= self.first_row_level + num_rows:
+            self.first_row_level = self.selected_level - num_rows + 1
+        for row, indicator_item in enumerate(self.indicator_items):
+            level = self.first_row_level + row
+            text = level_pack.name(level) if level < len(level_pack) else ""
+            activated = level == self.selected_level
+            if indicator_item.text != text or indicator_item.activated != activated:
+                indicator_item.text = text
+                indicator_item.activated = activated
+                indicator_item.render()
 
 
 class InfoMenu(VerticalMenu):
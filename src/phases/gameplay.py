@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import csv
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import pygame as pg
-import pygame.gfxdraw
 from pygame.constants import (
     K_DOWN,
     K_F1,
+    K_F2,
+    K_F4,
     K_SPACE,
     K_UP,
     KEYDOWN,
@@ -20,10 +22,12 @@ from pygame.constants import (
     K_p,
 )
 
-from src.color_constants import GRAY, RED1, TY_BG, TY_GREEN, TY_RED, TY_TELLOW, WHITE
+from src.color_constants import TY_GREEN, TY_RED, TY_TELLOW
 from src.config import Config
-from src.direction import Direction, turn_left, turn_right
+from src.direction import Direction
 from src.field import Field, TrackType
+from src.gfx.dirtyrects import DirtyRects
+from src.gfx.framestatsoverlay import FrameStatsOverlay
 from src.gfx.spark import (
     CircleCloudShape,
     FastSmallShortLivedSpark,
@@ -33,6 +37,8 @@ from src.gfx.spark import (
     WeldingSparkStyle,
     WideConeCloudShape,
 )
+from src.gfx.staticlayer import StaticLayer
+from src.grid import cell_coords_at_pixel
 from src.levelitems.drawable import Drawable
 from src.levelitems.painter import Painter
 from src.levelitems.splitter import Splitter
@@ -49,11 +55,13 @@ from src.menus.menus import (
     RunningCrashedCompleteMenu,
 )
 from src.screen import Screen
+from src.simulation import engine
+from src.simulation.engine import EventType
 from src.sound import Sound
 from src.state import Phase, State
-from src.train.train import Train
-from src.traincolor import blend_train_colors
 from src.user.control import UserControl
+from src.utils.frametimer import SystemKind, timed_system
+from src.utils.tracing import Trace
 from src.utils.utils import setup_logging
 
 if TYPE_CHECKING:
@@ -61,28 +69,88 @@ if TYPE_CHECKING:
     from src.levelitems.rock import Rock
     from src.levelitems.splitter import Splitter
     from src.screen import Screen
-    from src.track.track import Track
+    from src.simulation.engine import SimulationEvent
 
 logger = setup_logging(log_level=Config.LOG_LEVEL)
 
 
-build_purge_menu = BuildPurgeMenu(topleft=(1 * 64, 16))
-edit_test_menu = EditTestMenu(topleft=(5 * 64, 16))
-running_crashed_complete_menu = RunningCrashedCompleteMenu(topleft=(10 * 64, 16))
-level_menu = LevelMenu(
-    topleft=(13 * 64, 16),
-    num_levels=6,
-)  # Hardcoded number of levels (for now).
-track_menu = InfoMenu(topleft=(1 * 64, 10 * 64 + 16), tooltip_text="TRACKS", value="")
-tick_menu = InfoMenu(topleft=(3 * 64, 10 * 64 + 16), tooltip_text="TICKS", value="")
-train_menu = InfoMenu(topleft=(5 * 64, 10 * 64 + 16), tooltip_text="TRAINS", value="")
-crash_menu = InfoMenu(topleft=(7 * 64, 10 * 64 + 16), tooltip_text="CRASHES", value="")
-spark_menu = InfoMenu(topleft=(9 * 64, 10 * 64 + 16), tooltip_text="SPARKS", value="")
-music_menu = InfoMenu(
-    topleft=(10 * 64, 9 * 64 + 16),
-    tooltip_text="MUSIC (P)",
-    value="",
-)
+class Menus:
+    # Built on first draw rather than on import. Unlike assets, menus hold UI state,
+    # so they are only built and used on the main thread.
+    LEVEL_STATUS_MENUS = (
+        "build_purge_menu",
+        "edit_test_menu",
+        "running_crashed_complete_menu",
+        "track_menu",
+        "tick_menu",
+        "train_menu",
+        "crash_menu",
+        "spark_menu",
+    )
+
+    def reset_level_status(self) -> None:
+        """Drop the menus showing the status of a level, to be rebuilt on next draw."""
+        for name in Menus.LEVEL_STATUS_MENUS:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def build_purge_menu(self) -> BuildPurgeMenu:
+        return BuildPurgeMenu(topleft=(1 * 64, 16))
+
+    @cached_property
+    def edit_test_menu(self) -> EditTestMenu:
+        return EditTestMenu(topleft=(5 * 64, 16))
+
+    @cached_property
+    def running_crashed_complete_menu(self) -> RunningCrashedCompleteMenu:
+        return RunningCrashedCompleteMenu(topleft=(10 * 64, 16))
+
+    @cached_property
+    def level_menu(self) -> LevelMenu:
+        return LevelMenu(topleft=(13 * 64, 16), num_rows=6)
+
+    @cached_property
+    def track_menu(self) -> InfoMenu:
+        return InfoMenu(topleft=(1 * 64, 10 * 64 + 16), tooltip_text="TRACKS", value="")
+
+    @cached_property
+    def tick_menu(self) -> InfoMenu:
+        return InfoMenu(topleft=(3 * 64, 10 * 64 + 16), tooltip_text="TICKS", value="")
+
+    @cached_property
+    def train_menu(self) -> InfoMenu:
+        return InfoMenu(topleft=(5 * 64, 10 * 64 + 16), tooltip_text="TRAINS", value="")
+
+    @cached_property
+    def crash_menu(self) -> InfoMenu:
+        return InfoMenu(
+            topleft=(7 * 64, 10 * 64 + 16),
+            tooltip_text="CRASHES",
+            value="",
+        )
+
+    @cached_property
+    def spark_menu(self) -> InfoMenu:
+        return InfoMenu(topleft=(9 * 64, 10 * 64 + 16), tooltip_text="SPARKS", value="")
+
+    @cached_property
+    def music_menu(self) -> InfoMenu:
+        return InfoMenu(
+            topleft=(10 * 64, 9 * 64 + 16),
+            tooltip_text="MUSIC (P)",
+            value="",
+        )
+
+    @cached_property
+    def speed_menu(self) -> InfoMenu:
+        return InfoMenu(
+            topleft=(12 * 64, 9 * 64 + 16),
+            tooltip_text="SPEED (+/-)",
+            value="",
+        )
+
+
+menus = Menus()
 
 
 def gameplay_phase(state: State, screen: Screen, field: Field) -> None:
@@ -92,45 +160,31 @@ def gameplay_phase(state: State, screen: Screen, field: Field) -> None:
 
 def execute_logic(state: State, field: Field) -> None:
     check_for_pg_gameplay_events()
-    check_for_level_change(field)
+    check_for_level_change(state, field)
     check_for_exit_command(state)
-    check_for_speed_change_command()
+    check_for_speed_change_command(state)
     check_and_set_delete_mode(state)
     check_and_save_field(field)
     check_and_toggle_profiling(state)
+    check_and_toggle_frame_stats()
+    check_and_write_trace()
     check_and_toggle_train_release(field)
     check_and_reset_gameplay(state, field)
 
     check_for_next_music_command()
 
-    check_and_flip_cell_tracks(field)  # if is_released: for cells, for trains
     check_for_track_flip_command(field)
     check_for_music_toggle_command()
-    tick_departures(field)  # if is_released: for departure_stations
-    check_train_departure_station_crashes(
-        field,
-    )  # if is_released: for trains, for departure_stations
-    select_tracks_for_trains(
-        field,
-    )  # if is_released: for trains, for track, for endpoint
-    delete_crashed_trains(field)  # if is_released: for trains
-    check_train_arrivals(field)  # if is_released: for trains, for arrival_stations
 
+    tick_simulation(state, field)  # if is_released: trains, stations, cells
     check_for_level_completion(state, field)  # if is_released
-    check_train_merges(field)  # if is_released: for trains
-
-    check_train_painters(field)
-    check_train_splitters(field)
 
     check_and_mark_prev_cell(field)  # if NOT is_released: for cells (UserControl)
     check_and_delete_field_tracks(state, field)  # if NOT is_released: for drawing cells
     check_for_new_track_placement(state, field)  # if NOT is_released
 
-    tick_trains(field)  # for trains
-
     check_for_mainmenu_command(state)
     determine_arrival_station_checkmarks(field)  # for arrival_stations
-    tick_field(field)
     update_field_border(state, field)
     update_menu_indicators(state, field)
 
@@ -138,58 +192,66 @@ def execute_logic(state: State, field: Field) -> None:
 
 
 def draw_game_objects(field: Field, screen: Screen) -> None:
-    draw_background_basecolor(screen)  # Background
-    field.grid.drawbles.sprites.draw(screen.surface)  # Empty cells (base).
-    draw_drawables_tracks(screen, field)  # Tracks (on empty cells).
-    field.grid.trains.sprites.draw(screen.surface)  # Trains.
-    field.grid.rocks.sprites.draw(screen.surface)
-
-    draw_stations(field, screen)  # Stations.
-    field.grid.painters.sprites.draw(screen.surface)
-    field.grid.splitters.sprites.draw(screen.surface)
+    StaticLayer.draw_below_trains(field, screen.surface)  # Background, cells, tracks.
+    draw_trains(field, screen)  # Trains.
+    StaticLayer.draw_above_trains(screen.surface)  # Rocks, stations, painters...
+
+    draw_station_goals(screen, field)
+    draw_checkmarks(screen, field)
     draw_field_border(field, screen)  # Field border.
-    draw_menus(screen)  # Menus.
+    draw_menus(screen)  # menus.
 
     draw_crash_sparks(field, screen)  # Crash sparks.
+    FrameStatsOverlay.draw(screen.surface)  # Frame stats (F2).
 
 
-def check_train_splitters(field: Field) -> None:
-    if field.current_tick == 0 or field.current_tick % 32 != 0:
-        return
-    trains_to_add: list[Train] = []
-    for train in field.grid.trains.items:
-        for splitter in field.grid.splitters.items:
-            if train.rect.center == splitter.rect.center:
-                logger.info("At center.")
-                new_train_1 = Train(
-                    train.loc,
-                    train.color,
-                    splitter.cell_tracks[1],
-                    direction=turn_left(train.direction),
-                )
-                new_train_1.rect.x = train.rect.x
-                new_train_1.rect.y = train.rect.y
-                trains_to_add.append(new_train_1)
-                train.selected_track = splitter.cell_tracks[2]
-                train.direction = turn_right(train.direction)
-                train.angle = train.direction.value
-                Sound.play_sound_on_any_channel(Sound.pop)
-
-    for new_train in trains_to_add:
-        field.grid.trains.items.append(new_train)
-        field.grid.trains.sprites.add(new_train)
+@timed_system(SystemKind.LOGIC)
+def tick_simulation(state: State, field: Field) -> None:
+    if field.is_released:
+        ticks_to_run = state.global_status.ticks_due * state.gameplay.speed_multiplier
+    else:
+        ticks_to_run = 1
+    for _ in range(ticks_to_run):
+        events = engine.tick(field)
+        handle_simulation_events(field, events)
+
+
+def handle_simulation_events(field: Field, events: list[SimulationEvent]) -> None:
+    for event in events:
+        if event.event_type == EventType.CRASH:
+            Sound.play_sound_on_any_channel(Sound.crash)
+            generate_crash_sparks(field, event.pos, event.angle)
+        elif event.event_type in [
+            EventType.RELEASE,
+            EventType.ARRIVAL,
+            EventType.SPLIT,
+        ]:
+            Sound.play_sound_on_any_channel(Sound.pop)
+        elif event.event_type in [EventType.MERGE, EventType.PAINT]:
+            Sound.play_sound_on_any_channel(Sound.merge)
+        elif event.event_type == EventType.FLIP:
+            Sound.play_sound_on_any_channel(Sound.track_flip)
+            drawble = field.grid.drawbles.get_at(*cell_coords_at_pixel(*event.pos))
+            if drawble is not None:
+                StaticLayer.invalidate(drawble.rect)
 
 
-def check_train_painters(field: Field) -> None:
+@timed_system(SystemKind.DRAW)
+def draw_trains(field: Field, screen: Screen) -> None:
     for train in field.grid.trains.items:
-        for painter in field.grid.painters.items:
-            if train.rect.center == painter.rect.center:
-                train.repaint(painter.color)
+        train.update_image()
+    field.grid.trains.sprites.draw(screen.surface)
+    # `Group.draw` returns no rects to update, so the trains' own rects are tracked.
+    DirtyRects.track(
+        "trains",
+        [train.rect.copy() for train in field.grid.trains.sprites],
+    )
 
 
+@timed_system(SystemKind.DRAW)
 def draw_crash_sparks(field: Field, screen: Screen) -> None:
-    for spark in field.sparks:
-        spark.draw(screen.surface)
+    spark_rect = field.sparks.draw(screen.surface)
+    DirtyRects.track("sparks", [] if spark_rect is None else [spark_rect])
 
 
 def get_solid_cells(
@@ -208,13 +270,15 @@ def get_solid_cells(
     return solid_cells
 
 
+@timed_system(SystemKind.LOGIC)
 def update_all_sparks(field: Field) -> None:
     solid_items = get_solid_cells(field)
     solid_rects: list[pg.Rect] = [solid_item.rect for solid_item in solid_items]
-    for i, spark in sorted(enumerate(field.sparks), reverse=True):
-        spark.move(1, pg.Rect(64, 128, field.width_px, field.height_px), solid_rects)
-        if not spark.alive:
-            field.sparks.pop(i)
+    field.sparks.update(
+        1,
+        pg.Rect(64, 128, field.width_px, field.height_px),
+        solid_rects,
+    )
 
 
 def generate_crash_sparks(field: Field, pos: tuple[int, int], angle: float) -> None:
@@ -227,9 +291,7 @@ def generate_crash_sparks(field: Field, pos: tuple[int, int], angle: float) -> N
         spark_count=20,
         spark_count_deviation=10,
     )
-    sparks = spark_cloud.emit_sparks()
-    for spark in sparks:
-        field.sparks.append(spark)
+    spark_cloud.emit_sparks(field.sparks)
 
 
 def generate_track_insert_sparks(field: Field, pos: tuple[int, int]) -> None:
@@ -242,34 +304,40 @@ def generate_track_insert_sparks(field: Field, pos: tuple[int, int]) -> None:
         spark_count=10,
         spark_count_deviation=2,
     )
-    sparks = spark_cloud.emit_sparks()
-    for spark in sparks:
-        field.sparks.append(spark)
+    spark_cloud.emit_sparks(field.sparks)
 
 
-def check_for_level_change(field: Field) -> None:
-    for i, indicator_item in enumerate(level_menu.indicator_items):
-        if indicator_item.activated and i != field.level:
-            field.load_level(i)
+@timed_system(SystemKind.LOGIC)
+def check_for_level_change(state: State, field: Field) -> None:
+    if menus.level_menu.selected_level != field.level and field.load_level(
+        menus.level_menu.selected_level,
+    ):
+        menus.reset_level_status()
+        state.profiler.level_loaded(field.level)
 
 
+@timed_system(SystemKind.DRAW)
 def draw_field_border(field: Field, screen: Screen) -> None:
-    field.border.draw(screen.surface)
+    border_rect = field.border.draw(screen.surface)
+    DirtyRects.add_if_changed(field.border, field.border.color, border_rect)
 
 
+@timed_system(SystemKind.DRAW)
 def draw_menus(screen: Screen) -> None:
-    build_purge_menu.draw(screen.surface)
-    edit_test_menu.draw(screen.surface)
-    running_crashed_complete_menu.draw(screen.surface)
-    level_menu.draw(screen.surface)
-    tick_menu.draw(screen.surface)
-    track_menu.draw(screen.surface)
-    train_menu.draw(screen.surface)
-    crash_menu.draw(screen.surface)
-    spark_menu.draw(screen.surface)
-    music_menu.draw(screen.surface)
-
-
+    menus.build_purge_menu.draw(screen.surface)
+    menus.edit_test_menu.draw(screen.surface)
+    menus.running_crashed_complete_menu.draw(screen.surface)
+    menus.level_menu.draw(screen.surface)
+    menus.tick_menu.draw(screen.surface)
+    menus.track_menu.draw(screen.surface)
+    menus.train_menu.draw(screen.surface)
+    menus.crash_menu.draw(screen.surface)
+    menus.spark_menu.draw(screen.surface)
+    menus.music_menu.draw(screen.surface)
+    menus.speed_menu.draw(screen.surface)
+
+
+@timed_system(SystemKind.LOGIC)
 def check_for_exit_command(state: State) -> None:
     for event in UserControl.events:
         if event.type == QUIT:
@@ -278,15 +346,20 @@ def check_for_exit_command(state: State) -> None:
             return
 
 
-def check_for_speed_change_command() -> None:
+@timed_system(SystemKind.LOGIC)
+def check_for_speed_change_command(state: State) -> None:
     if UserControl.just_released[pg.K_KP_PLUS]:
-        Config.SPEED = Config.SPEED * 2
-        logger.info(f"New speed: {Config.SPEED}")
+        state.gameplay.speed_multiplier = min(
+            state.gameplay.speed_multiplier * 2,
+            Config.MAX_SPEED_MULTIPLIER,
+        )
+        logger.info(f"New speed: x{state.gameplay.speed_multiplier}")
     elif UserControl.just_released[pg.K_KP_MINUS]:
-        Config.SPEED = int(Config.SPEED / 2)
-        logger.info(f"New speed: {Config.SPEED}")
+        state.gameplay.speed_multiplier = max(state.gameplay.speed_multiplier // 2, 1)
+        logger.info(f"New speed: x{state.gameplay.speed_multiplier}")
 
 
+@timed_system(SystemKind.LOGIC)
 def check_for_next_music_command() -> None:
     for event in UserControl.events:
         if event.type == KEYDOWN:
@@ -298,6 +371,7 @@ def check_for_next_music_command() -> None:
                 Sound.play_music()
 
 
+@timed_system(SystemKind.LOGIC)
 def check_for_track_flip_command(field: Field) -> None:
     for event in UserControl.events:
         if event.type == MOUSEBUTTONDOWN and event.button == Config.MOUSE_RIGHT:
@@ -306,11 +380,15 @@ def check_for_track_flip_command(field: Field) -> None:
                     drawble.mouse_on
                     and not field.is_released
                     and len(drawble.cell_tracks) > 1
+                    and drawble.flip_tracks()
                 ):
-                    drawble.flip_tracks()
+                    field.grid.track_graph.update_cell(drawble)
+                    StaticLayer.invalidate(drawble.rect)
+                    Sound.play_sound_on_any_channel(Sound.track_flip)
             return
 
 
+@timed_system(SystemKind.LOGIC)
 def check_for_music_toggle_command() -> None:
     for event in UserControl.events:
         if event.type == KEYDOWN and event.key == K_p:
@@ -319,6 +397,7 @@ def check_for_music_toggle_command() -> None:
             return
 
 
+@timed_system(SystemKind.LOGIC)
 def update_field_border(state: State, field: Field) -> None:
     if field.is_released:
         if field.num_crashed > 0:
@@ -334,80 +413,94 @@ def update_field_border(state: State, field: Field) -> None:
         field.border.color = TY_TELLOW
 
 
+@timed_system(SystemKind.LOGIC)
 def update_menu_indicators(state: State, field: Field) -> None:
     update_build_purge_menu(state, field)
     update_edit_test_menu(field)
     update_running_crashed_complete_menu(state, field)
-    update_level_menu()
+    update_level_menu(field)
     update_info_menu(field)
     update_track_menu(field)
     update_train_menu(field)
     update_crash_menu(field)
     update_spark_menu(field)
     update_music_menu()
+    update_speed_menu(state)
 
 
 def update_train_menu(field: Field) -> None:
-    train_menu.set_text(text=str(len(field.grid.trains.items)), item_index=0)
+    menus.train_menu.set_text(text=str(len(field.grid.trains.items)), item_index=0)
 
 
 def update_spark_menu(field: Field) -> None:
-    spark_menu.set_text(text=str(len(field.sparks)), item_index=0)
+    menus.spark_menu.set_text(text=str(len(field.sparks)), item_index=0)
 
 
 def update_crash_menu(field: Field) -> None:
-    crash_menu.set_text(text=str(field.num_crashed), item_index=0)
+    menus.crash_menu.set_text(text=str(field.num_crashed), item_index=0)
 
 
 def update_music_menu() -> None:
     play_music_text = "OFF"
     if Sound.music_playing:
         play_music_text = "ON"
-    music_menu.set_text(text=play_music_text, item_index=0)
+    menus.music_menu.set_text(text=play_music_text, item_index=0)
 
 
-def update_level_menu() -> None:
-    activated_items = level_menu.get_activated_items()
-    if len(activated_items) == 0:
-        level_menu.activate_item(0)
+def update_speed_menu(state: State) -> None:
+    menus.speed_menu.set_text(text=f"x{state.gameplay.speed_multiplier}", item_index=0)
+
+
+def update_level_menu(field: Field) -> None:
+    if field.level_pack is None:
         return
     for event in UserControl.events:
         if event.type == KEYDOWN and event.key == K_DOWN:
-            level_menu.activate_next_item()
+            menus.level_menu.selected_level = min(
+                menus.level_menu.selected_level + 1,
+                len(field.level_pack) - 1,
+            )
         elif event.type == KEYDOWN and event.key == K_UP:
-            level_menu.activate_previous_item()
+            menus.level_menu.selected_level = max(
+                menus.level_menu.selected_level - 1,
+                0,
+            )
+    menus.level_menu.show_levels(field.level_pack)
 
 
 def update_build_purge_menu(state: State, field: Field) -> None:
     if state.gameplay.in_delete_mode:
-        build_purge_menu.activate_item(1)
+        menus.build_purge_menu.activate_item(1)
     else:
-        build_purge_menu.activate_item(0)
+        menus.build_purge_menu.activate_item(0)
     if field.is_released:
-        build_purge_menu.deactivate_all()
+        menus.build_purge_menu.deactivate_all()
 
 
 def update_edit_test_menu(field: Field) -> None:
     if field.is_released:
-        edit_test_menu.activate_item(1)
+        menus.edit_test_menu.activate_item(1)
     else:
-        edit_test_menu.activate_item(0)
+        menus.edit_test_menu.activate_item(0)
 
 
 def update_running_crashed_complete_menu(state: State, field: Field) -> None:
     if state.gameplay.current_level_passed:
-        running_crashed_complete_menu.activate_item(2)
+        menus.running_crashed_complete_menu.activate_item(2)
     elif field.num_crashed > 0:
-        running_crashed_complete_menu.activate_item(1)
+        menus.running_crashed_complete_menu.activate_item(1)
     elif field.is_released:
-        running_crashed_complete_menu.activate_item(0)
+        menus.running_crashed_complete_menu.activate_item(0)
     else:
-        running_crashed_complete_menu.deactivate_all()
-    running_crashed_complete_menu.mouse_on(UserControl.mouse_pos)
+        menus.running_crashed_complete_menu.deactivate_all()
+    menus.running_crashed_complete_menu.mouse_on(UserControl.mouse_pos)
 
 
 def update_info_menu(field: Field) -> None:
-    tick_menu.set_text(text=str(int((field.current_tick - 32) / 64)), item_index=0)
+    menus.tick_menu.set_text(
+        text=str(int((field.current_tick - 32) / 64)),
+        item_index=0,
+    )
 
 
 def update_track_menu(field: Field) -> None:
@@ -415,9 +508,10 @@ def update_track_menu(field: Field) -> None:
     for item in field.grid.all_items:
         if isinstance(item, Drawable):
             tracks += len(item.cell_tracks)
-    track_menu.set_text(text=str(tracks), item_index=0)
+    menus.track_menu.set_text(text=str(tracks), item_index=0)
 
 
+@timed_system(SystemKind.LOGIC)
 def check_for_mainmenu_command(state: State) -> None:
     for event in UserControl.events:
         if event.type == KEYDOWN and event.key == UserControl.MAIN_MENU:
@@ -425,6 +519,7 @@ def check_for_mainmenu_command(state: State) -> None:
             logger.info(f"Moving to phase {state.game_phase}")
 
 
+@timed_system(SystemKind.LOGIC)
 def check_and_toggle_profiling(state: State) -> None:
     if UserControl.pressed_keys[K_F1]:
         state.profiler.continue_profiling()
@@ -432,57 +527,26 @@ def check_and_toggle_profiling(state: State) -> None:
         state.profiler.discontinue_profiling()
 
 
-def determine_arrival_station_checkmarks(field: Field) -> None:
-    for arrival_station in field.grid.arrivals.items:
-        if arrival_station.number_of_trains_left == 0:
-            arrival_station.checkmark = CheckmarkSprite(arrival_station.rect)
-
-
-def arrivals_pending(field: Field) -> bool:
-    for arrival_station in field.grid.arrivals.items:
-        if arrival_station.number_of_trains_left > 0:
-            return True
-    return False
+@timed_system(SystemKind.LOGIC)
+def check_and_toggle_frame_stats() -> None:
+    if UserControl.just_released[K_F2]:
+        FrameStatsOverlay.toggle()
 
 
-def check_train_merges(field: Field) -> None:
-    if not field.is_released:
-        return
-    for train_1 in field.grid.trains.items:
-        other_trains = field.grid.trains.items.copy()
-        other_trains.remove(train_1)
-        other_trains_pos = [
-            (x.rect.centerx, x.rect.centery, 1, 1) for x in other_trains
-        ]
-        collided_train_index = pg.Rect(
-            (train_1.rect.centerx, train_1.rect.centery, 2, 2),
-        ).collidelist(other_trains_pos)
-        if collided_train_index == -1:
-            continue
-        train_2 = other_trains[collided_train_index]
-        if train_1.direction == train_2.direction:
-            merge_trains(train_1, train_2, field)
-        else:
-            paint_trains(train_1, train_2)
+@timed_system(SystemKind.LOGIC)
+def check_and_write_trace() -> None:
+    if Trace.enabled and UserControl.just_released[K_F4]:
+        Trace.write()
 
 
-def delete_crashed_trains(field: Field) -> None:
-    if not field.is_released:
-        return
-    trains_to_remove: list[Train] = [
-        train for train in field.grid.trains.items if train.crashed
-    ]
-    for train in trains_to_remove:
-        field.grid.trains.sprites.remove(train)
-        field.grid.trains.items.remove(train)
-        generate_crash_sparks(
-            field,
-            (train.rect.centerx, train.rect.centery),
-            train.angle,
-        )
-        logger.info(f"Train crashed. Trains left: {len(field.grid.trains.items)}")
+@timed_system(SystemKind.LOGIC)
+def determine_arrival_station_checkmarks(field: Field) -> None:
+    for arrival_station in field.grid.arrivals.items:
+        if arrival_station.number_of_trains_left == 0:
+            arrival_station.checkmark = CheckmarkSprite(arrival_station.rect)
 
 
+@timed_system(SystemKind.LOGIC)
 def check_and_save_field(field: Field, file_name: str = "level_tmp.csv") -> None:
     for event in UserControl.events:
         if event.type == KEYDOWN and event.key == UserControl.SAVE_GAME:
@@ -492,12 +556,13 @@ def check_and_save_field(field: Field, file_name: str = "level_tmp.csv") -> None
                 row: list[str] = []
                 for i, cell in enumerate(field.grid.all_items):
                     row.append(cell.saveable_attributes.serialize())
-                    if (i + 1) % 8 == 0:
+                    if (i + 1) % field.cells_x == 0:
                         level_writer.writerow(row)
                         row.clear()
             logger.info(f"Saved game to '{file_path}'")
 
 
+@timed_system(SystemKind.LOGIC)
 def check_and_set_delete_mode(state: State) -> None:
     if (
         UserControl.pressed_keys[UserControl.DELETE_MODE_1]
@@ -513,61 +578,14 @@ def reset_to_beginning(state: State, field: Field) -> None:
     state.reset_gameplay_status()
 
 
-def tick_trains(field: Field) -> None:
-    if field.is_released:
-        for train in field.grid.trains.items:
-            train.tick()
-    else:
-        for train in field.grid.trains.items:
-            train.reset()
-
-
-def check_train_arrivals(field: Field) -> None:
-    if not field.is_released:
-        return
-    for train in field.grid.trains.items:
-        for arrival_station in field.grid.arrivals.items:
-            if not train.rect.collidepoint(arrival_station.rect.center):
-                continue
-            if (
-                train.color == arrival_station.train_color
-                and arrival_station.goals
-                and arrival_station.number_of_trains_left > 0
-            ):
-                field.grid.trains.remove_one(train)
-                arrival_station.number_of_trains_left -= 1
-                arrival_station.goals.pop().kill()
-                Sound.play_sound_on_any_channel(Sound.pop)
-            else:
-                logger.debug(
-                    "CRASH! Wrong color train or not expecting further arrivals.",
-                )
-                train.crash()
-                field.num_crashed += 1
-                arrival_station.checkmark = None
-
-
-def tick_departures(field: Field) -> None:
-    if not field.is_released:
-        return
-    for departure_station in field.grid.departures.items:
-        res = departure_station.tick(field.current_tick)
-        if res is not None:
-            add_new_train(field, res)
-
-
+@timed_system(SystemKind.LOGIC)
 def check_for_level_completion(state: State, field: Field) -> None:
-    if (
-        not state.gameplay.current_level_passed
-        and not arrivals_pending(field)
-        and field.num_crashed == 0
-        and len(field.grid.trains.items) == 0
-        and field.is_released
-    ):
+    if not state.gameplay.current_level_passed and engine.level_completed(field):
         Sound.success.play()
         state.gameplay.current_level_passed = True
 
 
+@timed_system(SystemKind.LOGIC)
 def check_for_new_track_placement(state: State, field: Field) -> None:
     left_mouse_down_in_draw_mode = (
         UserControl.mouse_pressed[0]
@@ -670,45 +688,12 @@ def check_for_new_track_placement(state: State, field: Field) -> None:
         UserControl.mouse_entered_new_cell = False
 
 
+@timed_system(SystemKind.LOGIC)
 def check_for_pg_gameplay_events() -> None:
     UserControl.update_user_events()
 
 
-def select_tracks_for_trains(field: Field) -> None:
-    if not field.is_released:
-        return
-    for train in field.grid.trains.items:
-        if train.selected_track is None:
-            train.crash()
-            field.num_crashed += 1
-            continue
-        if train.current_navigation_index == len(train.selected_track.navigation):
-            train.last_flipped_cell = None  # Experimental.
-            train.determine_next_cell_coords_and_direction()
-            next_cell_tracks: list[Track] = field.get_grid_cell_at(
-                train.next_cell_coords[0],
-                train.next_cell_coords[1],
-            ).cell_tracks
-            if len(next_cell_tracks) == 0:
-                train.crash()
-                field.num_crashed += 1
-                continue
-            found_track = False
-            for track in next_cell_tracks:
-                for endpoint in track.endpoints:
-                    if train.rect.collidepoint(endpoint.as_tuple_int()):
-                        found_track = True
-                        train.selected_track = track
-                        train.rect.center = endpoint.as_tuple_int()
-            if not found_track:
-                train.crash()
-                field.num_crashed += 1
-                continue
-            train.current_navigation_index = 0
-            train.direction = train.next_cell_direction
-            train.next_cell_direction = Direction.NONE
-
-
+@timed_system(SystemKind.LOGIC)
 def check_and_mark_prev_cell(field: Field) -> None:
     if field.is_released:
         return
@@ -717,20 +702,17 @@ def check_and_mark_prev_cell(field: Field) -> None:
             UserControl.mouse_entered_new_cell = True
 
 
+@timed_system(SystemKind.LOGIC)
 def check_and_delete_field_tracks(state: State, field: Field) -> None:
     if field.is_released:
         return
     for drawble in field.grid.drawbles.items:
-        check_and_delete_drawble_tracks(state, drawble)
-
-
-def add_new_train(field: Field, train: Train) -> None:
-    field.grid.trains.items.append(train)
-    field.grid.trains.sprites.add(train)
+        check_and_delete_drawble_tracks(state, field, drawble)
 
 
 def check_and_delete_drawble_tracks(
     state: State,
+    field: Field,
     drawble: Drawable,
 ) -> None:
     mouse_pressed_cell_while_in_delete_mode = (
@@ -738,63 +720,31 @@ def check_and_delete_drawble_tracks(
         and UserControl.mouse_pressed[0]
         and state.gameplay.in_delete_mode
     )
-    if mouse_pressed_cell_while_in_delete_mode:
+    if mouse_pressed_cell_while_in_delete_mode and drawble.cell_tracks:
         drawble.cell_tracks.clear()
+        field.grid.track_graph.update_cell(drawble)
+        StaticLayer.invalidate(drawble.rect)
 
 
-def check_and_flip_cell_tracks(field: Field) -> None:
-    if not field.is_released:
-        return
-    for cell in field.grid.all_items:
-        for train in field.grid.trains.items:
-            if train.current_navigation_index % (Config.CELL_SIZE / 2) != 0:
-                return
-            cell_contains_train_and_has_multiple_tracks = (
-                cell.rect.contains(train.rect)
-                and train.current_navigation_index
-                >= (Config.CELL_SIZE / 2)  # Over halfway.
-                and train.last_flipped_cell != cell
-                and len(cell.cell_tracks) == 2
-            )
-            if cell_contains_train_and_has_multiple_tracks and isinstance(
-                cell,
-                Drawable,
-            ):
-                cell.flip_tracks()
-                train.last_flipped_cell = cell
-
-
-def paint_trains(train_1: Train, train_2: Train) -> None:
-    upcoming_color = blend_train_colors(train_1.color, train_2.color)
-    train_1.repaint(upcoming_color)
-    train_2.repaint(upcoming_color)
-    Sound.play_sound_on_any_channel(Sound.merge)
-
-
-def merge_trains(train_1: Train, train_2: Train, field: Field) -> None:
-    upcoming_train_color = blend_train_colors(train_1.color, train_2.color)
-    train_1.repaint(upcoming_train_color)
-    field.grid.trains.items.remove(train_2)
-    train_2.kill()
-    logger.info(
-        f"Removed a train! Trains remaining: {len(field.grid.trains.items)}"
-        " or {len(field.grid.trains.sprites)}",
-    )
-    Sound.play_sound_on_any_channel(Sound.merge)
-
-
-def draw_background_basecolor(screen: Screen) -> None:
-    # screen.surface.blit(Graphics.img_surfaces["bg"], dest=(0, 0))
-    screen.surface.fill(TY_BG)
-
-
+@timed_system(SystemKind.DRAW)
 def draw_station_goals(screen: Screen, field: Field) -> None:
     for arrival_station in field.grid.arrivals.items:
         arrival_station.goal_sprites.draw(screen.surface)
+        DirtyRects.add_if_changed(
+            arrival_station,
+            (len(arrival_station.goals), arrival_station.checkmark is not None),
+            arrival_station.rect,
+        )
     for departure_station in field.grid.departures.items:
         departure_station.goal_sprites.draw(screen.surface)
+        DirtyRects.add_if_changed(
+            departure_station,
+            len(departure_station.goals),
+            departure_station.rect,
+        )
 
 
+@timed_system(SystemKind.DRAW)
 def draw_checkmarks(screen: Screen, field: Field) -> None:
     for arrival_station in field.grid.arrivals.items:
         if arrival_station.checkmark is None or arrival_station.checkmark.image is None:
@@ -805,109 +755,13 @@ def draw_checkmarks(screen: Screen, field: Field) -> None:
         )
 
 
-def draw_drawables_tracks(screen: Screen, field: Field) -> None:
-    for drawble in field.grid.drawbles.items:
-        draw_drawable_tracks(screen, drawble)
-
-
-def draw_stations(field: Field, screen: Screen) -> None:
-    field.grid.departures.sprites.draw(screen.surface)
-    field.grid.arrivals.sprites.draw(screen.surface)
-    draw_station_goals(screen, field)
-    draw_checkmarks(screen, field)
-
-
-def draw_arcs_and_endpoints(screen: Screen, track: Track) -> None:
-    color = WHITE if track.bright else GRAY
-    if track.track_type == TrackType.VERT:
-        pg.draw.line(
-            screen.surface,
-            color,
-            track.cell_rect.midtop,
-            track.cell_rect.midbottom,
-        )
-    elif track.track_type == TrackType.HORI:
-        pg.draw.line(
-            screen.surface,
-            color,
-            track.cell_rect.midleft,
-            track.cell_rect.midright,
-        )
-    elif track.track_type == TrackType.TOP_RIGHT:
-        pygame.gfxdraw.arc(
-            screen.surface,
-            track.cell_rect.right,
-            track.cell_rect.top,
-            int(Config.CELL_SIZE / 2),
-            90,
-            180,
-            color,
-        )
-    elif track.track_type == TrackType.TOP_LEFT:
-        pygame.gfxdraw.arc(
-            screen.surface,
-            track.cell_rect.left,
-            track.cell_rect.top,
-            int(Config.CELL_SIZE / 2),
-            0,
-            90,
-            color,
-        )
-    elif track.track_type == TrackType.BOTTOM_LEFT:
-        pygame.gfxdraw.arc(
-            screen.surface,
-            track.cell_rect.left,
-            track.cell_rect.bottom,
-            int(Config.CELL_SIZE / 2),
-            270,
-            360,
-            color,
-        )
-    elif track.track_type == TrackType.BOTTOM_RIGHT:
-        pygame.gfxdraw.arc(
-            screen.surface,
-            track.cell_rect.right,
-            track.cell_rect.bottom,
-            int(Config.CELL_SIZE / 2),
-            180,
-            270,
-            color,
-        )
-
-    for endpoint in track.endpoints:
-        pygame.gfxdraw.pixel(screen.surface, int(endpoint.x), int(endpoint.y), RED1)
-
-
-def draw_drawable_tracks(screen: Screen, drawble: Drawable) -> None:
-    for track in drawble.cell_tracks:
-        if track.image:
-            screen.surface.blit(track.image, dest=track.cell_rect)
-        if Config.DRAW_ARCS:
-            draw_arcs_and_endpoints(screen, track)
-
-
+@timed_system(SystemKind.LOGIC)
 def check_and_reset_gameplay(state: State, field: Field) -> None:
     if not field.is_released:
         reset_to_beginning(state, field)
 
 
-def tick_field(field: Field) -> None:
-    field.set_current_tick()
-
-
-def check_train_departure_station_crashes(field: Field) -> None:
-    if not field.is_released:
-        return
-    for train in field.grid.trains.items:
-        for departure_station in field.grid.departures.items:
-            if (
-                departure_station.rect.collidepoint(train.rect.center)
-                and train.angle != departure_station.angle
-            ):
-                train.crash()
-                field.num_crashed += 1
-
-
+@timed_system(SystemKind.LOGIC)
 def check_and_toggle_train_release(field: Field) -> None:
     for event in UserControl.events:
         if event.type == KEYDOWN and event.key == K_SPACE:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 from src.traincolor import TrainColor, color_as_short_string
 
 
@@ -24,6 +26,16 @@ class SaveableAttributes:
         return f"{self.block_type}{self.number}{self.color}{self.angle}"
 
 
+# Type, then either an angle (e.g. S270) or a count, a color and an angle (e.g. D12r90).
+SAVEABLE_PATTERN = re.compile(r"([A-Z])(\d*)([a-z]?)(\d*)")
+
+short_string_to_color = {
+    color_as_short_string(color): color
+    for color in TrainColor
+    if color != TrainColor.BROWN
+}
+
+
 class Saveable:
     def __init__(self, saveable_string: str) -> None:
         self.type = None
@@ -32,31 +44,33 @@ class Saveable:
         if len(saveable_string) == 1:  # Case when e.g. "E"
             self.type = saveable_string
             return
-        if saveable_string[0] == "S":
-            self.angle = int(saveable_string[1:])
-        elif saveable_string[2] == "r":
-            self.color = TrainColor.RED
-            self.num_goals = int(saveable_string[1])
-            self.angle = int(saveable_string[3:])
-        elif saveable_string[2] == "g":
-            self.color = TrainColor.GREEN
-            self.num_goals = int(saveable_string[1])
-            self.angle = int(saveable_string[3:])
-        elif saveable_string[2] == "b":
-            self.color = TrainColor.BLUE
-            self.num_goals = int(saveable_string[1])
-            self.angle = int(saveable_string[3:])
-        elif saveable_string[2] == "y":
-            self.color = TrainColor.YELLOW
-            self.num_goals = int(saveable_string[1])
-            self.angle = int(saveable_string[3:])
-        elif saveable_string[2] == "o":
-            self.color = TrainColor.ORANGE
-            self.num_goals = int(saveable_string[1])
-            self.angle = int(saveable_string[3:])
-        elif saveable_string[2] == "p":
-            self.color = TrainColor.PURPLE
-            self.num_goals = int(saveable_string[1])
-            self.angle = int(saveable_string[3:])
-        else:  # Case when e.g. S0, P90
-            self.angle = int(saveable_string[1:])
+        match = SAVEABLE_PATTERN.fullmatch(saveable_string)
+        if match is None:
+            msg = f"Could not parse saveable string '{saveable_string}'"
+            raise ValueError(msg)
+        _, digits, color, angle = match.groups()
+        if not color:  # Case when e.g. S0, P90
+            self.angle = int(digits)
+            return
+        if color not in short_string_to_color:
+            msg = f"Unknown color '{color}' in saveable string '{saveable_string}'"
+            raise ValueError(msg)
+        self.color = short_string_to_color[color]
+        self.num_goals = int(digits)
+        self.angle = int(angle)
+
+    @classmethod
+    def from_values(
+        cls,
+        block_type: str,
+        num_goals: int = 0,
+        color: TrainColor | None = None,
+        angle: int | None = None,
+    ) -> Saveable:
+        saveable = cls(block_type)
+        saveable.num_goals = num_goals
+        if color is not None:
+            saveable.color = color
+        if angle is not None:
+            saveable.angle = angle
+        return saveable
@@ -0,0 +1,476 @@
+"""Simulation engine.
+
+Display-free tick logic for a released field. Nothing in here draws, plays sounds or
+polls user input; instead each tick records `SimulationEvent`s on the field, and the
+gameplay phase turns those into sounds and sparks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from src.config import Config
+from src.direction import Direction, reverse, turn_left, turn_right
+from src.grid import cell_coords_at_pixel
+from src.train.train import Train
+from src.traincolor import blend_train_colors
+from src.utils.utils import setup_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.field import Field
+    from src.levelitems.drawable import Drawable
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+DEFAULT_MAX_TICKS = Config.CELL_SIZE * Config.NUM_CELLS_X * Config.NUM_CELLS_Y * 2
+
+# Trains bucketed by center pixel, each with its index in the trains list.
+TrainsByCenter = dict[tuple[int, int], list[tuple[int, Train]]]
+
+
+class EventType(Enum):
+    RELEASE = 0
+    ARRIVAL = 1
+    CRASH = 2
+    MERGE = 3
+    PAINT = 4
+    SPLIT = 5
+    FLIP = 6
+
+
+@dataclass
+class SimulationEvent:
+    event_type: EventType
+    pos: tuple[int, int]
+    angle: float = 0.0
+
+
+@dataclass
+class SimulationResult:
+    passed: bool
+    num_crashed: int
+    ticks: int
+
+
+def tick(field: Field) -> list[SimulationEvent]:
+    """Advance the field by one tick and return the events that happened during it."""
+    field.events.clear()
+    check_and_flip_cell_tracks(field)
+    tick_departures(field)
+    check_train_departure_station_crashes(field)
+    select_tracks_for_trains(field)
+    delete_crashed_trains(field)
+    check_train_arrivals(field)
+    check_train_merges(field)
+    check_train_painters(field)
+    check_train_splitters(field)
+    tick_trains(field)
+    field.set_current_tick()
+    return field.events
+
+
+def run(  # noqa: PLR0913
+    field: Field,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    *,
+    event_driven: bool = True,
+    resume: bool = False,
+    stop_at_crash: bool = False,
+    before_tick: Callable[[Field], None] | None = None,
+) -> SimulationResult:
+    """Release the field from the beginning and simulate it until it settles.
+
+    In event-driven mode, stretches of ticks where trains can only roll along their
+    tracks are skipped over in one step. The result is the same as ticking through
+    them one by one. With `resume`, an already released field is run on from its
+    current tick instead. `before_tick` is called before every tick that is not
+    skipped, and `stop_at_crash` ends the run after the tick of the first crash.
+    """
+    if not resume:
+        field.reset()
+        field.current_tick = 0
+        field.is_released = True
+    while field.current_tick < max_ticks:
+        quiet = (
+            count_quiet_ticks(field, max_ticks - field.current_tick)
+            if event_driven
+            else 0
+        )
+        if quiet > 0:
+            skip_quiet_ticks(field, quiet)
+            continue
+        if before_tick is not None:
+            before_tick(field)
+        events = tick(field)
+        if stop_at_crash and any(
+            event.event_type == EventType.CRASH for event in events
+        ):
+            break
+        if not field.grid.trains.items and not departures_pending(field):
+            break
+    return SimulationResult(
+        passed=level_completed(field),
+        num_crashed=field.num_crashed,
+        ticks=field.current_tick,
+    )
+
+
+def count_quiet_ticks(field: Field, limit: int) -> int:
+    """Count the upcoming ticks, up to `limit`, in which every check is a no-op.
+
+    Nothing can happen while no station is due to release a train, every train is
+    between the boundary, center and flip points of a plain track cell, and no two
+    trains can get close enough to merge or paint each other. Once nothing is left to
+    happen at all there is nothing to skip either, as the run is finished after the
+    next tick.
+    """
+    if not field.grid.trains.items and not departures_pending(field):
+        return 0
+    quiet = min(limit, ticks_until_next_release(field))
+    trains_by_cell: dict[tuple[int, int], list[Train]] = {}
+    for train in field.grid.trains.items:
+        if train.crashed or train.selected_track is None:
+            return 0
+        coords = train.selected_track.pos.as_tuple_int()
+        if is_special_cell(field, coords):
+            return 0
+        quiet = min(
+            quiet,
+            -train.current_navigation_index % (Config.CELL_SIZE // 2),
+        )
+        trains_by_cell.setdefault(coords, []).append(train)
+    if quiet <= 0:
+        return 0
+    return min(quiet, ticks_until_trains_can_meet(trains_by_cell))
+
+
+def ticks_until_next_release(field: Field) -> int:
+    ticks = DEFAULT_MAX_TICKS
+    for departure_station in field.grid.departures.items:
+        if departure_station.number_of_trains_left == 0:
+            continue
+        if departure_station.last_release_tick is None:
+            return 0
+        ticks = min(
+            ticks,
+            departure_station.last_release_tick + Config.CELL_SIZE - field.current_tick,
+        )
+    return ticks
+
+
+def is_special_cell(field: Field, coords: tuple[int, int]) -> bool:
+    return (
+        coords in field.grid.arrivals.by_coords
+        or coords in field.grid.departures.by_coords
+        or coords in field.grid.painters.by_coords
+        or coords in field.grid.splitters.by_coords
+    )
+
+
+def ticks_until_trains_can_meet(
+    trains_by_cell: dict[tuple[int, int], list[Train]],
+) -> int:
+    # Trains move at most a pixel per axis per tick, and stay inside their own
+    # cell until the next boundary, so only trains in neighboring cells can meet.
+    ticks = DEFAULT_MAX_TICKS
+    for (i, j), trains in trains_by_cell.items():
+        neighbors = [
+            other_train
+            for neighbor_i in (i - 1, i, i + 1)
+            for neighbor_j in (j - 1, j, j + 1)
+            for other_train in trains_by_cell.get((neighbor_i, neighbor_j), [])
+        ]
+        for train in trains:
+            for other_train in neighbors:
+                if other_train is train:
+                    continue
+                distance = max(
+                    abs(train.rect.centerx - other_train.rect.centerx),
+                    abs(train.rect.centery - other_train.rect.centery),
+                )
+                ticks = min(ticks, distance // 2)
+    return ticks
+
+
+def skip_quiet_ticks(field: Field, ticks: int) -> None:
+    field.events.clear()
+    for train in field.grid.trains.items:
+        for _ in range(ticks):
+            train.tick()
+    field.current_tick += ticks
+
+
+def level_completed(field: Field) -> bool:
+    return (
+        field.is_released
+        and field.num_crashed == 0
+        and len(field.grid.trains.items) == 0
+        and not arrivals_pending(field)
+    )
+
+
+def arrivals_pending(field: Field) -> bool:
+    for arrival_station in field.grid.arrivals.items:
+        if arrival_station.number_of_trains_left > 0:
+            return True
+    return False
+
+
+def departures_pending(field: Field) -> bool:
+    for departure_station in field.grid.departures.items:
+        if departure_station.number_of_trains_left > 0:
+            return True
+    return False
+
+
+def add_event(field: Field, event_type: EventType, train: Train) -> None:
+    field.events.append(
+        SimulationEvent(
+            event_type,
+            (train.rect.centerx, train.rect.centery),
+            train.angle,
+        ),
+    )
+
+
+def crash_train(field: Field, train: Train) -> None:
+    if not train.crashed:
+        add_event(field, EventType.CRASH, train)
+    train.crash()
+    field.num_crashed += 1
+
+
+def add_new_train(field: Field, train: Train) -> None:
+    field.grid.trains.items.append(train)
+    field.grid.trains.sprites.add(train)
+
+
+def check_and_flip_cell_tracks(field: Field) -> None:
+    if not field.is_released:
+        return
+    trains_in_cells: list[tuple[Drawable, Train]] = []
+    for train in field.grid.trains.items:
+        if train.current_navigation_index % (Config.CELL_SIZE / 2) != 0:
+            continue
+        cell = field.grid.drawbles.get_at(*cell_coords_at_pixel(*train.rect.center))
+        if cell is not None and cell.rect.contains(train.rect):
+            trains_in_cells.append((cell, train))
+    # Flip in the same row-major order as the cells are laid out.
+    trains_in_cells.sort(
+        key=lambda cell_train: (cell_train[0].pos.y, cell_train[0].pos.x),
+    )
+    for cell, train in trains_in_cells:
+        if (
+            train.current_navigation_index >= (Config.CELL_SIZE / 2)  # Over halfway.
+            and train.last_flipped_cell != cell
+            and len(cell.cell_tracks) == 2  # noqa: PLR2004
+        ):
+            if cell.flip_tracks():
+                field.grid.track_graph.update_cell(cell)
+                add_event(field, EventType.FLIP, train)
+            train.last_flipped_cell = cell
+
+
+def tick_departures(field: Field) -> None:
+    if not field.is_released:
+        return
+    for departure_station in field.grid.departures.items:
+        res = departure_station.tick(field.current_tick)
+        if res is not None:
+            add_new_train(field, res)
+            add_event(field, EventType.RELEASE, res)
+
+
+def check_train_departure_station_crashes(field: Field) -> None:
+    if not field.is_released:
+        return
+    for train in field.grid.trains.items:
+        departure_station = field.grid.departures.get_at(
+            *cell_coords_at_pixel(*train.rect.center),
+        )
+        if (
+            departure_station is not None
+            and departure_station.rect.collidepoint(train.rect.center)
+            and train.angle != departure_station.angle
+        ):
+            crash_train(field, train)
+
+
+def select_tracks_for_trains(field: Field) -> None:
+    if not field.is_released:
+        return
+    for train in field.grid.trains.items:
+        if train.selected_track is None:
+            crash_train(field, train)
+            continue
+        if train.current_navigation_index == len(train.selected_track.navigation):
+            train.last_flipped_cell = None  # Experimental.
+            train.determine_next_cell_coords_and_direction()
+            entry = field.grid.track_graph.get_entry(
+                train.next_cell_coords,
+                reverse(train.next_cell_direction),
+            )
+            if entry is None or not train.rect.collidepoint(entry.endpoint):
+                crash_train(field, train)
+                continue
+            train.selected_track = entry.track
+            train.rect.center = entry.endpoint
+            train.current_navigation_index = 0
+            train.direction = train.next_cell_direction
+            train.next_cell_direction = Direction.NONE
+
+
+def delete_crashed_trains(field: Field) -> None:
+    if not field.is_released:
+        return
+    trains_to_remove: list[Train] = [
+        train for train in field.grid.trains.items if train.crashed
+    ]
+    for train in trains_to_remove:
+        field.grid.trains.remove_one(train)
+        logger.info(f"Train crashed. Trains left: {len(field.grid.trains.items)}")
+
+
+def check_train_arrivals(field: Field) -> None:
+    if not field.is_released:
+        return
+    for train in field.grid.trains.items:
+        # A train overlapping a station's center has its own center in that cell.
+        arrival_station = field.grid.arrivals.get_at(
+            *cell_coords_at_pixel(*train.rect.center),
+        )
+        if arrival_station is None or not train.rect.collidepoint(
+            arrival_station.rect.center,
+        ):
+            continue
+        if (
+            train.color == arrival_station.train_color
+            and arrival_station.goals
+            and arrival_station.number_of_trains_left > 0
+        ):
+            field.grid.trains.remove_one(train)
+            arrival_station.number_of_trains_left -= 1
+            arrival_station.goals.pop().kill()
+            add_event(field, EventType.ARRIVAL, train)
+        else:
+            logger.debug(
+                "CRASH! Wrong color train or not expecting further arrivals.",
+            )
+            crash_train(field, train)
+            arrival_station.checkmark = None
+
+
+def check_train_merges(field: Field) -> None:
+    if not field.is_released:
+        return
+    trains_by_center = bucket_trains_by_center(field.grid.trains.items)
+    for train_1 in field.grid.trains.items:
+        collided = find_collided_train(trains_by_center, train_1)
+        if collided is None:
+            continue
+        train_2 = collided[1]
+        if train_1.direction == train_2.direction:
+            merge_trains(field, train_1, train_2)
+            trains_by_center[train_2.rect.center].remove(collided)
+        else:
+            paint_trains(field, train_1, train_2)
+
+
+def bucket_trains_by_center(trains: list[Train]) -> TrainsByCenter:
+    trains_by_center: TrainsByCenter = {}
+    for order, train in enumerate(trains):
+        trains_by_center.setdefault(train.rect.center, []).append((order, train))
+    return trains_by_center
+
+
+def find_collided_train(
+    trains_by_center: TrainsByCenter,
+    train: Train,
+) -> tuple[int, Train] | None:
+    """Find the earliest other train that a merge or paint would pick.
+
+    A 2x2 rect at the train's center collides with the 1x1 rect at another
+    train's center only if that center is at most one pixel right of it and one
+    pixel below it. That means only four buckets need to be checked.
+    """
+    centerx, centery = train.rect.center
+    collided: tuple[int, Train] | None = None
+    for x in (centerx, centerx + 1):
+        for y in (centery, centery + 1):
+            for order, other_train in trains_by_center.get((x, y), []):
+                if other_train is not train and (
+                    collided is None or order < collided[0]
+                ):
+                    collided = (order, other_train)
+    return collided
+
+
+def paint_trains(field: Field, train_1: Train, train_2: Train) -> None:
+    upcoming_color = blend_train_colors(train_1.color, train_2.color)
+    train_1.repaint(upcoming_color)
+    train_2.repaint(upcoming_color)
+    add_event(field, EventType.PAINT, train_1)
+
+
+def merge_trains(field: Field, train_1: Train, train_2: Train) -> None:
+    upcoming_train_color = blend_train_colors(train_1.color, train_2.color)
+    train_1.repaint(upcoming_train_color)
+    field.grid.trains.items.remove(train_2)
+    train_2.kill()
+    logger.info(
+        f"Removed a train! Trains remaining: {len(field.grid.trains.items)}"
+        " or {len(field.grid.trains.sprites)}",
+    )
+    add_event(field, EventType.MERGE, train_1)
+
+
+def check_train_painters(field: Field) -> None:
+    for train in field.grid.trains.items:
+        painter = field.grid.painters.get_at(*cell_coords_at_pixel(*train.rect.center))
+        if painter is not None and train.rect.center == painter.rect.center:
+            train.repaint(painter.color)
+
+
+def check_train_splitters(field: Field) -> None:
+    if field.current_tick == 0 or field.current_tick % 32 != 0:
+        return
+    trains_to_add: list[Train] = []
+    for train in field.grid.trains.items:
+        splitter = field.grid.splitters.get_at(
+            *cell_coords_at_pixel(*train.rect.center),
+        )
+        if splitter is not None and train.rect.center == splitter.rect.center:
+            if train.direction != reverse(Direction(splitter.angle)):
+                # Only a train that came in along the straight track can be split.
+                crash_train(field, train)
+                continue
+            logger.info("At center.")
+            new_train_1 = Train(
+                train.loc,
+                train.color,
+                splitter.cell_tracks[1],
+                direction=turn_left(train.direction),
+            )
+            new_train_1.rect.x = train.rect.x
+            new_train_1.rect.y = train.rect.y
+            trains_to_add.append(new_train_1)
+            train.selected_track = splitter.cell_tracks[2]
+            train.direction = turn_right(train.direction)
+            train.angle = train.direction.value
+            add_event(field, EventType.SPLIT, train)
+
+    for new_train in trains_to_add:
+        add_new_train(field, new_train)
+
+
+def tick_trains(field: Field) -> None:
+    if field.is_released:
+        for train in field.grid.trains.items:
+            train.tick()
+    else:
+        for train in field.grid.trains.items:
+            train.reset()
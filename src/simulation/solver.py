@@ -0,0 +1,450 @@
+"""Puzzle solver.
+
+Searches for a track layout that completes a level. The search is driven by the
+simulator: a layout is simulated until the first train crashes, and if it crashed
+because it ran into a drawing cell with no track on that edge, the search branches on
+the tracks that could continue it from there. Tracks that would lead off the field,
+into a rock or into the wrong side of a station are pruned using the track graph.
+
+A run only depends on the tracks in the cells its trains have entered, so the field is
+kept from the tick before a train first ran into an empty cell. The layouts branching
+from that crash only add tracks to cells no train had entered yet, and are simulated
+on from there instead of from the start of the level.
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import pickle
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pygame as pg
+
+from src.coordinate import Coordinate
+from src.direction import Direction, direction_to_offset, reverse
+from src.field import Field
+from src.levelformat import LEVEL_BINARY_SUFFIX, LevelData, read_level_file
+from src.simulation import engine
+from src.simulation.validation import apply_track_layout, init_worker
+from src.track.track import TrackType, tracktype_to_direction, travel_to_exit_direction
+
+if TYPE_CHECKING:
+    from src.train.train import Train
+    from src.traincolor import TrainColor
+
+DEFAULT_BUDGET = 20_000
+MAX_TRACKS_PER_CELL = 2
+
+Layout = list[tuple[Coordinate, TrackType]]
+LayoutKey = frozenset[tuple[tuple[int, int], tuple[int, ...]]]
+
+
+@dataclass(frozen=True)
+class Prefix:
+    # A pickled field from the tick before a train first ran into an empty cell. Pygame
+    # surfaces cannot be pickled, and no tick changes them, so they are kept aside.
+    data: bytes
+    surfaces: dict[int, pg.Surface]
+    layout: Layout
+    entered_cells: frozenset[tuple[int, int]]
+
+
+@dataclass
+class Branch:
+    coords: tuple[int, int]
+    edge: Direction
+    train_color: TrainColor
+    prefix: Prefix | None = None
+
+
+class RunRecorder:
+    # Follows a run from before each tick, for `find_branch` and the prefix.
+    def __init__(
+        self,
+        layout: Layout,
+        entered_cells: set[tuple[int, int]],
+    ) -> None:
+        self.layout = layout
+        self.entered_cells = entered_cells
+        self.trains_at_boundary: list[Train] = []
+        self.prefix: Prefix | None = None
+
+    def before_tick(self, field: Field) -> None:
+        self.trains_at_boundary = [
+            train
+            for train in field.grid.trains.items
+            if train.selected_track is not None
+            and train.current_navigation_index == len(train.selected_track.navigation)
+        ]
+        next_cells = [
+            coords
+            for coords in map(next_cell_coords, self.trains_at_boundary)
+            if coords is not None
+        ]
+        # A train running into an empty cell crashes this tick, so this is the last
+        # tick the layouts continuing it from there have in common with this one.
+        if self.prefix is None and any(
+            is_empty_cell(field, coords) for coords in next_cells
+        ):
+            self.prefix = take_prefix(field, self.layout, self.entered_cells)
+        self.entered_cells.update(next_cells)
+
+
+@dataclass
+class SolverResult:
+    solved: bool
+    layout: Layout | None
+    simulations: int
+    exhausted: bool
+    seconds: float = 0.0
+
+
+def read_level(level_path: str) -> LevelData:
+    """Parse the level once for the whole search.
+
+    A CSV level's track layout is what the solver writes, so it is left out.
+    """
+    level = read_level_file(Path(level_path))
+    if Path(level_path).suffix == LEVEL_BINARY_SUFFIX:
+        return level
+    return LevelData(level.cells, level.tracks[:0])
+
+
+def build_field(level: LevelData, layout: Layout) -> Field:
+    field = Field()
+    field.initialize_grid_from_level(level)
+    apply_track_layout(field, layout)
+    return field
+
+
+class SurfacePickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, surfaces: dict[int, pg.Surface]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.surfaces = surfaces
+
+    def persistent_id(self, obj: object) -> int | None:
+        if isinstance(obj, pg.Surface):
+            self.surfaces[id(obj)] = obj
+            return id(obj)
+        return None
+
+
+class SurfaceUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, surfaces: dict[int, pg.Surface]) -> None:
+        super().__init__(file)
+        self.surfaces = surfaces
+
+    def persistent_load(self, pid: int) -> pg.Surface:
+        return self.surfaces[pid]
+
+
+def take_prefix(
+    field: Field,
+    layout: Layout,
+    entered_cells: set[tuple[int, int]],
+) -> Prefix:
+    # Pickling a field and loading it back is about twice as fast as `copy.deepcopy`.
+    surfaces: dict[int, pg.Surface] = {}
+    data = io.BytesIO()
+    SurfacePickler(data, surfaces).dump(field)
+    return Prefix(data.getvalue(), surfaces, layout, frozenset(entered_cells))
+
+
+def resume_field(prefix: Prefix, layout: Layout) -> Field | None:
+    """Restore the field of `prefix` with the rest of `layout` placed on it.
+
+    Returns None unless `layout` only adds tracks to cells the prefix has not entered,
+    since only then does its run reach the same field.
+    """
+    num_tracks = len(prefix.layout)
+    if layout[:num_tracks] != prefix.layout or any(
+        pos.as_tuple_int() in prefix.entered_cells for pos, _ in layout[num_tracks:]
+    ):
+        return None
+    field = SurfaceUnpickler(io.BytesIO(prefix.data), prefix.surfaces).load()
+    for pos, track_type in layout[num_tracks:]:
+        field.insert_track_to_position(track_type, pos, invalidate=False)
+    return field
+
+
+def next_cell_coords(train: Train) -> tuple[int, int] | None:
+    """Return the cell a train at the end of its track runs into next.
+
+    The train itself only works this out during the tick.
+    """
+    if train.selected_track is None:
+        return None
+    exit_direction = travel_to_exit_direction.get(
+        (train.selected_track.track_type, train.direction),
+    )
+    if exit_direction is None:
+        return None
+    offset = direction_to_offset[exit_direction]
+    return (
+        train.selected_track.pos.x + offset[0],
+        train.selected_track.pos.y + offset[1],
+    )
+
+
+def is_empty_cell(field: Field, coords: tuple[int, int]) -> bool:
+    drawble = field.grid.drawbles.get_at(*coords)
+    return drawble is not None and not drawble.cell_tracks
+
+
+def layout_key(layout: Layout) -> LayoutKey:
+    tracks_by_cell: dict[tuple[int, int], list[int]] = {}
+    for pos, track_type in layout:
+        tracks_by_cell.setdefault(pos.as_tuple_int(), []).append(track_type.value)
+    return frozenset(
+        (coords, tuple(track_types)) for coords, track_types in tracks_by_cell.items()
+    )
+
+
+def simulate(
+    field: Field,
+    layout: Layout,
+    prefix: Prefix | None = None,
+    max_ticks: int = engine.DEFAULT_MAX_TICKS,
+) -> Branch | bool:
+    """Run the field until it settles or a train crashes.
+
+    The field is run from the start, or on from `prefix` if it was restored from one.
+    Returns True if the level was completed, the place to branch on if a train ran
+    into a cell edge without a track, and False for any other failure.
+    """
+    recorder = RunRecorder(
+        layout,
+        set() if prefix is None else set(prefix.entered_cells),
+    )
+    result = engine.run(
+        field,
+        max_ticks,
+        resume=prefix is not None,
+        stop_at_crash=True,
+        before_tick=recorder.before_tick,
+    )
+    if result.num_crashed == 0:
+        return result.passed
+    branch = find_branch(field, recorder.trains_at_boundary)
+    if branch is None:
+        return False
+    branch.prefix = recorder.prefix or prefix
+    return branch
+
+
+def find_branch(field: Field, trains_at_boundary: list[Train]) -> Branch | None:
+    for train in trains_at_boundary:
+        edge = reverse(train.next_cell_direction)
+        if (
+            train.crashed
+            and field.grid.track_graph.get_entry(train.next_cell_coords, edge) is None
+        ):
+            return Branch(train.next_cell_coords, edge, train.color)
+    return None
+
+
+def candidate_tracks(field: Field, branch: Branch) -> list[TrackType]:
+    """List the tracks that could carry a train on from `branch`, best first."""
+    drawble = field.grid.drawbles.get_at(*branch.coords)
+    if drawble is None or len(drawble.cell_tracks) >= MAX_TRACKS_PER_CELL:
+        return []
+    candidates: list[tuple[int, TrackType]] = []
+    for track_type, directions in tracktype_to_direction.items():
+        if branch.edge not in directions:
+            continue
+        exit_direction = next(
+            direction for direction in directions if direction != branch.edge
+        )
+        offset = direction_to_offset[exit_direction]
+        next_coords = (branch.coords[0] + offset[0], branch.coords[1] + offset[1])
+        if can_enter(field, next_coords, reverse(exit_direction)):
+            candidates.append(
+                (
+                    distance_to_arrival(field, next_coords, branch.train_color),
+                    track_type,
+                ),
+            )
+    return [track_type for _, track_type in sorted(candidates, key=lambda c: c[0])]
+
+
+def can_enter(field: Field, coords: tuple[int, int], edge: Direction) -> bool:
+    splitter = field.grid.splitters.get_at(*coords)
+    if splitter is not None:
+        # A train can only be split when it enters along the splitter's straight track.
+        return edge.value == splitter.angle
+    if field.grid.track_graph.get_entry(coords, edge) is not None:
+        return True
+    drawble = field.grid.drawbles.get_at(*coords)
+    return drawble is not None and len(drawble.cell_tracks) < MAX_TRACKS_PER_CELL
+
+
+def distance_to_arrival(
+    field: Field,
+    coords: tuple[int, int],
+    train_color: TrainColor,
+) -> int:
+    distances = [
+        abs(arrival.pos.x - coords[0]) + abs(arrival.pos.y - coords[1])
+        for arrival in field.grid.arrivals.items
+        if arrival.train_color == train_color
+    ]
+    return min(distances, default=0)
+
+
+def expand(
+    level: LevelData,
+    layout: Layout,
+    prefix: Prefix | None = None,
+) -> tuple[bool, list[tuple[Layout, Prefix | None]]]:
+    """Simulate `layout`, returning whether it solves the level and its children.
+
+    The run is resumed from `prefix` when possible, and each child comes with the
+    prefix it can be resumed from in turn.
+    """
+    field = None if prefix is None else resume_field(prefix, layout)
+    if field is None:
+        prefix = None
+        field = build_field(level, layout)
+    outcome = simulate(field, layout, prefix)
+    if isinstance(outcome, bool):
+        return outcome, []
+    # Flips during the run only reorder tracks, so the pruning below is unaffected.
+    return False, [
+        ([*layout, (Coordinate(*outcome.coords), track_type)], outcome.prefix)
+        for track_type in candidate_tracks(field, outcome)
+    ]
+
+
+def search(
+    level: LevelData,
+    layouts: list[Layout],
+    budget: int,
+) -> SolverResult:
+    """Depth-first search from `layouts`, simulating at most `budget` layouts."""
+    stack: list[tuple[Layout, Prefix | None]] = [
+        (layout, None) for layout in reversed(layouts)
+    ]
+    seen: set[LayoutKey] = set()
+    simulations = 0
+    while stack:
+        if simulations >= budget:
+            return SolverResult(
+                solved=False,
+                layout=None,
+                simulations=simulations,
+                exhausted=False,
+            )
+        layout, prefix = stack.pop()
+        key = layout_key(layout)
+        if key in seen:
+            continue
+        seen.add(key)
+        simulations += 1
+        solved, children = expand(level, layout, prefix)
+        if solved:
+            return SolverResult(
+                solved=True,
+                layout=layout,
+                simulations=simulations,
+                exhausted=False,
+            )
+        stack.extend(reversed(children))
+    return SolverResult(
+        solved=False,
+        layout=None,
+        simulations=simulations,
+        exhausted=True,
+    )
+
+
+def search_subtree(args: tuple[LevelData, Layout, int]) -> SolverResult:
+    level, layout, budget = args
+    return search(level, [layout], budget)
+
+
+def solve_level(
+    level_path: str,
+    budget: int = DEFAULT_BUDGET,
+    processes: int | None = None,
+) -> SolverResult:
+    """Find a layout that completes the level, or give up after `budget` simulations.
+
+    The top of the search tree is expanded breadth-first until there is enough work to
+    go around, and the subtrees are then searched in worker processes, each with an
+    even share of the remaining budget. `exhausted` is True when every subtree was
+    searched to the end, meaning this search cannot solve the level at all.
+    """
+    start_time = time.perf_counter()
+    level = read_level(level_path)
+    processes = processes or multiprocessing.cpu_count()
+    # Each layout carries its path from the root, so the subtrees can be handed out in
+    # the same order a single depth-first search would visit them.
+    frontier: deque[tuple[tuple[int, ...], Layout, Prefix | None]] = deque(
+        [((), [], None)],
+    )
+    seen: set[LayoutKey] = set()
+    simulations = 0
+    while frontier and len(frontier) < processes * 4 and simulations < budget:
+        path, layout, prefix = frontier.popleft()
+        key = layout_key(layout)
+        if key in seen:
+            continue
+        seen.add(key)
+        simulations += 1
+        solved, children = expand(level, layout, prefix)
+        if solved:
+            return SolverResult(
+                solved=True,
+                layout=layout,
+                simulations=simulations,
+                exhausted=False,
+                seconds=time.perf_counter() - start_time,
+            )
+        frontier.extend(
+            ((*path, index), child, child_prefix)
+            for index, (child, child_prefix) in enumerate(children)
+        )
+
+    if not frontier or simulations >= budget:
+        return SolverResult(
+            solved=False,
+            layout=None,
+            simulations=simulations,
+            exhausted=not frontier,
+            seconds=time.perf_counter() - start_time,
+        )
+
+    subtree_budget = max(1, (budget - simulations) // len(frontier))
+    exhausted = True
+    with multiprocessing.Pool(
+        processes,
+        initializer=init_worker,
+        initargs=("WARNING",),
+    ) as pool:
+        for result in pool.imap(
+            search_subtree,
+            # Prefixes hold surfaces, which cannot be sent to a worker, so each
+            # subtree is simulated from the start of the level once.
+            [
+                (level, layout, subtree_budget)
+                for _, layout, _ in sorted(frontier, key=lambda item: item[0])
+            ],
+        ):
+            simulations += result.simulations
+            exhausted = exhausted and result.exhausted
+            if result.solved:
+                result.simulations = simulations
+                result.seconds = time.perf_counter() - start_time
+                return result
+    return SolverResult(
+        solved=False,
+        layout=None,
+        simulations=simulations,
+        exhausted=exhausted,
+        seconds=time.perf_counter() - start_time,
+    )
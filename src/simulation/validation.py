@@ -0,0 +1,152 @@
+"""Level validation.
+
+Simulates level files headlessly, optionally with a track layout placed on them first.
+A layout for `name.csv` lives next to it in `name.tracks.csv` (see `levelformat`).
+Binary levels can carry their tracks themselves.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import multiprocessing
+import time
+from dataclasses import asdict, dataclass, fields
+from functools import partial
+from typing import TYPE_CHECKING
+
+from src.field import Field
+from src.gfx.graphics import Graphics
+from src.levelformat import (
+    LEVEL_BINARY_SUFFIX,
+    TRACK_LAYOUT_SUFFIX,
+    load_track_layout,
+    track_layout_path,
+)
+from src.simulation import engine
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from src.coordinate import Coordinate
+    from src.track.track import TrackType
+
+
+@dataclass
+class ValidationResult:
+    level_file: str
+    passed: bool
+    num_crashed: int
+    ticks: int
+    seconds: float
+    error: str = ""
+
+
+def find_level_files(directory: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in directory.iterdir()
+        if path.suffix == LEVEL_BINARY_SUFFIX
+        or (path.suffix == ".csv" and not path.name.endswith(TRACK_LAYOUT_SUFFIX))
+    )
+
+
+def apply_track_layout(
+    field: Field,
+    layout: list[tuple[Coordinate, TrackType]],
+) -> None:
+    for pos, track_type in layout:
+        if not field.insert_track_to_position(track_type, pos):
+            msg = f"No drawing cell for track at {pos}"
+            raise ValueError(msg)
+
+
+def validate_level(level_path: Path, *, event_driven: bool = True) -> ValidationResult:
+    start_time = time.perf_counter()
+    try:
+        field = Field()
+        field.initialize_grid(str(level_path))
+        layout_path = track_layout_path(level_path)
+        if layout_path.exists():
+            apply_track_layout(field, load_track_layout(layout_path))
+        result = engine.run(field, event_driven=event_driven)
+    except (OSError, ValueError, KeyError, IndexError, RuntimeError) as error:
+        return ValidationResult(
+            level_file=str(level_path),
+            passed=False,
+            num_crashed=0,
+            ticks=0,
+            seconds=time.perf_counter() - start_time,
+            error=f"{type(error).__name__}: {error}",
+        )
+    return ValidationResult(
+        level_file=str(level_path),
+        passed=result.passed,
+        num_crashed=result.num_crashed,
+        ticks=result.ticks,
+        seconds=time.perf_counter() - start_time,
+    )
+
+
+def init_worker(log_level: str) -> None:
+    logging.getLogger().setLevel(log_level)
+    Graphics.load_resources()
+
+
+def validate_levels(
+    level_paths: list[Path],
+    processes: int | None = None,
+    log_level: str = "WARNING",
+    *,
+    event_driven: bool = True,
+) -> list[ValidationResult]:
+    """Validate levels in a pool of worker processes, one per core by default."""
+    with multiprocessing.Pool(
+        processes,
+        initializer=init_worker,
+        initargs=(log_level,),
+    ) as pool:
+        return pool.map(
+            partial(validate_level, event_driven=event_driven),
+            level_paths,
+            chunksize=1,
+        )
+
+
+def find_mode_mismatches(
+    event_driven_results: list[ValidationResult],
+    tick_by_tick_results: list[ValidationResult],
+) -> list[str]:
+    """Describe every level whose event-driven run differs from its tick-by-tick run."""
+    return [
+        f"{event_driven.level_file}: event-driven {outcome(event_driven)},"
+        f" tick-by-tick {outcome(tick_by_tick)}"
+        for event_driven, tick_by_tick in zip(
+            event_driven_results,
+            tick_by_tick_results,
+            strict=True,
+        )
+        if outcome(event_driven) != outcome(tick_by_tick)
+    ]
+
+
+def outcome(result: ValidationResult) -> tuple[bool, int, int, str]:
+    return (result.passed, result.num_crashed, result.ticks, result.error)
+
+
+def write_results(results: list[ValidationResult], output_path: Path) -> None:
+    if output_path.suffix == ".json":
+        output_path.write_text(
+            json.dumps([asdict(result) for result in results], indent=2),
+            encoding="utf-8",
+        )
+        return
+    with output_path.open("w", newline="", encoding="utf-8") as output_file:
+        writer = csv.DictWriter(
+            output_file,
+            fieldnames=[field.name for field in fields(ValidationResult)],
+        )
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import threading
+from functools import partial
 from typing import ClassVar
 
 import pygame as pg
 
+from src.assets import LazyAsset
+from src.utils.tracing import Trace
+
+SOUND_PATH = "assets/sounds/"
+
+
+def load_sound(file_name: str, volume: float) -> pg.mixer.Sound:
+    Sound.init_mixer()
+    sound = pg.mixer.Sound(SOUND_PATH + file_name)
+    sound.set_volume(volume * Sound.master_volume)
+    Sound.file_names[sound] = file_name
+    return sound
+
 
 class Sound:
-    pg.mixer.pre_init(frequency=44100, size=-16, channels=3, buffer=512)
-    pg.mixer.init()
+    mixer_lock: ClassVar[threading.Lock] = threading.Lock()
+    file_names: ClassVar[dict[pg.mixer.Sound, str]] = {}
 
-    base_path = "assets/sounds/"
+    base_path = SOUND_PATH
     song_paths: ClassVar[dict[str, str]] = {
         "Song 1": base_path + "Loop.ogg",
         "Song 2": base_path + "Ludum-Dare-28-Track-7.ogg",
@@ -28,45 +43,50 @@ class Sound:
 
     music_playing = False
 
-    crash = pg.mixer.Sound("assets/sounds/Modern9.ogg")
-    crash.set_volume(0.1 * master_volume)
+    crash = LazyAsset(partial(load_sound, "Modern9.ogg", 0.1))
 
-    merge = pg.mixer.Sound("assets/sounds/merge.ogg")
-    merge.set_volume(0.03 * master_volume)
+    merge = LazyAsset(partial(load_sound, "merge.ogg", 0.03))
 
-    pop = pg.mixer.Sound("assets/sounds/pop.ogg")
-    pop.set_volume(0.1 * master_volume)
+    pop = LazyAsset(partial(load_sound, "pop.ogg", 0.1))
 
-    track_flip = pg.mixer.Sound("assets/sounds/Minimalist13_short.ogg")
-    track_flip.set_volume(0.1 * master_volume)
+    track_flip = LazyAsset(partial(load_sound, "Minimalist13_short.ogg", 0.1))
 
-    track_place = pg.mixer.Sound("assets/sounds/Minimalist13_short.ogg")
-    track_place.set_volume(0.1 * master_volume)
+    track_place = LazyAsset(partial(load_sound, "Minimalist13_short.ogg", 0.1))
 
-    success = pg.mixer.Sound("assets/sounds/achievement.ogg")
-    success.set_volume(0.1 * master_volume)
+    success = LazyAsset(partial(load_sound, "achievement.ogg", 0.1))
 
-    spark = pg.mixer.Sound("assets/sounds/pop1.ogg")
-    spark.set_volume(0.2 * master_volume)
+    spark = LazyAsset(partial(load_sound, "pop1.ogg", 0.2))
 
     current_song_name = ""
 
+    @staticmethod
+    def init_mixer() -> None:
+        """Initialize the mixer on first use, unless `pg.init()` already has."""
+        with Sound.mixer_lock:
+            if pg.mixer.get_init() is None:
+                pg.mixer.pre_init(frequency=44100, size=-16, channels=3, buffer=512)
+                pg.mixer.init()
+
     @staticmethod
     def play_sound_on_channel(sound: pg.mixer.Sound, channel: int) -> None:
+        Trace.instant(Sound.file_names.get(sound, "sound"), "sound")
         pg.mixer.Channel(channel).play(sound)
 
     @staticmethod
     def play_sound_on_any_channel(sound: pg.mixer.Sound) -> None:
+        Trace.instant(Sound.file_names.get(sound, "sound"), "sound")
         pg.mixer.find_channel(force=True).play(sound)
 
     @staticmethod
     def init_music(song_name: str) -> None:
+        Sound.init_mixer()
         pg.mixer.music.load(Sound.song_paths[song_name])
         pg.mixer.music.set_volume(0.03 * Sound.master_volume)
         Sound.current_song_name = song_name
 
     @staticmethod
     def play_music() -> None:
+        Trace.instant(Sound.current_song_name, "sound")
         pg.mixer.music.play(-1)
         Sound.music_playing = True
 
@@ -19,11 +19,13 @@ class Phase(Enum):
 @dataclass
 class GlobalStatus:
     current_tick: int = 0
+    ticks_due: int = 0
 
 
 @dataclass
 class GameplayStatus:
     in_delete_mode: bool = False
+    speed_multiplier: int = 1
     current_level_passed = False
     background_location: tuple[float, float] = (0.0, 0.0)
 
@@ -0,0 +1,51 @@
+"""Track graph."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.direction import Direction, direction_to_offset
+
+if TYPE_CHECKING:
+    from src.levelitems.cell import Cell
+    from src.track.track import Track
+
+
+@dataclass(frozen=True)
+class TrackEntry:
+    track: Track
+    endpoint: tuple[int, int]
+
+
+# Which track a train picks up when it enters a cell through one of its edges,
+# keyed by (cell coords, edge). Cells must be re-added whenever their tracks change.
+class TrackGraph:
+    def __init__(self) -> None:
+        self.entries: dict[tuple[tuple[int, int], Direction], TrackEntry] = {}
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def update_cell(self, cell: Cell) -> None:
+        coords = cell.pos.as_tuple_int()
+        for edge in direction_to_offset:
+            self.entries.pop((coords, edge), None)
+        edges = {
+            cell.rect.midright: Direction.RIGHT,
+            cell.rect.midtop: Direction.UP,
+            cell.rect.midleft: Direction.LEFT,
+            cell.rect.midbottom: Direction.DOWN,
+        }
+        # Later tracks win, the same way trains used to pick the last matching one.
+        for track in cell.cell_tracks:
+            for endpoint in track.endpoints:
+                edge = edges.get(endpoint.as_tuple_int())
+                if edge is not None:
+                    self.entries[(coords, edge)] = TrackEntry(
+                        track,
+                        endpoint.as_tuple_int(),
+                    )
+
+    def get_entry(self, coords: tuple[int, int], edge: Direction) -> TrackEntry | None:
+        return self.entries.get((coords, edge))
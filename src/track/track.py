@@ -7,7 +7,7 @@ from enum import Enum
 import pygame as pg
 
 from src.coordinate import Coordinate
-from src.direction import Direction
+from src.direction import Direction, direction_to_offset, reverse
 from src.gfx.graphics import Graphics
 
 NAVIGATION_DOWN = [(0, 1)] * 64
@@ -129,6 +129,16 @@ tracktype_to_direction = {
     TrackType.BOTTOM_RIGHT: [Direction.RIGHT, Direction.DOWN],
 }
 
+# Direction a train leaves a cell in, by track type and the direction it entered in.
+travel_to_exit_direction: dict[tuple[TrackType, Direction], Direction] = {
+    (track_type, travel_direction): next(
+        direction for direction in directions if direction != reverse(travel_direction)
+    )
+    for track_type, directions in tracktype_to_direction.items()
+    for travel_direction in direction_to_offset
+    if reverse(travel_direction) in directions
+}
+
 angle_to_direction = {
     0: [Direction.RIGHT, Direction.LEFT],
     90: [Direction.UP, Direction.DOWN],
@@ -161,13 +171,15 @@ class Track(pg.sprite.Sprite):
                 Coordinate.from_tuple(self.cell_rect.midtop),
                 Coordinate.from_tuple(self.cell_rect.midbottom),
             ]
-            self.images["bright"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_s_bright"],
+            self.images["bright"] = Graphics.get_rotated(
+                "track_s",
                 Direction.UP.value,
+                "bright",
             )
-            self.images["dark"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_s_dark"],
+            self.images["dark"] = Graphics.get_rotated(
+                "track_s",
                 Direction.UP.value,
+                "dark",
             )
             self.image = self.images["bright"]
             self.navigation = NAVIGATION_DOWN
@@ -177,13 +189,15 @@ class Track(pg.sprite.Sprite):
                 Coordinate.from_tuple(self.cell_rect.midleft),
                 Coordinate.from_tuple(self.cell_rect.midright),
             ]
-            self.images["bright"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_s_bright"],
+            self.images["bright"] = Graphics.get_rotated(
+                "track_s",
                 Direction.RIGHT.value,
+                "bright",
             )
-            self.images["dark"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_s_dark"],
+            self.images["dark"] = Graphics.get_rotated(
+                "track_s",
                 Direction.RIGHT.value,
+                "dark",
             )
             self.image = self.images["bright"]
             self.navigation = NAVIGATION_RIGHT
@@ -193,14 +207,8 @@ class Track(pg.sprite.Sprite):
                 Coordinate.from_tuple(self.cell_rect.midtop),
                 Coordinate.from_tuple(self.cell_rect.midright),
             ]
-            self.images["bright"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_c_bright"],
-                90,
-            )
-            self.images["dark"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_c_dark"],
-                90,
-            )
+            self.images["bright"] = Graphics.get_rotated("track_c", 90, "bright")
+            self.images["dark"] = Graphics.get_rotated("track_c", 90, "dark")
             self.image = self.images["bright"]
             self.navigation = NAVIGATION_DOWNRIGHT
             self.navigation_reversed = NAVIGATION_LEFTUP
@@ -209,14 +217,8 @@ class Track(pg.sprite.Sprite):
                 Coordinate.from_tuple(self.cell_rect.midtop),
                 Coordinate.from_tuple(self.cell_rect.midleft),
             ]
-            self.images["bright"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_c_bright"],
-                180,
-            )
-            self.images["dark"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_c_dark"],
-                180,
-            )
+            self.images["bright"] = Graphics.get_rotated("track_c", 180, "bright")
+            self.images["dark"] = Graphics.get_rotated("track_c", 180, "dark")
             self.image = self.images["bright"]
             self.navigation = NAVIGATION_RIGHTUP
             self.navigation_reversed = NAVIGATION_DOWNLEFT
@@ -225,14 +227,8 @@ class Track(pg.sprite.Sprite):
                 Coordinate.from_tuple(self.cell_rect.midleft),
                 Coordinate.from_tuple(self.cell_rect.midbottom),
             ]
-            self.images["bright"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_c_bright"],
-                270,
-            )
-            self.images["dark"] = pg.transform.rotate(
-                Graphics.img_surfaces["track_c_dark"],
-                270,
-            )
+            self.images["bright"] = Graphics.get_rotated("track_c", 270, "bright")
+            self.images["dark"] = Graphics.get_rotated("track_c", 270, "dark")
             self.image = self.images["bright"]
             self.navigation = NAVIGATION_RIGHTDOWN
             self.navigation_reversed = NAVIGATION_UPLEFT
@@ -241,8 +237,8 @@ class Track(pg.sprite.Sprite):
                 Coordinate.from_tuple(self.cell_rect.midbottom),
                 Coordinate.from_tuple(self.cell_rect.midright),
             ]
-            self.images["bright"] = Graphics.img_surfaces["track_c_bright"]
-            self.images["dark"] = Graphics.img_surfaces["track_c_dark"]
+            self.images["bright"] = Graphics.get_rotated("track_c", 0, "bright")
+            self.images["dark"] = Graphics.get_rotated("track_c", 0, "dark")
             self.image = self.images["bright"]
             self.navigation = NAVIGATION_UPRIGHT
             self.navigation_reversed = NAVIGATION_LEFTDOWN
@@ -6,13 +6,11 @@ import pygame as pg
 
 from src.config import Config
 from src.coordinate import Coordinate
-from src.direction import Direction
+from src.direction import Direction, direction_to_offset
 from src.gfx.graphics import Graphics
 from src.levelitems.drawable import Cell, Drawable
-from src.sound import Sound
-from src.track.track import Track, TrackType
+from src.track.track import Track, TrackType, travel_to_exit_direction
 from src.traincolor import TrainColor
-from src.utils.utils import rot_center
 
 
 class Train(pg.sprite.Sprite):
@@ -62,94 +60,18 @@ class Train(pg.sprite.Sprite):
         if self.selected_track is None:
             msg = "Selected track is None."
             raise ValueError(msg)
-        if self.direction == Direction.UP:
-            if self.selected_track.track_type == TrackType.VERT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x,
-                    self.selected_track.pos.y - 1,
-                )
-                self.next_cell_direction = Direction.UP
-            elif self.selected_track.track_type == TrackType.BOTTOM_LEFT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x - 1,
-                    self.selected_track.pos.y,
-                )
-                self.next_cell_direction = Direction.LEFT
-            elif self.selected_track.track_type == TrackType.BOTTOM_RIGHT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x + 1,
-                    self.selected_track.pos.y,
-                )
-                self.next_cell_direction = Direction.RIGHT
-            else:
-                msg = "Bad tracktype and/or direction."
-                raise ValueError(msg)
-        elif self.direction == Direction.DOWN:
-            if self.selected_track.track_type == TrackType.VERT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x,
-                    self.selected_track.pos.y + 1,
-                )
-                self.next_cell_direction = Direction.DOWN
-            elif self.selected_track.track_type == TrackType.TOP_LEFT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x - 1,
-                    self.selected_track.pos.y,
-                )
-                self.next_cell_direction = Direction.LEFT
-            elif self.selected_track.track_type == TrackType.TOP_RIGHT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x + 1,
-                    self.selected_track.pos.y,
-                )
-                self.next_cell_direction = Direction.RIGHT
-            else:
-                msg = "Bad tracktype and/or direction."
-                raise ValueError(msg)
-        elif self.direction == Direction.RIGHT:
-            if self.selected_track.track_type == TrackType.HORI:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x + 1,
-                    self.selected_track.pos.y,
-                )
-                self.next_cell_direction = Direction.RIGHT
-            elif self.selected_track.track_type == TrackType.TOP_LEFT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x,
-                    self.selected_track.pos.y - 1,
-                )
-                self.next_cell_direction = Direction.UP
-            elif self.selected_track.track_type == TrackType.BOTTOM_LEFT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x,
-                    self.selected_track.pos.y + 1,
-                )
-                self.next_cell_direction = Direction.DOWN
-            else:
-                msg = "Bad tracktype and/or direction."
-                raise ValueError(msg)
-        elif self.direction == Direction.LEFT:
-            if self.selected_track.track_type == TrackType.HORI:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x - 1,
-                    self.selected_track.pos.y,
-                )
-                self.next_cell_direction = Direction.LEFT
-            elif self.selected_track.track_type == TrackType.TOP_RIGHT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x,
-                    self.selected_track.pos.y - 1,
-                )
-                self.next_cell_direction = Direction.UP
-            elif self.selected_track.track_type == TrackType.BOTTOM_RIGHT:
-                self.next_cell_coords = (
-                    self.selected_track.pos.x,
-                    self.selected_track.pos.y + 1,
-                )
-                self.next_cell_direction = Direction.DOWN
-            else:
-                msg = "Bad tracktype and/or direction."
-                raise ValueError(msg)
+        exit_direction = travel_to_exit_direction.get(
+            (self.selected_track.track_type, self.direction),
+        )
+        if exit_direction is None:
+            msg = "Bad tracktype and/or direction."
+            raise ValueError(msg)
+        offset = direction_to_offset[exit_direction]
+        self.next_cell_coords = (
+            self.selected_track.pos.x + offset[0],
+            self.selected_track.pos.y + offset[1],
+        )
+        self.next_cell_direction = exit_direction
 
     def reset(self) -> None:
         self.rect.x = self.original_pos[0]
@@ -167,9 +89,10 @@ class Train(pg.sprite.Sprite):
         self.image = Graphics.img_surfaces[self.color.value]
         self.original_image = self.image
 
-    def move(self) -> None:
-        self.image = rot_center(self.original_image, self.angle)
+    def update_image(self) -> None:
+        self.image = Graphics.get_train_image(self.color.value, self.angle)
 
+    def move(self) -> None:
         num_navigation_indices = 64
 
         if self.crashed:
@@ -410,7 +333,6 @@ class Train(pg.sprite.Sprite):
     def crash(self) -> None:
         self.selected_track = None
         self.crashed = True
-        Sound.play_sound_on_any_channel(Sound.crash)
 
     def add_last_collided_cell(self, drawble: Cell) -> None:
         self.last_collided_cells.append(drawble)
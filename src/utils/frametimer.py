@@ -0,0 +1,134 @@
+"""Frame timer.
+
+Every system a frame runs, the logic steps of `execute_logic` and the draw passes of
+`draw_game_objects`, is timed each time it runs by wrapping it in `timed_system`. When
+the frame ends the times are stored in a ring of the last `Config.FRAME_STATS_WINDOW`
+frames, from which `FrameTimer.stats()` computes rolling statistics per system. Timing
+a system costs two `perf_counter_ns()` calls, so it stays on all the time. While
+tracing is enabled every timed call is also recorded as a trace event.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from functools import wraps
+from typing import TYPE_CHECKING, ClassVar, ParamSpec, TypeVar
+
+import numpy as np
+
+from src.config import Config
+from src.utils.tracing import Trace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+FRAME = "frame"
+
+
+class SystemKind(Enum):
+    FRAME = "frame"
+    LOGIC = "logic"
+    DRAW = "draw"
+
+
+@dataclass(frozen=True)
+class SystemStats:
+    name: str
+    kind: SystemKind
+    last_ms: float
+    min_ms: float
+    mean_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class FrameTimer:
+    window: ClassVar[int] = Config.FRAME_STATS_WINDOW
+    kinds: ClassVar[dict[str, SystemKind]] = {FRAME: SystemKind.FRAME}
+    history: ClassVar[dict[str, np.ndarray]] = {FRAME: np.zeros(window)}
+    current_ns: ClassVar[dict[str, int]] = {}
+    frame_start_ns: ClassVar[int] = time.perf_counter_ns()
+    num_frames: ClassVar[int] = 0
+
+    @staticmethod
+    def register(name: str, kind: SystemKind) -> None:
+        FrameTimer.kinds[name] = kind
+        FrameTimer.history.setdefault(name, np.zeros(FrameTimer.window))
+
+    @staticmethod
+    def add(name: str, start_ns: int, end_ns: int) -> None:
+        FrameTimer.current_ns[name] = (
+            FrameTimer.current_ns.get(name, 0) + end_ns - start_ns
+        )
+        if Trace.enabled:
+            Trace.complete(name, FrameTimer.kinds[name].value, start_ns, end_ns)
+
+    @staticmethod
+    def start_frame() -> None:
+        FrameTimer.frame_start_ns = time.perf_counter_ns()
+
+    @staticmethod
+    def end_frame() -> None:
+        """Store the times of the frame that started at the last `start_frame()`."""
+        FrameTimer.add(FRAME, FrameTimer.frame_start_ns, time.perf_counter_ns())
+        slot = FrameTimer.num_frames % FrameTimer.window
+        for name, ring in FrameTimer.history.items():
+            ring[slot] = FrameTimer.current_ns.get(name, 0) / 1_000_000
+        FrameTimer.current_ns.clear()
+        FrameTimer.num_frames += 1
+
+    @staticmethod
+    def last_frame() -> dict[str, float]:
+        """Return how many milliseconds each system took in the last frame."""
+        if FrameTimer.num_frames == 0:
+            return {}
+        slot = (FrameTimer.num_frames - 1) % FrameTimer.window
+        return {name: float(ring[slot]) for name, ring in FrameTimer.history.items()}
+
+    @staticmethod
+    def stats() -> list[SystemStats]:
+        """Return the statistics of each system over the frames in the window."""
+        num_samples = min(FrameTimer.num_frames, FrameTimer.window)
+        if num_samples == 0:
+            return []
+        last_slot = (FrameTimer.num_frames - 1) % FrameTimer.window
+        all_stats: list[SystemStats] = []
+        for name, ring in FrameTimer.history.items():
+            samples = ring[:num_samples]
+            p95, p99 = np.percentile(samples, (95, 99))
+            all_stats.append(
+                SystemStats(
+                    name=name,
+                    kind=FrameTimer.kinds[name],
+                    last_ms=float(ring[last_slot]),
+                    min_ms=float(samples.min()),
+                    mean_ms=float(samples.mean()),
+                    p95_ms=float(p95),
+                    p99_ms=float(p99),
+                ),
+            )
+        return all_stats
+
+
+def timed_system(kind: SystemKind) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Time every call of the decorated function as the system of the same name."""
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        name = function.__name__
+        FrameTimer.register(name, kind)
+
+        @wraps(function)
+        def timed_function(*args: P.args, **kwargs: P.kwargs) -> R:
+            start_ns = time.perf_counter_ns()
+            result = function(*args, **kwargs)
+            FrameTimer.add(name, start_ns, time.perf_counter_ns())
+            return result
+
+        return timed_function
+
+    return decorate
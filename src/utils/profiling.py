@@ -1,17 +1,217 @@
 """Profiling."""
 
+from __future__ import annotations
+
 import cProfile
+import csv
+import gc
 import os
 import pstats
+import sys
+import threading
 import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import psutil
 
+from src.config import Config
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+PROFILE_DIR = Path("tmp")
+SAMPLING_SWITCH_INTERVAL_S = 0.0001
+
+
+class ProfilerMode(Enum):
+    CPROFILE = "cprofile"
+    SAMPLING = "sampling"
+    MEMORY = "memory"
+
+
+class SamplingProfiler:
+    # Samples the stack of the thread that started it from a background thread, so the
+    # profiled code runs at full speed between samples. Stacks are counted as tuples
+    # of code objects and only turned into names when written out.
+    #
+    # The sampler needs the GIL to read the stack. With the default switch interval the
+    # profiled thread keeps the GIL for up to 5 ms and the samples pile up wherever it
+    # releases it, e.g. in `pg.display.update()`, so the interval is shortened while
+    # sampling.
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = interval_s
+        self.default_switch_interval = sys.getswitchinterval()
+        self.counts: Counter[tuple[CodeType, ...]] = Counter()
+        self.num_samples = 0
+        self.stop_event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.counts.clear()
+        self.num_samples = 0
+        self.stop_event.clear()
+        self.default_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(SAMPLING_SWITCH_INTERVAL_S)
+        self.thread = threading.Thread(
+            target=self.sample,
+            args=(threading.get_ident(),),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        sys.setswitchinterval(self.default_switch_interval)
+
+    def sample(self, thread_id: int) -> None:
+        while not self.stop_event.wait(self.interval_s):
+            frame = sys._current_frames().get(thread_id)  # noqa: SLF001
+            stack: list[CodeType] = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            self.counts[tuple(reversed(stack))] += 1
+            self.num_samples += 1
+
+    def write_collapsed(self, collapsed_path: Path) -> None:
+        """Write the samples as collapsed stacks, one `root;...;leaf count` per line.
+
+        flamegraph.pl and speedscope both open this format.
+        """
+        collapsed_path.parent.mkdir(parents=True, exist_ok=True)
+        with collapsed_path.open("w", encoding="utf-8") as collapsed_file:
+            for stack, count in self.counts.most_common():
+                collapsed_file.write(
+                    ";".join(code_name(code) for code in stack) + f" {count}\n",
+                )
+
+    def top_functions(self, num_functions: int) -> list[tuple[str, int]]:
+        """Return the functions most often on top of the stack with their counts."""
+        self_counts: Counter[str] = Counter()
+        for stack, count in self.counts.items():
+            self_counts[code_name(stack[-1])] += count
+        return self_counts.most_common(num_functions)
+
+
+def code_name(code: CodeType) -> str:
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+@dataclass
+class FrameAllocations:
+    frame: int
+    blocks: int
+    bytes: int
+    peak_bytes: int
+    gc_collections: int
+
+
+class MemoryProfiler:
+    # Traces allocations with tracemalloc and takes a snapshot at every frame and level
+    # boundary. Comparing a snapshot to the previous one gives the blocks and bytes a
+    # frame or level left allocated. Garbage that is freed within the frame cancels
+    # out of that, so the traced peak above the frame's starting point is recorded as
+    # well.
+    def __init__(self, num_traceback_frames: int) -> None:
+        self.num_traceback_frames = num_traceback_frames
+        self.frames: list[FrameAllocations] = []
+        self.level_diffs: list[tuple[str, list[tracemalloc.StatisticDiff]]] = []
+        self.start_snapshot: tracemalloc.Snapshot | None = None
+        self.frame_snapshot: tracemalloc.Snapshot | None = None
+        self.level_snapshot: tracemalloc.Snapshot | None = None
+        self.frame_start_bytes = 0
+        self.gc_collections = 0
+
+    def start(self) -> None:
+        self.frames.clear()
+        self.level_diffs.clear()
+        tracemalloc.start(self.num_traceback_frames)
+        self.start_snapshot = self.take_snapshot()
+        self.frame_snapshot = self.start_snapshot
+        self.level_snapshot = self.start_snapshot
+        self.start_frame()
+
+    def stop(self) -> tracemalloc.Snapshot:
+        snapshot = self.take_snapshot()
+        tracemalloc.stop()
+        self.frame_snapshot = None
+        self.level_snapshot = None
+        return snapshot
+
+    def start_frame(self) -> None:
+        tracemalloc.reset_peak()
+        self.frame_start_bytes = tracemalloc.get_traced_memory()[0]
+        self.gc_collections = count_gc_collections()
+
+    def end_frame(self) -> None:
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        gc_collections = count_gc_collections() - self.gc_collections
+        snapshot = self.take_snapshot()
+        diffs = snapshot.compare_to(self.frame_snapshot, "lineno")
+        self.frames.append(
+            FrameAllocations(
+                frame=len(self.frames),
+                blocks=sum(diff.count_diff for diff in diffs),
+                bytes=sum(diff.size_diff for diff in diffs),
+                peak_bytes=peak_bytes - self.frame_start_bytes,
+                gc_collections=gc_collections,
+            ),
+        )
+        self.frame_snapshot = snapshot
+        self.start_frame()
+
+    def end_level(self, label: str) -> None:
+        snapshot = self.take_snapshot()
+        self.level_diffs.append(
+            (label, snapshot.compare_to(self.level_snapshot, "lineno")),
+        )
+        self.level_snapshot = snapshot
+
+    @staticmethod
+    def take_snapshot() -> tracemalloc.Snapshot:
+        # Leave out the snapshots themselves and this module's bookkeeping.
+        return tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(
+                    inclusive=False,
+                    filename_pattern=tracemalloc.__file__,
+                ),
+                tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+            ],
+        )
+
+    def write_frames(self, csv_path: Path) -> None:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        with csv_path.open("w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(
+                csv_file,
+                fieldnames=[field.name for field in fields(FrameAllocations)],
+            )
+            writer.writeheader()
+            for frame in self.frames:
+                writer.writerow(asdict(frame))
+
+
+def count_gc_collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
 
 class Profiler:
-    def __init__(self) -> None:
+    def __init__(self, mode: ProfilerMode | None = None) -> None:
+        self.mode = mode or ProfilerMode(Config.PROFILER_MODE)
         self.is_running = False
         self.profile = cProfile.Profile(builtins=False)
+        self.sampler = SamplingProfiler(Config.SAMPLING_INTERVAL_MS / 1000)
+        self.memory_profiler = MemoryProfiler(Config.TRACEMALLOC_FRAMES)
         self.start_time = 0
         self.end_time = 0
         self.ticks = 0
@@ -24,6 +224,14 @@ class Profiler:
         print("INFO\tstopped profiling!")
         self.end_time = time.time()
         print(f"Total profiling time: {(self.end_time - self.start_time):.2f} seconds")
+        if self.mode == ProfilerMode.SAMPLING:
+            self.discontinue_sampling()
+            self.is_running = False
+            return
+        if self.mode == ProfilerMode.MEMORY:
+            self.discontinue_memory_profiling()
+            self.is_running = False
+            return
         self.profile.disable()
         sort_by = "tottime"
         stats = pstats.Stats(self.profile)
@@ -38,14 +246,66 @@ class Profiler:
     def continue_profiling(self) -> None:
         if self.is_running:
             self.ticks += 1
+            if self.mode == ProfilerMode.MEMORY:
+                self.memory_profiler.end_frame()
             return
         print("INFO\tstarted profiling...")
         self.ticks = 0
         self.start_time = time.time()
-        self.profile.clear()  # type: ignore
-        self.profile.enable()
+        if self.mode == ProfilerMode.SAMPLING:
+            self.sampler.start()
+        elif self.mode == ProfilerMode.MEMORY:
+            self.memory_profiler.start()
+        else:
+            self.profile.clear()  # type: ignore
+            self.profile.enable()
         self.is_running = True
 
+    def discontinue_sampling(self) -> None:
+        self.sampler.stop()
+        self.print_psutils()
+        collapsed_path = PROFILE_DIR / time.strftime("profile_%Y%m%d_%H%M%S.collapsed")
+        self.sampler.write_collapsed(collapsed_path)
+        print(
+            f"{self.sampler.num_samples} samples over {self.ticks} frames"
+            f" written to {collapsed_path}\n"
+            f"Most sampled functions:",
+        )
+        for name, count in self.sampler.top_functions(35):
+            print(f"{count:8d}  {100 * count / self.sampler.num_samples:5.1f}%  {name}")
+
+    def level_loaded(self, level: int) -> None:
+        if self.is_running and self.mode == ProfilerMode.MEMORY:
+            self.memory_profiler.end_level(f"Up to level {level}")
+
+    def discontinue_memory_profiling(self) -> None:
+        memory_profiler = self.memory_profiler
+        snapshot = memory_profiler.stop()
+        self.print_psutils()
+        csv_path = PROFILE_DIR / time.strftime("memory_%Y%m%d_%H%M%S.csv")
+        memory_profiler.write_frames(csv_path)
+        frames = memory_profiler.frames
+        if frames:
+            print(
+                f"{len(frames)} frames written to {csv_path}\n"
+                f"Per frame:          mean      max\n"
+                f"  blocks left  {mean_of(frames, 'blocks'):9.1f}"
+                f" {max(frame.blocks for frame in frames):8d}\n"
+                f"  bytes left   {mean_of(frames, 'bytes'):9.1f}"
+                f" {max(frame.bytes for frame in frames):8d}\n"
+                f"  peak bytes   {mean_of(frames, 'peak_bytes'):9.1f}"
+                f" {max(frame.peak_bytes for frame in frames):8d}\n"
+                f"  collections  {mean_of(frames, 'gc_collections'):9.3f}"
+                f" {max(frame.gc_collections for frame in frames):8d}\n",
+            )
+        print("Top allocation sites since profiling started:")
+        for diff in snapshot.compare_to(memory_profiler.start_snapshot, "lineno")[:20]:
+            print(f"  {diff}")
+        for label, diffs in memory_profiler.level_diffs:
+            print(f"{label}:")
+            for diff in diffs[:10]:
+                print(f"  {diff}")
+
     def print_psutils(self) -> None:
         print(
             f"Process:\n"
@@ -58,3 +318,7 @@ class Profiler:
             f"Profiler info:\n"
             f"=========================\n",
         )
+
+
+def mean_of(frames: list[FrameAllocations], field_name: str) -> float:
+    return sum(getattr(frame, field_name) for frame in frames) / len(frames)
@@ -0,0 +1,182 @@
+"""Startup timing."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from importlib.abc import Loader, MetaPathFinder
+from typing import TYPE_CHECKING, ClassVar
+
+from src.assets import Assets
+from src.config import Config
+from src.utils.utils import setup_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from importlib.machinery import ModuleSpec
+    from pathlib import Path
+    from types import ModuleType
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+STARTUP_TIME = time.perf_counter()
+
+
+@dataclass
+class ModuleImport:
+    module: str
+    depth: int
+    self_ms: float
+    total_ms: float
+
+
+class TimedLoader(Loader):
+    # Wraps the loader of one module to time its execution, which is where an import
+    # spends its time. Everything else is passed on to the wrapped loader.
+    def __init__(self, loader: Loader, import_timer: ImportTimer) -> None:
+        self.loader = loader
+        self.import_timer = import_timer
+
+    def __getattr__(self, name: str) -> object:
+        """Look up anything not overridden here on the wrapped loader."""
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self.import_timer.exec_module(self.loader, module)
+
+
+class ImportTimer(MetaPathFinder):
+    # Times every module imported while it is first on `sys.meta_path`, like
+    # `python -X importtime` does, but collected so it can be written to a file. A
+    # module's self time leaves out the modules it imported in turn.
+    def __init__(self) -> None:
+        self.imports: list[ModuleImport] = []
+        self.child_ms: list[float] = []
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if isinstance(spec.loader, Loader) and hasattr(spec.loader, "exec_module"):
+            spec.loader = TimedLoader(spec.loader, self)
+        return spec
+
+    def exec_module(self, loader: Loader, module: ModuleType) -> None:
+        import_record = ModuleImport(
+            module=module.__name__,
+            depth=len(self.child_ms),
+            self_ms=0.0,
+            total_ms=0.0,
+        )
+        self.imports.append(import_record)
+        self.child_ms.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            total_ms = (time.perf_counter() - start_time) * 1000
+            import_record.total_ms = total_ms
+            import_record.self_ms = total_ms - self.child_ms.pop()
+            if self.child_ms:
+                self.child_ms[-1] += total_ms
+
+
+class StartupTimer:
+    marks: ClassVar[list[tuple[str, float]]] = []
+    import_timer: ClassVar[ImportTimer | None] = None
+    trace_path: ClassVar[Path | None] = None
+
+    @staticmethod
+    def mark(label: str) -> None:
+        StartupTimer.marks.append((label, time.perf_counter()))
+
+    @staticmethod
+    def start_trace(trace_path: Path) -> None:
+        """Time each module imported from now on, for `finish()` to write out."""
+        StartupTimer.trace_path = trace_path
+        StartupTimer.import_timer = ImportTimer()
+        StartupTimer.import_timer.install()
+
+    @staticmethod
+    def finish() -> None:
+        logger.info(StartupTimer.report())
+        if StartupTimer.import_timer is not None:
+            StartupTimer.import_timer.uninstall()
+        if StartupTimer.trace_path is not None:
+            StartupTimer.write_trace(StartupTimer.trace_path)
+            logger.info(f"Wrote startup trace to '{StartupTimer.trace_path}'")
+
+    @staticmethod
+    def report() -> str:
+        """Describe how long each startup step took.
+
+        Times are counted from when this module was first imported, which `main.py`
+        does right after importing pygame.
+        """
+        previous = STARTUP_TIME
+        lines = ["Startup:"]
+        for label, timestamp in StartupTimer.marks:
+            lines.append(
+                f"  {label:<24} +{(timestamp - previous) * 1000:7.1f} ms"
+                f"  (at {(timestamp - STARTUP_TIME) * 1000:7.1f} ms)",
+            )
+            previous = timestamp
+        lines.append("  Assets loaded so far:")
+        lines.extend(
+            f"    {load.name:<32} {load.seconds * 1000:7.1f} ms  [{load.thread}]"
+            for load in list(Assets.loads)
+        )
+        return "\n".join(lines)
+
+    @staticmethod
+    def write_trace(trace_path: Path) -> None:
+        phases: list[dict[str, object]] = []
+        previous = STARTUP_TIME
+        for label, timestamp in StartupTimer.marks:
+            phases.append(
+                {
+                    "phase": label,
+                    "ms": (timestamp - previous) * 1000,
+                    "at_ms": (timestamp - STARTUP_TIME) * 1000,
+                },
+            )
+            previous = timestamp
+        imports = (
+            []
+            if StartupTimer.import_timer is None
+            else StartupTimer.import_timer.imports
+        )
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_path.write_text(
+            json.dumps(
+                {
+                    "phases": phases,
+                    "imports": [asdict(module_import) for module_import in imports],
+                    "assets": [asdict(load) for load in list(Assets.loads)],
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
@@ -0,0 +1,186 @@
+"""Tracing.
+
+Records a timeline of frames, logic systems, draw passes, level loads, asset loads,
+sound triggers and garbage collections, and writes it as Chrome Trace Event JSON that
+Perfetto (ui.perfetto.dev) and chrome://tracing open. Events go into a ring buffer of
+the last `Config.TRACE_BUFFER_SIZE` events as plain tuples, so recording one costs
+about an append and tracing can stay on for a whole session.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, ParamSpec, TypeVar
+
+from src.config import Config
+from src.utils.utils import setup_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Phases of the Trace Event format.
+COMPLETE = "X"
+INSTANT = "i"
+
+# Phase, name, category, start ns, duration ns, thread id and args.
+TraceEvent = tuple[str, str, str, int, int, int, dict[str, object] | None]
+
+
+class Trace:
+    enabled: ClassVar[bool] = False
+    trace_path: ClassVar[Path] = Path(Config.TRACE_PATH)
+    events: ClassVar[deque[TraceEvent]] = deque(maxlen=Config.TRACE_BUFFER_SIZE)
+    thread_names: ClassVar[dict[int, str]] = {}
+    gc_start_ns: ClassVar[int] = 0
+
+    @staticmethod
+    def enable(trace_path: Path | None = None) -> None:
+        Trace.enabled = True
+        if trace_path is not None:
+            Trace.trace_path = trace_path
+        if Trace.trace_gc not in gc.callbacks:
+            gc.callbacks.append(Trace.trace_gc)
+
+    @staticmethod
+    def complete(
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, object] | None = None,
+    ) -> None:
+        Trace.events.append(
+            (
+                COMPLETE,
+                name,
+                category,
+                start_ns,
+                end_ns - start_ns,
+                threading.get_ident(),
+                args,
+            ),
+        )
+
+    @staticmethod
+    def instant(
+        name: str,
+        category: str,
+        args: dict[str, object] | None = None,
+    ) -> None:
+        if Trace.enabled:
+            Trace.events.append(
+                (
+                    INSTANT,
+                    name,
+                    category,
+                    time.perf_counter_ns(),
+                    0,
+                    threading.get_ident(),
+                    args,
+                ),
+            )
+
+    @staticmethod
+    @contextmanager
+    def span(
+        name: str,
+        category: str,
+        args: dict[str, object] | None = None,
+    ) -> Iterator[None]:
+        """Record the `with` block as one event, named after its thread too."""
+        if not Trace.enabled:
+            yield
+            return
+        thread = threading.current_thread()
+        Trace.thread_names[thread.ident or 0] = thread.name
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            Trace.complete(name, category, start_ns, time.perf_counter_ns(), args)
+
+    @staticmethod
+    def trace_gc(phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            Trace.gc_start_ns = time.perf_counter_ns()
+        elif Trace.enabled:
+            Trace.complete(
+                f"gc gen {info['generation']}",
+                "gc",
+                Trace.gc_start_ns,
+                time.perf_counter_ns(),
+                {"collected": info["collected"]},
+            )
+
+    @staticmethod
+    def write(trace_path: Path | None = None) -> None:
+        """Write the buffered events as Trace Event JSON, oldest first."""
+        trace_path = trace_path or Trace.trace_path
+        events = list(Trace.events)
+        thread_names = dict(Trace.thread_names)
+        thread_names.update(
+            (thread.ident, thread.name)
+            for thread in threading.enumerate()
+            if thread.ident is not None
+        )
+        pid = os.getpid()
+        first_ns = min((event[3] for event in events), default=0)
+        trace_events: list[dict[str, object]] = [
+            {
+                "ph": "M",
+                "name": "thread_name",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for tid, thread_name in thread_names.items()
+        ]
+        for phase, name, category, start_ns, duration_ns, tid, args in events:
+            trace_event: dict[str, object] = {
+                "ph": phase,
+                "name": name,
+                "cat": category,
+                "ts": (start_ns - first_ns) / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if phase == COMPLETE:
+                trace_event["dur"] = duration_ns / 1000
+            else:
+                trace_event["s"] = "t"
+            if args:
+                trace_event["args"] = args
+            trace_events.append(trace_event)
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_path.write_text(
+            json.dumps({"traceEvents": trace_events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+        logger.info(f"Wrote {len(events)} trace events to '{trace_path}'")
+
+
+def traced(category: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Record every call of the decorated function while tracing is enabled."""
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        @wraps(function)
+        def traced_function(*args: P.args, **kwargs: P.kwargs) -> R:
+            with Trace.span(function.__qualname__, category):
+                return function(*args, **kwargs)
+
+        return traced_function
+
+    return decorate
@@ -0,0 +1,115 @@
+"""Frame watchdog.
+
+Compares the work time of every frame, as measured by `FrameTimer`, with
+`Config.FRAME_BUDGET_MS`. A frame over budget is written as one JSON line to a rotating
+log at `Config.SLOW_FRAME_LOG`, together with what is needed to tell why: the time of
+each system in that frame, the garbage collections that ran during it, the train and
+spark counts and the current level and tick.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
+
+from src.config import Config
+from src.utils.frametimer import FRAME, FrameTimer
+from src.utils.utils import setup_logging
+
+if TYPE_CHECKING:
+    from src.field import Field
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+SLOW_FRAME_LOG_BYTES = 1_000_000
+SLOW_FRAME_LOG_BACKUPS = 3
+
+
+class FrameWatchdog:
+    budget_ms: ClassVar[float] = Config.FRAME_BUDGET_MS
+    slow_frame_logger: ClassVar[logging.Logger | None] = None
+    gc_runs: ClassVar[list[dict[str, float]]] = []
+    gc_start_ns: ClassVar[int] = 0
+    num_slow_frames: ClassVar[int] = 0
+
+    @staticmethod
+    def start(log_path: Path = Path(Config.SLOW_FRAME_LOG)) -> None:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(
+            log_path,
+            maxBytes=SLOW_FRAME_LOG_BYTES,
+            backupCount=SLOW_FRAME_LOG_BACKUPS,
+            encoding="utf-8",
+        )
+        slow_frame_logger = logging.getLogger("slow_frames")
+        slow_frame_logger.handlers = [handler]
+        slow_frame_logger.setLevel(logging.INFO)
+        # Keep the records out of the console; they are summarized there instead.
+        slow_frame_logger.propagate = False
+        FrameWatchdog.slow_frame_logger = slow_frame_logger
+        if FrameWatchdog.track_gc not in gc.callbacks:
+            gc.callbacks.append(FrameWatchdog.track_gc)
+
+    @staticmethod
+    def track_gc(phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            FrameWatchdog.gc_start_ns = time.perf_counter_ns()
+        else:
+            FrameWatchdog.gc_runs.append(
+                {
+                    "generation": info["generation"],
+                    "ms": (time.perf_counter_ns() - FrameWatchdog.gc_start_ns)
+                    / 1_000_000,
+                    "collected": info["collected"],
+                },
+            )
+
+    @staticmethod
+    def check_frame(field: Field, tick: int, interval_ms: float) -> None:
+        """Log the frame `FrameTimer` just ended if it went over budget."""
+        frame_times = FrameTimer.last_frame()
+        frame_ms = frame_times.get(FRAME, 0.0)
+        gc_runs = FrameWatchdog.gc_runs
+        FrameWatchdog.gc_runs = []
+        if (
+            frame_ms <= FrameWatchdog.budget_ms
+            or FrameWatchdog.slow_frame_logger is None
+        ):
+            return
+        system_times = sorted(
+            (
+                (name, round(ms, 3))
+                for name, ms in frame_times.items()
+                if name != FRAME and ms > 0
+            ),
+            key=lambda system_time: system_time[1],
+            reverse=True,
+        )
+        FrameWatchdog.num_slow_frames += 1
+        FrameWatchdog.slow_frame_logger.info(
+            json.dumps(
+                {
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "frame_ms": round(frame_ms, 3),
+                    "budget_ms": FrameWatchdog.budget_ms,
+                    "interval_ms": interval_ms,
+                    "level": field.level,
+                    "tick": tick,
+                    "level_tick": field.current_tick,
+                    "trains": len(field.grid.trains.items),
+                    "sparks": len(field.sparks),
+                    "gc": gc_runs,
+                    "systems": dict(system_times),
+                },
+            ),
+        )
+        slowest = system_times[0][0] if system_times else "nothing"
+        logger.warning(
+            f"Frame took {frame_ms:.1f} ms of {FrameWatchdog.budget_ms} ms,"
+            f" mostly {slowest}",
+        )
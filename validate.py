@@ -0,0 +1,73 @@
+"""Batch level validator."""
+
+import argparse
+import sys
+from pathlib import Path
+
+from src.config import Config
+from src.simulation.validation import (
+    find_level_files,
+    find_mode_mismatches,
+    validate_levels,
+    write_results,
+)
+from src.utils.utils import setup_logging
+
+logger = setup_logging(log_level=Config.LOG_LEVEL)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Simulate every level in a directory and report the results.",
+    )
+    parser.add_argument("directory", type=Path, help="Directory of level .csv files.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("tmp/validation.json"),
+        help="Where to write the results, as JSON if it ends in .json, else CSV.",
+    )
+    parser.add_argument(
+        "-j",
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to one per core.",
+    )
+    parser.add_argument(
+        "--compare-modes",
+        action="store_true",
+        help="Also run every level tick by tick and fail if the results differ.",
+    )
+    args = parser.parse_args()
+
+    level_paths = find_level_files(args.directory)
+    if not level_paths:
+        logger.error(f"No level files found in '{args.directory}'")
+        return 1
+    results = validate_levels(level_paths, args.processes)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    write_results(results, args.output)
+
+    if args.compare_modes:
+        mismatches = find_mode_mismatches(
+            results,
+            validate_levels(level_paths, args.processes, event_driven=False),
+        )
+        for mismatch in mismatches:
+            logger.error(f"Simulation modes differ for {mismatch}")
+        if mismatches:
+            return 1
+        logger.info("Event-driven and tick-by-tick runs gave the same results.")
+
+    num_passed = sum(result.passed for result in results)
+    logger.info(
+        f"{num_passed}/{len(results)} levels passed. Results written to"
+        f" '{args.output}'",
+    )
+    return 0 if num_passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())